@@ -7,7 +7,12 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from src.config import get_settings
+from src.state.pg_pool import close_pool
+from src.state.supabase import close_client, flush_agent_run_updates
+from src.telemetry.usage_tracker import aclose_tracker
+from src.tools.definitions import register_all_tools
 from src.utils import setup_logging, get_logger
+from src.workflow.node_handlers import aclose_model_clients
 
 from .routes import agents, chat, health, webhooks, prd, workflows, rag, analytics, agent_dashboard, task_queue, contractors, search, documents, workflow_builder, discovery
 from .middleware.auth import AuthMiddleware
@@ -22,8 +27,17 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     """Application lifespan context manager."""
     setup_logging(debug=settings.debug)
     logger.info("Starting application", environment=settings.environment)
+    register_all_tools()
     yield
     logger.info("Shutting down application")
+    await aclose_model_clients()
+    await rag.aclose_pipeline()
+    await aclose_tracker()
+    try:
+        await flush_agent_run_updates()
+    finally:
+        await close_pool()
+        close_client()
 
 
 app = FastAPI(
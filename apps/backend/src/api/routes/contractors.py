@@ -87,41 +87,17 @@ async def list_contractors(
     offset = (page - 1) * page_size
     response = query.range(offset, offset + page_size - 1).execute()
 
-    # Convert database records to Pydantic models
+    # Rows were validated on write; build models without re-validating
     contractors = []
     for record in response.data:
-        # Parse availability slots
-        slots = []
-        for slot_record in record.get("availability_slots", []):
-            slots.append(AvailabilitySlot(
-                id=slot_record["id"],
-                date=slot_record["date"],
-                start_time=slot_record["start_time"],
-                end_time=slot_record["end_time"],
-                location=Location(
-                    suburb=slot_record["suburb"],
-                    state=slot_record["state"],
-                    postcode=slot_record.get("postcode")
-                ),
-                status=slot_record["status"],
-                notes=slot_record.get("notes")
-            ))
+        contractor = Contractor.from_trusted_dict(record)
 
         # Filter by state if provided (post-query filter)
-        if state and not any(slot.location.state == state for slot in slots):
+        if state and not any(
+            slot.location.state == state for slot in contractor.availability_slots
+        ):
             continue
 
-        contractor = Contractor(
-            id=record["id"],
-            name=record["name"],
-            mobile=record["mobile"],
-            abn=record.get("abn"),
-            email=record.get("email"),
-            specialisation=record.get("specialisation"),
-            created_at=record["created_at"],
-            updated_at=record["updated_at"],
-            availability_slots=slots
-        )
         contractors.append(contractor)
 
     # Get total count (without pagination)
@@ -131,12 +107,12 @@ async def list_contractors(
     count_response = count_query.execute()
     total = count_response.count or 0
 
-    return ContractorList(
-        contractors=contractors,
-        total=total,
-        page=page,
-        page_size=page_size
-    )
+    return ContractorList.from_trusted_dict({
+        "contractors": contractors,
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+    })
 
 
 @router.get(
@@ -158,38 +134,7 @@ async def get_contractor(contractor_id: str) -> Contractor:
             detail=f"Contractor with ID {contractor_id} not found"
         )
 
-    record = response.data[0]
-
-    # Parse availability slots
-    slots = []
-    for slot_record in record.get("availability_slots", []):
-        slots.append(AvailabilitySlot(
-            id=slot_record["id"],
-            date=slot_record["date"],
-            start_time=slot_record["start_time"],
-            end_time=slot_record["end_time"],
-            location=Location(
-                suburb=slot_record["suburb"],
-                state=slot_record["state"],
-                postcode=slot_record.get("postcode")
-            ),
-            status=slot_record["status"],
-            notes=slot_record.get("notes")
-        ))
-
-    contractor = Contractor(
-        id=record["id"],
-        name=record["name"],
-        mobile=record["mobile"],
-        abn=record.get("abn"),
-        email=record.get("email"),
-        specialisation=record.get("specialisation"),
-        created_at=record["created_at"],
-        updated_at=record["updated_at"],
-        availabilitySlots=slots
-    )
-
-    return contractor
+    return Contractor.from_trusted_dict(response.data[0])
 
 
 @router.post(
@@ -397,22 +342,8 @@ async def get_contractor_availability(
 
     response = query.order("date").execute()
 
-    # Convert to Pydantic models
-    slots = []
-    for record in response.data:
-        slots.append(AvailabilitySlot(
-            id=record["id"],
-            date=record["date"],
-            start_time=record["start_time"],
-            end_time=record["end_time"],
-            location=Location(
-                suburb=record["suburb"],
-                state=record["state"],
-                postcode=record.get("postcode")
-            ),
-            status=record["status"],
-            notes=record.get("notes")
-        ))
+    # Rows were validated on write; build models without re-validating
+    slots = [AvailabilitySlot.from_trusted_dict(record) for record in response.data]
 
     return slots
 
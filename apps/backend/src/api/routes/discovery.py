@@ -3,11 +3,12 @@
 Endpoints:
     GET /api/discovery/agents — list registered agents
     GET /api/discovery/tools  — list registered tools
+    GET /api/discovery/tools/manifest — loaded tools in API format (cached JSON)
 """
 
 from __future__ import annotations
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Request, Response
 
 from src.agents.registry import AgentRegistry
 from src.tools.definitions import register_all_tools
@@ -70,7 +71,7 @@ async def list_tools() -> ToolListResponse:
     registry = get_registry()
 
     tools: list[ToolInfo] = []
-    for tool_def in registry._tools.values():
+    for tool_def in registry.all_tools():
         schema = tool_def.input_schema or {}
         tools.append(
             ToolInfo(
@@ -88,3 +89,15 @@ async def list_tools() -> ToolListResponse:
         )
 
     return ToolListResponse(tools=tools, total=len(tools))
+
+
+@router.get("/tools/manifest")
+async def tools_manifest(request: Request) -> Response:
+    """Return the loaded tools' API definitions, serialized once per registry change."""
+    _ensure_tools_registered()
+    body, etag = get_registry().get_manifest()
+    etag = f'"{etag}"'
+
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(content=body, media_type="application/json", headers={"ETag": etag})
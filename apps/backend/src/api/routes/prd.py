@@ -199,7 +199,7 @@ async def get_prd_result(prd_id: str) -> dict[str, Any]:
         from src.state.supabase import SupabaseStateStore
 
         store = SupabaseStateStore()
-        runs = await store.get_task_agent_runs(prd_id)
+        runs = await store.get_task_agent_runs(prd_id, columns=("status", "metadata"))
 
         if not runs:
             raise HTTPException(status_code=404, detail=f"PRD not found: {prd_id}")
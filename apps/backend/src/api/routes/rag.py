@@ -3,6 +3,7 @@
 from fastapi import APIRouter, UploadFile, File, Form, HTTPException, status
 from typing import Optional
 import base64
+import json
 
 from src.rag.models import (
     PipelineConfig,
@@ -33,6 +34,14 @@ async def get_pipeline() -> RAGPipeline:
     return _pipeline
 
 
+async def aclose_pipeline() -> None:
+    """Shut down the pipeline and search store, if they were started."""
+    if _pipeline is not None:
+        await _pipeline.close()
+    if _store is not None:
+        await _store.aclose()
+
+
 async def get_store() -> RAGStore:
     """Get initialized store."""
     global _store
@@ -42,6 +51,23 @@ async def get_store() -> RAGStore:
     return _store
 
 
+def _parse_pipeline_config(config: Optional[str]) -> PipelineConfig:
+    """Build the pipeline config from the optional JSON form field."""
+    if not config:
+        return PipelineConfig()
+    return PipelineConfig(**json.loads(config))
+
+
+async def _read_upload(file: UploadFile) -> dict:
+    """Read an uploaded file into a pipeline document."""
+    return {
+        "content": await file.read(),
+        "mime_type": file.content_type or "text/plain",
+        "source_uri": file.filename or "upload",
+        "metadata": {"original_filename": file.filename},
+    }
+
+
 @router.post("/upload")
 async def upload_document(
     file: UploadFile = File(...),
@@ -51,27 +77,16 @@ async def upload_document(
 ) -> dict:
     """Upload and process a document."""
     try:
-        # Read file
-        content = await file.read()
-
-        # Parse config
-        pipeline_config = PipelineConfig()
-        if config:
-            import json
-
-            config_dict = json.loads(config)
-            pipeline_config = PipelineConfig(**config_dict)
+        document = await _read_upload(file)
+        pipeline_config = _parse_pipeline_config(config)
 
         # Process through pipeline
         pipeline = await get_pipeline()
         source_id = await pipeline.process_document(
-            content=content,
-            mime_type=file.content_type or "text/plain",
+            **document,
             project_id=project_id,
-            source_uri=file.filename or "upload",
             config=pipeline_config,
             user_id=user_id,
-            metadata={"original_filename": file.filename},
         )
 
         return {
@@ -85,6 +100,38 @@ async def upload_document(
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@router.post("/upload/batch")
+async def upload_documents(
+    files: list[UploadFile] = File(...),
+    project_id: str = Form(...),
+    config: Optional[str] = Form(None),
+    user_id: Optional[str] = Form(None),
+) -> dict:
+    """Upload and process several documents as one batch."""
+    try:
+        documents = [await _read_upload(file) for file in files]
+        pipeline_config = _parse_pipeline_config(config)
+
+        # Process through pipeline
+        pipeline = await get_pipeline()
+        source_ids = await pipeline.process_documents(
+            documents=documents,
+            project_id=project_id,
+            config=pipeline_config,
+            user_id=user_id,
+        )
+
+        return {
+            "status": "success",
+            "source_ids": source_ids,
+            "message": f"{len(source_ids)} documents uploaded and processed",
+        }
+
+    except Exception as e:
+        logger.error("Batch document upload failed", error=str(e))
+        raise HTTPException(status_code=500, detail=str(e))
+
+
 @router.post("/search", response_model=SearchResponse)
 async def search_documents(request: SearchRequest) -> SearchResponse:
     """Search documents using vector, keyword, or hybrid search."""
@@ -102,6 +149,8 @@ async def search_documents(request: SearchRequest) -> SearchResponse:
                 keyword_weight=request.keyword_weight,
                 limit=request.limit,
                 threshold=request.min_score,
+                rerank=request.enable_reranking,
+                fusion=request.fusion,
             )
         elif request.search_type == SearchType.VECTOR:
             results = await store.vector_search(
@@ -126,7 +175,7 @@ async def search_documents(request: SearchRequest) -> SearchResponse:
                 vector_score=r.get("vector_score", 0.0),
                 keyword_score=r.get("keyword_score", 0.0),
                 combined_score=r.get("combined_score", 0.0),
-                rerank_score=None,
+                rerank_score=r.get("rerank_score"),
                 metadata=r.get("metadata", {}),
                 heading_hierarchy=r.get("heading_hierarchy", []),
                 summary=r.get("summary"),
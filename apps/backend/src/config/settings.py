@@ -45,6 +45,10 @@ class Settings(BaseSettings):
     supabase_anon_key: str = Field(default="", alias="NEXT_PUBLIC_SUPABASE_ANON_KEY")
     supabase_service_role_key: str = Field(default="")
     supabase_jwt_secret: str = Field(default="")
+    supabase_db_url: str = Field(
+        default="",
+        description="Supabase Postgres URL for pooled state queries (Supavisor, port 6543)"
+    )
 
     # AI Provider Configuration
     ai_provider: str = Field(
@@ -6,7 +6,6 @@ or OpenAI API as a fallback. Embeddings enable semantic search across memory ent
 
 import os
 from abc import ABC, abstractmethod
-from typing import Optional
 
 import httpx
 from src.utils import get_logger
@@ -29,6 +28,20 @@ class EmbeddingProvider(ABC):
         """
         pass
 
+    async def get_embedding_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings for several texts.
+
+        Providers with a multi-input endpoint should override this; the
+        default embeds one text at a time.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            Embedding vectors, in the same order as texts
+        """
+        return [await self.get_embedding(text) for text in texts]
+
 
 class AnthropicEmbeddingProvider(EmbeddingProvider):
     """Anthropic embedding provider using Claude embeddings.
@@ -56,6 +69,9 @@ class AnthropicEmbeddingProvider(EmbeddingProvider):
 class OpenAIEmbeddingProvider(EmbeddingProvider):
     """OpenAI embedding provider using text-embedding-3-small model."""
 
+    # Maximum inputs accepted by one /v1/embeddings request
+    MAX_BATCH_SIZE = 2048
+
     def __init__(self, api_key: str) -> None:
         """Initialize with API key."""
         self.api_key = api_key
@@ -75,6 +91,47 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
         Raises:
             Exception: If API call fails
         """
+        data = await self._request(text)
+
+        embedding = data["data"][0]["embedding"]
+        logger.debug(
+            "Embedding generated",
+            model=self.model,
+            dimensions=len(embedding),
+            text_length=len(text),
+        )
+
+        return embedding
+
+    async def get_embedding_batch(self, texts: list[str]) -> list[list[float]]:
+        """Generate embeddings with one API request per 2048 texts.
+
+        Args:
+            texts: Texts to embed (each max ~8k tokens)
+
+        Returns:
+            Embedding vectors, in the same order as texts
+
+        Raises:
+            Exception: If API call fails
+        """
+        embeddings: list[list[float]] = []
+        for start in range(0, len(texts), self.MAX_BATCH_SIZE):
+            data = await self._request(texts[start:start + self.MAX_BATCH_SIZE])
+            # Results carry their input index; don't rely on response order
+            items = sorted(data["data"], key=lambda item: item["index"])
+            embeddings.extend(item["embedding"] for item in items)
+
+        logger.debug(
+            "Embeddings generated",
+            model=self.model,
+            count=len(embeddings),
+        )
+
+        return embeddings
+
+    async def _request(self, inputs: str | list[str]) -> dict:
+        """POST inputs to the OpenAI embeddings endpoint."""
         try:
             response = await self.client.post(
                 "https://api.openai.com/v1/embeddings",
@@ -83,7 +140,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
                     "Content-Type": "application/json",
                 },
                 json={
-                    "input": text,
+                    "input": inputs,
                     "model": self.model,
                     "dimensions": self.dimensions,
                 },
@@ -91,17 +148,7 @@ class OpenAIEmbeddingProvider(EmbeddingProvider):
             )
 
             response.raise_for_status()
-            data = response.json()
-
-            embedding = data["data"][0]["embedding"]
-            logger.debug(
-                "Embedding generated",
-                model=self.model,
-                dimensions=len(embedding),
-                text_length=len(text),
-            )
-
-            return embedding
+            return response.json()
 
         except httpx.HTTPStatusError as e:
             logger.error(
@@ -4,7 +4,7 @@ This module provides the foundational storage and retrieval layer for all
 memory types, implementing semantic search via pgvector and efficient CRUD operations.
 """
 
-import json
+import asyncio
 from datetime import datetime
 from typing import Any, Optional
 from uuid import UUID
@@ -124,10 +124,10 @@ class MemoryStore:
         }
 
         # Insert into database
-        result = (
+        result = await asyncio.to_thread(
             self.client.table("domain_memories")
             .insert(data)
-            .execute()
+            .execute
         )
 
         if not result.data:
@@ -158,11 +158,11 @@ class MemoryStore:
         Returns:
             MemoryEntry if found, None otherwise
         """
-        result = (
+        result = await asyncio.to_thread(
             self.client.table("domain_memories")
             .select("*")
             .eq("id", memory_id)
-            .execute()
+            .execute
         )
 
         if not result.data:
@@ -206,11 +206,11 @@ class MemoryStore:
                 )
                 updates["embedding"] = await self.embedding_provider.get_embedding(text)
 
-        result = (
+        result = await asyncio.to_thread(
             self.client.table("domain_memories")
             .update(updates)
             .eq("id", memory_id)
-            .execute()
+            .execute
         )
 
         if not result.data:
@@ -228,11 +228,11 @@ class MemoryStore:
         Returns:
             True if deleted, False if not found
         """
-        result = (
+        result = await asyncio.to_thread(
             self.client.table("domain_memories")
             .delete()
             .eq("id", memory_id)
-            .execute()
+            .execute
         )
 
         success = bool(result.data)
@@ -269,10 +269,9 @@ class MemoryStore:
         if query.min_relevance > 0:
             db_query = db_query.gte("relevance_score", query.min_relevance)
 
-        # Tag filter (contains all specified tags)
+        # Tag filter: jsonb @> matches rows containing all specified tags
         if query.tags:
-            for tag in query.tags:
-                db_query = db_query.contains("tags", [tag])
+            db_query = db_query.contains("tags", query.tags)
 
         # Order by created_at descending
         db_query = db_query.order("created_at", desc=True)
@@ -281,7 +280,7 @@ class MemoryStore:
         db_query = db_query.range(query.offset, query.offset + query.limit - 1)
 
         # Execute
-        result = db_query.execute()
+        result = await asyncio.to_thread(db_query.execute)
 
         # Convert to MemoryEntry objects
         entries = [MemoryEntry(**data) for data in result.data]
@@ -296,7 +295,7 @@ class MemoryStore:
         if query.user_id:
             count_query = count_query.eq("user_id", query.user_id)
 
-        count_result = count_query.execute()
+        count_result = await asyncio.to_thread(count_query.execute)
         total_count = count_result.count or 0
 
         logger.debug(
@@ -344,16 +343,19 @@ class MemoryStore:
         query_embedding = await self.embedding_provider.get_embedding(query_text)
 
         # Call database function for vector search
-        result = self.client.rpc(
-            "find_similar_memories",
-            {
-                "query_embedding": json.dumps(query_embedding),  # Convert to JSON string
-                "match_threshold": similarity_threshold,
-                "match_count": limit,
-                "filter_domain": domain.value if domain else None,
-                "filter_user_id": user_id,
-            },
-        ).execute()
+        result = await asyncio.to_thread(
+            self.client.rpc(
+                "find_similar_memories",
+                {
+                    # Sent as a JSON array, which Postgres casts to vector
+                    "query_embedding": query_embedding,
+                    "match_threshold": similarity_threshold,
+                    "match_count": limit,
+                    "filter_domain": domain.value if domain else None,
+                    "filter_user_id": user_id,
+                },
+            ).execute
+        )
 
         logger.debug(
             "Vector search executed",
@@ -382,13 +384,15 @@ class MemoryStore:
         Returns:
             Number of memories deleted
         """
-        result = self.client.rpc(
-            "prune_stale_memories",
-            {
-                "min_relevance": min_relevance,
-                "max_age_days": max_age_days,
-            },
-        ).execute()
+        result = await asyncio.to_thread(
+            self.client.rpc(
+                "prune_stale_memories",
+                {
+                    "min_relevance": min_relevance,
+                    "max_age_days": max_age_days,
+                },
+            ).execute
+        )
 
         deleted_count = result.data or 0
         logger.info(
@@ -444,7 +448,9 @@ class MemoryStore:
 
     async def _increment_access(self, memory_id: str) -> None:
         """Increment access count for a memory."""
-        self.client.rpc("increment_memory_access", {"memory_id": memory_id}).execute()
+        await asyncio.to_thread(
+            self.client.rpc("increment_memory_access", {"memory_id": memory_id}).execute
+        )
 
     def _memory_to_text(
         self,
@@ -14,15 +14,28 @@ Sources:
 - docs.anthropic.com/en/docs/build-with-claude/computer-use
 """
 
-from typing import Any, TypedDict, Literal, NotRequired
-from dataclasses import dataclass, field
-
+import hashlib
+import inspect
+import time
+from collections.abc import AsyncIterator, Callable
+from functools import lru_cache, wraps
+from typing import (
+    TYPE_CHECKING, Any, TypedDict, Literal, NotRequired, TypeVar,
+)
+from dataclasses import dataclass, replace
+
+import numpy as np
+import orjson
 from anthropic import AsyncAnthropic
+from pydantic import BaseModel
 
 from src.config import get_settings
 from src.utils import get_logger
 from .base_provider import BaseLLMProvider
 
+if TYPE_CHECKING:
+    from redis.asyncio import Redis
+
 settings = get_settings()
 logger = get_logger(__name__)
 
@@ -121,9 +134,14 @@ class ToolUseBlock(TypedDict):
 ContentBlock = ContentBlockText | ContentBlockThinking | ToolUseBlock
 
 
-@dataclass
+# Shared cache_control markers - never mutated, so one instance per TTL suffices
+_EPHEMERAL_5M: CacheControl = {"type": "ephemeral"}
+_EPHEMERAL_1H: CacheControl = {"type": "ephemeral", "ttl": "1h"}
+
+
+@dataclass(frozen=True, slots=True)
 class BetaFeatureConfig:
-    """Configuration for beta features."""
+    """Configuration for beta features (immutable - use dataclasses.replace)."""
 
     computer_use: bool = False
     computer_display_width: int = 1920
@@ -144,6 +162,110 @@ class BetaFeatureConfig:
     context_management: bool = False
     effort: bool = False  # Opus 4.5 only
 
+    def __post_init__(self) -> None:
+        """Reject an out-of-range default thinking budget at config time."""
+        if self.extended_thinking:
+            _thinking_config_cached(self.thinking_budget_tokens)
+
+
+@lru_cache(maxsize=64)
+def _build_beta_headers_for(features: BetaFeatureConfig, model: str) -> tuple[str, ...]:
+    """Build beta headers for a feature set and model.
+
+    Takes both as arguments so per-call overrides (e.g. interleaved thinking)
+    never touch shared client state; frozen configs make the result cacheable.
+    """
+    headers: list[str] = []
+
+    if features.computer_use:
+        header = (
+            BetaHeaders.COMPUTER_USE_OPUS_4_5
+            if model == ClaudeModels.OPUS_4_5
+            else BetaHeaders.COMPUTER_USE_STANDARD
+        )
+        headers.append(header)
+
+    if features.interleaved_thinking:
+        headers.append(BetaHeaders.INTERLEAVED_THINKING)
+
+    if features.output_128k:
+        headers.append(BetaHeaders.OUTPUT_128K)
+
+    if features.advanced_tool_use:
+        headers.append(BetaHeaders.ADVANCED_TOOL_USE)
+
+    if features.structured_outputs:
+        headers.append(BetaHeaders.STRUCTURED_OUTPUTS)
+
+    if features.context_management:
+        headers.append(BetaHeaders.CONTEXT_MANAGEMENT)
+
+    if features.effort and model == ClaudeModels.OPUS_4_5:
+        headers.append(BetaHeaders.EFFORT)
+
+    return tuple(headers)
+
+
+# ============================================================================
+# Content Block Extractors
+# ============================================================================
+# SDK responses are typed objects; plain dicts only appear in replayed or
+# hand-built content. Each dispatcher maps type(block) to the accessor for
+# that representation, so extraction is one dict lookup per block.
+
+BlockExtractor = Callable[[Any], Any]
+
+
+def _text_from_attrs(block: Any) -> str | None:
+    return block.text if getattr(block, "type", None) == "text" else None
+
+
+def _text_from_dict(block: dict[str, Any]) -> str | None:
+    return block.get("text", "") if block.get("type") == "text" else None
+
+
+def _thinking_from_attrs(block: Any) -> str | None:
+    return block.thinking if getattr(block, "type", None) == "thinking" else None
+
+
+def _thinking_from_dict(block: dict[str, Any]) -> str | None:
+    return block.get("thinking", "") if block.get("type") == "thinking" else None
+
+
+def _tool_call_from_attrs(block: Any) -> dict[str, Any] | None:
+    if getattr(block, "type", None) != "tool_use":
+        return None
+    return {"id": block.id, "name": block.name, "input": block.input}
+
+
+def _tool_call_from_dict(block: dict[str, Any]) -> dict[str, Any] | None:
+    if block.get("type") != "tool_use":
+        return None
+    return {"id": block.get("id"), "name": block.get("name"), "input": block.get("input")}
+
+
+class _BlockDispatch:
+    """Per-type extractor cache for one kind of content block."""
+
+    __slots__ = ("_from_attrs", "_from_dict", "_by_type")
+
+    def __init__(self, from_attrs: BlockExtractor, from_dict: BlockExtractor) -> None:
+        self._from_attrs = from_attrs
+        self._from_dict = from_dict
+        self._by_type: dict[type, BlockExtractor] = {}
+
+    def __call__(self, block: Any) -> Any:
+        extractor = self._by_type.get(type(block))
+        if extractor is None:
+            extractor = self._from_dict if isinstance(block, dict) else self._from_attrs
+            self._by_type[type(block)] = extractor
+        return extractor(block)
+
+
+_TEXT_EXTRACTORS = _BlockDispatch(_text_from_attrs, _text_from_dict)
+_THINKING_EXTRACTORS = _BlockDispatch(_thinking_from_attrs, _thinking_from_dict)
+_TOOL_CALL_EXTRACTORS = _BlockDispatch(_tool_call_from_attrs, _tool_call_from_dict)
+
 
 # ============================================================================
 # Thinking Limits
@@ -153,6 +275,159 @@ THINKING_MIN_BUDGET = 1024
 THINKING_MAX_BUDGET = 128000
 
 
+@lru_cache(maxsize=32)
+def _thinking_config_cached(budget: int) -> ThinkingConfig:
+    """Validate a thinking budget once and share the resulting config.
+
+    The returned dict is shared between requests and must not be mutated.
+
+    Raises:
+        ValueError: If budget outside valid range
+    """
+    if budget < THINKING_MIN_BUDGET:
+        raise ValueError(
+            f"budget_tokens must be at least {THINKING_MIN_BUDGET}, got {budget}"
+        )
+
+    if budget > THINKING_MAX_BUDGET:
+        raise ValueError(
+            f"budget_tokens cannot exceed {THINKING_MAX_BUDGET}, got {budget}"
+        )
+
+    return {"type": "enabled", "budget_tokens": budget}
+
+
+# ============================================================================
+# Cache Telemetry
+# ============================================================================
+
+CACHE_HIT_RATE_ALERT_THRESHOLD = 0.5
+
+# Responses observed before the hit rate is judged (cold starts always miss),
+# and minimum seconds between repeated alerts
+CACHE_ALERT_MIN_RESPONSES = 20
+CACHE_ALERT_INTERVAL_SECONDS = 300.0
+
+
+# ============================================================================
+# Request Serialization
+# ============================================================================
+
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS
+
+
+def _orjson_default(obj: Any) -> Any:
+    """Encode the non-native types the SDK may leave in a request body."""
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode="json", exclude_unset=True, by_alias=True)
+    if isinstance(obj, (set, frozenset, tuple)):
+        return list(obj)
+    raise TypeError(f"Type is not JSON serializable: {type(obj).__name__}")
+
+
+class _OrjsonAsyncAnthropic(AsyncAnthropic):
+    """AsyncAnthropic that encodes JSON request bodies with orjson.
+
+    The SDK encodes ``messages``/``tools``/``system`` with stdlib ``json`` on
+    every request. We pre-serialize the body to bytes and hand it over as raw
+    ``content`` so the SDK skips its own encoder. Anything orjson rejects
+    (e.g. ints wider than 64 bits) falls back to the SDK path unchanged.
+    """
+
+    def _build_request(self, options: Any, *, retries_taken: int = 0) -> Any:
+        json_data = options.json_data
+        if (
+            isinstance(json_data, dict)
+            and hasattr(options, "content")
+            and options.content is None
+            and not options.files
+            and options.extra_json is None
+            and options.method.lower() != "get"
+        ):
+            try:
+                body = orjson.dumps(json_data, default=_orjson_default, option=_ORJSON_OPTIONS)
+            except TypeError:
+                pass
+            else:
+                options = options.model_copy(update={"json_data": None, "content": body})
+
+        return super()._build_request(options, retries_taken=retries_taken)
+
+
+# ============================================================================
+# Result Cache
+# ============================================================================
+
+# Bump when the cached value format or fingerprint inputs change
+RESULT_CACHE_SCHEMA_VERSION = 1
+RESULT_CACHE_TTL_SECONDS = 3600
+RESULT_CACHE_PREFIX = "llm:anthropic:"
+
+
+def _result_fingerprint(features: BetaFeatureConfig, kwargs: dict[str, Any]) -> str:
+    """Hash everything that can change a completion into a cache key.
+
+    ``kwargs`` already carries model, max_tokens, temperature, system, tools,
+    messages and betas; the feature config and schema version are folded in
+    so a model or config change never serves a stale result.
+    """
+    payload = orjson.dumps(
+        {"v": RESULT_CACHE_SCHEMA_VERSION, "features": features, "request": kwargs},
+        default=_orjson_default,
+        option=_ORJSON_OPTIONS | orjson.OPT_SORT_KEYS,
+    )
+    return RESULT_CACHE_PREFIX + hashlib.sha256(payload).hexdigest()
+
+
+# ============================================================================
+# Error Handling
+# ============================================================================
+
+# Transient 429/5xx/overloaded responses are retried with exponential backoff
+# by the SDK itself; this only sets how many attempts it makes.
+DEFAULT_MAX_RETRIES = 3
+
+F = TypeVar("F", bound=Callable[..., Any])
+
+
+def _log_errors(message: str) -> Callable[[F], F]:
+    """Log and re-raise any exception escaping an API method.
+
+    Works for coroutine methods and for async generators (the streaming
+    methods), where errors surface during iteration rather than the call.
+    """
+
+    def decorator(fn: F) -> F:
+        if inspect.isasyncgenfunction(fn):
+
+            @wraps(fn)
+            async def gen_wrapper(*args: Any, **kwargs: Any) -> AsyncIterator[Any]:
+                stream = fn(*args, **kwargs)
+                try:
+                    async for item in stream:
+                        yield item
+                except Exception as e:
+                    logger.error(message, error=str(e))
+                    raise
+                finally:
+                    # Close the inner stream now if the caller stops early
+                    await stream.aclose()
+
+            return gen_wrapper  # type: ignore[return-value]
+
+        @wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> Any:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception as e:
+                logger.error(message, error=str(e))
+                raise
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
+
+
 # ============================================================================
 # Anthropic Client
 # ============================================================================
@@ -178,18 +453,43 @@ class AnthropicClient(BaseLLMProvider):
         self,
         model: str | None = None,
         features: BetaFeatureConfig | None = None,
+        cache_alert_threshold: float = CACHE_HIT_RATE_ALERT_THRESHOLD,
+        max_retries: int = DEFAULT_MAX_RETRIES,
+        redis_cache: "Redis | None" = None,
+        result_cache_ttl: int = RESULT_CACHE_TTL_SECONDS,
     ) -> None:
         """Initialize Anthropic client.
 
         Args:
             model: Model identifier (defaults to Sonnet 4.5)
             features: Beta feature configuration
+            cache_alert_threshold: Log when the prompt cache hit rate drops below this
+            max_retries: SDK retry attempts for rate-limit/overload errors
+            redis_cache: Optional Redis client for sharing text results across processes
+            result_cache_ttl: Seconds a cached result stays valid
         """
-        self.client = AsyncAnthropic(api_key=settings.anthropic_api_key)
+        self.client = _OrjsonAsyncAnthropic(
+            api_key=settings.anthropic_api_key,
+            max_retries=max_retries,
+        )
         self.model = model or self.SONNET
         self.max_tokens = settings.max_tokens
         self.temperature = settings.temperature
         self.features = features or BetaFeatureConfig()
+        self._cc: CacheControl = (
+            _EPHEMERAL_1H if self.features.cache_ttl == "1h" else _EPHEMERAL_5M
+        )
+        self.cache_alert_threshold = cache_alert_threshold
+        self.redis_cache = redis_cache
+        self.result_cache_ttl = result_cache_ttl
+        self._cache_stats: dict[str, float] = {
+            "reads": 0,
+            "writes": 0,
+            "misses": 0,
+            "hit_rate": 0.0,
+        }
+        self._cache_responses = 0
+        self._cache_alert_at = float("-inf")
 
     # ========================================================================
     # Beta Header Building
@@ -197,35 +497,7 @@ class AnthropicClient(BaseLLMProvider):
 
     def _build_beta_headers(self) -> list[str]:
         """Build beta header list based on enabled features."""
-        headers: list[str] = []
-
-        if self.features.computer_use:
-            header = (
-                BetaHeaders.COMPUTER_USE_OPUS_4_5
-                if self.model == ClaudeModels.OPUS_4_5
-                else BetaHeaders.COMPUTER_USE_STANDARD
-            )
-            headers.append(header)
-
-        if self.features.interleaved_thinking:
-            headers.append(BetaHeaders.INTERLEAVED_THINKING)
-
-        if self.features.output_128k:
-            headers.append(BetaHeaders.OUTPUT_128K)
-
-        if self.features.advanced_tool_use:
-            headers.append(BetaHeaders.ADVANCED_TOOL_USE)
-
-        if self.features.structured_outputs:
-            headers.append(BetaHeaders.STRUCTURED_OUTPUTS)
-
-        if self.features.context_management:
-            headers.append(BetaHeaders.CONTEXT_MANAGEMENT)
-
-        if self.features.effort and self.model == ClaudeModels.OPUS_4_5:
-            headers.append(BetaHeaders.EFFORT)
-
-        return headers
+        return list(_build_beta_headers_for(self.features, self.model))
 
     # ========================================================================
     # Prompt Caching Helpers
@@ -237,24 +509,129 @@ class AnthropicClient(BaseLLMProvider):
             # Return as plain text
             return [{"type": "text", "text": system}]
 
-        cache_control: CacheControl = {"type": "ephemeral"}
-        if self.features.cache_ttl == "1h":
-            cache_control["ttl"] = "1h"
-
-        return [{"type": "text", "text": system, "cache_control": cache_control}]
+        return [{"type": "text", "text": system, "cache_control": self._cc}]
 
     def _add_cache_to_tools(
         self, tools: list[dict[str, Any]]
     ) -> list[dict[str, Any]]:
-        """Add cache_control to tool definitions."""
-        if not self.features.prompt_caching or not self.features.cache_tools:
+        """Add cache_control to the final tool definition.
+
+        A breakpoint on the last tool caches every tool before it, so only one
+        of the four available breakpoints is spent on the tool list.
+        """
+        if not tools or not self.features.prompt_caching or not self.features.cache_tools:
             return tools
 
-        cache_control: CacheControl = {"type": "ephemeral"}
-        if self.features.cache_ttl == "1h":
-            cache_control["ttl"] = "1h"
+        return [*tools[:-1], {**tools[-1], "cache_control": self._cc}]
 
-        return [{**tool, "cache_control": cache_control} for tool in tools]
+    def _build_request_kwargs(
+        self,
+        messages: list[dict[str, Any]],
+        max_tokens: int,
+        temperature: float | None = None,
+        system: str | None = None,
+        tools: list[dict[str, Any]] | None = None,
+        thinking: ThinkingConfig | None = None,
+        features: BetaFeatureConfig | None = None,
+    ) -> dict[str, Any]:
+        """Build messages.create kwargs in a fixed, cache-friendly order.
+
+        Key order is always model, max_tokens, temperature, system, tools,
+        thinking, messages, betas so the static prefix serializes identically
+        on every request and prompt-cache prefixes keep matching.
+
+        ``features`` overrides the client's beta configuration for this
+        request only.
+        """
+        kwargs: dict[str, Any] = {"model": self.model, "max_tokens": max_tokens}
+
+        if temperature is not None:
+            kwargs["temperature"] = temperature
+
+        if system:
+            if self.features.prompt_caching:
+                kwargs["system"] = self._create_cached_system(system)
+            else:
+                kwargs["system"] = system
+
+        if tools is not None:
+            kwargs["tools"] = self._add_cache_to_tools(tools)
+
+        if thinking is not None:
+            kwargs["thinking"] = thinking
+
+        kwargs["messages"] = messages
+
+        beta_headers = _build_beta_headers_for(features or self.features, self.model)
+        if beta_headers:
+            kwargs["betas"] = list(beta_headers)
+
+        return kwargs
+
+    def _record_cache_metrics(self, usage: Any) -> None:
+        """Accumulate prompt cache usage from a response and flag regressions."""
+        if usage is None:
+            return
+
+        reads = getattr(usage, "cache_read_input_tokens", 0) or 0
+        writes = getattr(usage, "cache_creation_input_tokens", 0) or 0
+        misses = getattr(usage, "input_tokens", 0) or 0
+
+        stats = self._cache_stats
+        stats["reads"] += reads
+        stats["writes"] += writes
+        stats["misses"] += misses
+
+        total = stats["reads"] + stats["writes"] + stats["misses"]
+        stats["hit_rate"] = stats["reads"] / total if total else 0.0
+
+        logger.debug(
+            "Anthropic cache usage",
+            model=self.model,
+            cache_read_tokens=reads,
+            cache_write_tokens=writes,
+            uncached_tokens=misses,
+            hit_rate=stats["hit_rate"],
+        )
+
+        self._cache_responses += 1
+        if (
+            self.features.prompt_caching
+            and total
+            and stats["hit_rate"] < self.cache_alert_threshold
+            and self._cache_responses >= CACHE_ALERT_MIN_RESPONSES
+            and time.monotonic() - self._cache_alert_at >= CACHE_ALERT_INTERVAL_SECONDS
+        ):
+            self._cache_alert_at = time.monotonic()
+            logger.info(
+                "Anthropic cache hit rate below threshold",
+                model=self.model,
+                hit_rate=round(stats["hit_rate"], 4),
+                threshold=self.cache_alert_threshold,
+            )
+
+    # ========================================================================
+    # Result Cache Helpers
+    # ========================================================================
+
+    async def _get_cached_result(self, key: str) -> str | None:
+        """Read a cached text result, treating cache failures as misses."""
+        try:
+            cached = await self.redis_cache.get(key)
+        except Exception as e:
+            logger.warning("Anthropic result cache read failed", error=str(e))
+            return None
+
+        if cached is None:
+            return None
+        return cached.decode() if isinstance(cached, bytes) else cached
+
+    async def _set_cached_result(self, key: str, text: str) -> None:
+        """Store a text result, never failing the request on cache errors."""
+        try:
+            await self.redis_cache.setex(key, self.result_cache_ttl, text.encode())
+        except Exception as e:
+            logger.warning("Anthropic result cache write failed", error=str(e))
 
     # ========================================================================
     # Extended Thinking
@@ -274,24 +651,13 @@ class AnthropicClient(BaseLLMProvider):
         Raises:
             ValueError: If budget_tokens outside valid range
         """
-        budget = budget_tokens or self.features.thinking_budget_tokens
-
-        if budget < THINKING_MIN_BUDGET:
-            raise ValueError(
-                f"budget_tokens must be at least {THINKING_MIN_BUDGET}, got {budget}"
-            )
-
-        if budget > THINKING_MAX_BUDGET:
-            raise ValueError(
-                f"budget_tokens cannot exceed {THINKING_MAX_BUDGET}, got {budget}"
-            )
-
-        return {"type": "enabled", "budget_tokens": budget}
+        return _thinking_config_cached(budget_tokens or self.features.thinking_budget_tokens)
 
     # ========================================================================
     # Core API Methods
     # ========================================================================
 
+    @_log_errors("Anthropic API error")
     async def complete(
         self,
         prompt: str,
@@ -310,37 +676,30 @@ class AnthropicClient(BaseLLMProvider):
         Returns:
             The model's response text
         """
-        try:
-            messages = [{"role": "user", "content": prompt}]
-
-            # Build request kwargs
-            kwargs: dict[str, Any] = {
-                "model": self.model,
-                "max_tokens": max_tokens or self.max_tokens,
-                "temperature": temperature or self.temperature,
-                "messages": messages,
-            }
-
-            # Add cached system prompt if provided
-            if system:
-                if self.features.prompt_caching:
-                    kwargs["system"] = self._create_cached_system(system)
-                else:
-                    kwargs["system"] = system
+        kwargs = self._build_request_kwargs(
+            [{"role": "user", "content": prompt}],
+            max_tokens=max_tokens or self.max_tokens,
+            temperature=temperature or self.temperature,
+            system=system,
+        )
 
-            # Add beta headers if any features enabled
-            beta_headers = self._build_beta_headers()
-            if beta_headers:
-                kwargs["betas"] = beta_headers
+        cache_key = None
+        if self.redis_cache is not None:
+            cache_key = _result_fingerprint(self.features, kwargs)
+            cached = await self._get_cached_result(cache_key)
+            if cached is not None:
+                return cached
 
-            response = await self.client.messages.create(**kwargs)
+        response = await self.client.messages.create(**kwargs)
+        self._record_cache_metrics(response.usage)
 
-            return self._extract_text(response.content)
+        text = self._extract_text(response.content)
+        if cache_key is not None:
+            await self._set_cached_result(cache_key, text)
 
-        except Exception as e:
-            logger.error("Anthropic API error", error=str(e))
-            raise
+        return text
 
+    @_log_errors("Anthropic chat error")
     async def chat(
         self,
         messages: list[dict[str, str]],
@@ -355,32 +714,30 @@ class AnthropicClient(BaseLLMProvider):
         Returns:
             The model's response text
         """
-        try:
-            kwargs: dict[str, Any] = {
-                "model": self.model,
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "messages": messages,
-            }
-
-            if system:
-                if self.features.prompt_caching:
-                    kwargs["system"] = self._create_cached_system(system)
-                else:
-                    kwargs["system"] = system
+        kwargs = self._build_request_kwargs(
+            messages,
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            system=system,
+        )
 
-            beta_headers = self._build_beta_headers()
-            if beta_headers:
-                kwargs["betas"] = beta_headers
+        cache_key = None
+        if self.redis_cache is not None:
+            cache_key = _result_fingerprint(self.features, kwargs)
+            cached = await self._get_cached_result(cache_key)
+            if cached is not None:
+                return cached
 
-            response = await self.client.messages.create(**kwargs)
+        response = await self.client.messages.create(**kwargs)
+        self._record_cache_metrics(response.usage)
 
-            return self._extract_text(response.content)
+        text = self._extract_text(response.content)
+        if cache_key is not None:
+            await self._set_cached_result(cache_key, text)
 
-        except Exception as e:
-            logger.error("Anthropic chat error", error=str(e))
-            raise
+        return text
 
+    @_log_errors("Anthropic tool use error")
     async def with_tools(
         self,
         prompt: str,
@@ -397,41 +754,57 @@ class AnthropicClient(BaseLLMProvider):
         Returns:
             The model's response including tool calls
         """
-        try:
-            kwargs: dict[str, Any] = {
-                "model": self.model,
-                "max_tokens": self.max_tokens,
-                "temperature": self.temperature,
-                "messages": [{"role": "user", "content": prompt}],
-                "tools": self._add_cache_to_tools(tools),
-            }
-
-            if system:
-                if self.features.prompt_caching:
-                    kwargs["system"] = self._create_cached_system(system)
-                else:
-                    kwargs["system"] = system
-
-            beta_headers = self._build_beta_headers()
-            if beta_headers:
-                kwargs["betas"] = beta_headers
-
-            response = await self.client.messages.create(**kwargs)
-
-            return {
-                "content": response.content,
-                "stop_reason": response.stop_reason,
-                "usage": response.usage,
-            }
+        kwargs = self._build_request_kwargs(
+            [{"role": "user", "content": prompt}],
+            max_tokens=self.max_tokens,
+            temperature=self.temperature,
+            system=system,
+            tools=tools,
+        )
 
-        except Exception as e:
-            logger.error("Anthropic tool use error", error=str(e))
-            raise
+        response = await self.client.messages.create(**kwargs)
+        self._record_cache_metrics(response.usage)
+
+        return {
+            "content": response.content,
+            "stop_reason": response.stop_reason,
+            "usage": response.usage,
+        }
 
     # ========================================================================
     # Extended Thinking Methods
     # ========================================================================
 
+    def _build_thinking_kwargs(
+        self,
+        prompt: str,
+        system: str | None,
+        budget_tokens: int | None,
+        max_tokens: int | None,
+    ) -> dict[str, Any]:
+        """Build validated kwargs for a single-turn extended thinking request."""
+        thinking_config = self._create_thinking_config(budget_tokens)
+        output_tokens = max_tokens or self.max_tokens
+
+        # Validate budget vs max_tokens (unless interleaved). Checked per
+        # call against the current attributes, which callers may change
+        if (
+            not self.features.interleaved_thinking
+            and thinking_config["budget_tokens"] >= output_tokens
+        ):
+            raise ValueError(
+                "budget_tokens must be less than max_tokens "
+                "(unless using interleaved thinking)"
+            )
+
+        return self._build_request_kwargs(
+            [{"role": "user", "content": prompt}],
+            max_tokens=output_tokens,
+            system=system,
+            thinking=thinking_config,
+        )
+
+    @_log_errors("Anthropic thinking error")
     async def think(
         self,
         prompt: str,
@@ -458,47 +831,18 @@ class AnthropicClient(BaseLLMProvider):
             text = await self.complete(prompt, system, max_tokens)
             return {"text": text, "thinking": [], "usage": None}
 
-        try:
-            thinking_config = self._create_thinking_config(budget_tokens)
-            output_tokens = max_tokens or self.max_tokens
-
-            # Validate budget vs max_tokens (unless interleaved)
-            if not self.features.interleaved_thinking:
-                if thinking_config["budget_tokens"] >= output_tokens:
-                    raise ValueError(
-                        "budget_tokens must be less than max_tokens "
-                        "(unless using interleaved thinking)"
-                    )
-
-            kwargs: dict[str, Any] = {
-                "model": self.model,
-                "max_tokens": output_tokens,
-                "messages": [{"role": "user", "content": prompt}],
-                "thinking": thinking_config,
-            }
-
-            if system:
-                if self.features.prompt_caching:
-                    kwargs["system"] = self._create_cached_system(system)
-                else:
-                    kwargs["system"] = system
-
-            beta_headers = self._build_beta_headers()
-            if beta_headers:
-                kwargs["betas"] = beta_headers
-
-            response = await self.client.messages.create(**kwargs)
-
-            return {
-                "text": self._extract_text(response.content),
-                "thinking": self._extract_thinking(response.content),
-                "usage": response.usage,
-            }
+        kwargs = self._build_thinking_kwargs(prompt, system, budget_tokens, max_tokens)
 
-        except Exception as e:
-            logger.error("Anthropic thinking error", error=str(e))
-            raise
+        response = await self.client.messages.create(**kwargs)
+        self._record_cache_metrics(response.usage)
+
+        return {
+            "text": self._extract_text(response.content),
+            "thinking": self._extract_thinking(response.content),
+            "usage": response.usage,
+        }
 
+    @_log_errors("Anthropic interleaved thinking error")
     async def think_with_tools(
         self,
         prompt: str,
@@ -521,48 +865,107 @@ class AnthropicClient(BaseLLMProvider):
         Returns:
             Dict with 'content', 'thinking', 'tool_calls', and 'usage'
         """
-        # Enable interleaved thinking for tool use
-        original_interleaved = self.features.interleaved_thinking
-        self.features.interleaved_thinking = True
+        # Enable interleaved thinking for this request only
+        local_features = replace(self.features, interleaved_thinking=True)
+        thinking_config = self._create_thinking_config(budget_tokens)
+
+        kwargs = self._build_request_kwargs(
+            [{"role": "user", "content": prompt}],
+            max_tokens=max_tokens or self.max_tokens,
+            system=system,
+            tools=tools,
+            thinking=thinking_config,
+            features=local_features,
+        )
 
-        try:
-            thinking_config = self._create_thinking_config(budget_tokens)
-
-            kwargs: dict[str, Any] = {
-                "model": self.model,
-                "max_tokens": max_tokens or self.max_tokens,
-                "messages": [{"role": "user", "content": prompt}],
-                "tools": self._add_cache_to_tools(tools),
-                "thinking": thinking_config,
-            }
-
-            if system:
-                if self.features.prompt_caching:
-                    kwargs["system"] = self._create_cached_system(system)
-                else:
-                    kwargs["system"] = system
-
-            beta_headers = self._build_beta_headers()
-            if beta_headers:
-                kwargs["betas"] = beta_headers
-
-            response = await self.client.messages.create(**kwargs)
-
-            return {
-                "content": response.content,
-                "text": self._extract_text(response.content),
-                "thinking": self._extract_thinking(response.content),
-                "tool_calls": self._extract_tool_calls(response.content),
-                "stop_reason": response.stop_reason,
-                "usage": response.usage,
-            }
+        response = await self.client.messages.create(**kwargs)
+        self._record_cache_metrics(response.usage)
 
-        except Exception as e:
-            logger.error("Anthropic interleaved thinking error", error=str(e))
-            raise
-        finally:
-            # Restore original setting
-            self.features.interleaved_thinking = original_interleaved
+        return {
+            "content": response.content,
+            "text": self._extract_text(response.content),
+            "thinking": self._extract_thinking(response.content),
+            "tool_calls": self._extract_tool_calls(response.content),
+            "stop_reason": response.stop_reason,
+            "usage": response.usage,
+        }
+
+    # ========================================================================
+    # Streaming Methods
+    # ========================================================================
+
+    @_log_errors("Anthropic stream error")
+    async def stream_complete(
+        self,
+        prompt: str,
+        system: str | None = None,
+        max_tokens: int | None = None,
+        temperature: float | None = None,
+    ) -> AsyncIterator[str]:
+        """Stream a completion from Claude as text deltas.
+
+        Args:
+            prompt: The user prompt
+            system: Optional system prompt
+            max_tokens: Maximum tokens in response
+            temperature: Sampling temperature
+
+        Yields:
+            Text chunks as they arrive
+        """
+        kwargs = self._build_request_kwargs(
+            [{"role": "user", "content": prompt}],
+            max_tokens=max_tokens or self.max_tokens,
+            temperature=temperature or self.temperature,
+            system=system,
+        )
+
+        async with self.client.messages.stream(**kwargs) as stream:
+            async for text in stream.text_stream:
+                yield text
+            final = await stream.get_final_message()
+
+        self._record_cache_metrics(final.usage)
+
+    @_log_errors("Anthropic thinking stream error")
+    async def stream_think(
+        self,
+        prompt: str,
+        system: str | None = None,
+        budget_tokens: int | None = None,
+        max_tokens: int | None = None,
+    ) -> AsyncIterator[tuple[Literal["text", "thinking"], str]]:
+        """Stream a completion with extended thinking.
+
+        Args:
+            prompt: The user prompt
+            system: Optional system prompt
+            budget_tokens: Thinking budget (1024-128000)
+            max_tokens: Maximum output tokens
+
+        Yields:
+            (kind, chunk) tuples where kind is "thinking" or "text"
+        """
+        if not self.features.extended_thinking:
+            logger.warning("Extended thinking not enabled, falling back to standard")
+            async for text in self.stream_complete(prompt, system, max_tokens):
+                yield "text", text
+            return
+
+        kwargs = self._build_thinking_kwargs(prompt, system, budget_tokens, max_tokens)
+
+        async with self.client.messages.stream(**kwargs) as stream:
+            async for event in stream:
+                if event.type != "content_block_delta":
+                    continue
+                delta = event.delta
+                if delta.type == "text_delta":
+                    yield "text", delta.text
+                elif delta.type == "thinking_delta":
+                    yield "thinking", delta.thinking
+            final = await stream.get_final_message()
+
+        self._record_cache_metrics(final.usage)
 
     # ========================================================================
     # Computer Use Methods
@@ -615,10 +1018,9 @@ class AnthropicClient(BaseLLMProvider):
         """Extract text from content blocks."""
         texts = []
         for block in content:
-            if hasattr(block, "type") and block.type == "text":
-                texts.append(block.text)
-            elif isinstance(block, dict) and block.get("type") == "text":
-                texts.append(block.get("text", ""))
+            text = _TEXT_EXTRACTORS(block)
+            if text is not None:
+                texts.append(text)
         return "".join(texts)
 
     @staticmethod
@@ -626,10 +1028,9 @@ class AnthropicClient(BaseLLMProvider):
         """Extract thinking from content blocks."""
         thinking = []
         for block in content:
-            if hasattr(block, "type") and block.type == "thinking":
-                thinking.append(block.thinking)
-            elif isinstance(block, dict) and block.get("type") == "thinking":
-                thinking.append(block.get("thinking", ""))
+            thought = _THINKING_EXTRACTORS(block)
+            if thought is not None:
+                thinking.append(thought)
         return thinking
 
     @staticmethod
@@ -637,25 +1038,16 @@ class AnthropicClient(BaseLLMProvider):
         """Extract tool use blocks from content."""
         tool_calls = []
         for block in content:
-            if hasattr(block, "type") and block.type == "tool_use":
-                tool_calls.append({
-                    "id": block.id,
-                    "name": block.name,
-                    "input": block.input,
-                })
-            elif isinstance(block, dict) and block.get("type") == "tool_use":
-                tool_calls.append({
-                    "id": block.get("id"),
-                    "name": block.get("name"),
-                    "input": block.get("input"),
-                })
+            call = _TOOL_CALL_EXTRACTORS(block)
+            if call is not None:
+                tool_calls.append(call)
         return tool_calls
 
     # ========================================================================
     # Embeddings (Not Supported)
     # ========================================================================
 
-    async def generate_embeddings(self, text: str) -> list[float]:
+    async def generate_embeddings(self, text: str) -> np.ndarray:
         """Generate embeddings (Anthropic doesn't provide embeddings API).
 
         Note: Anthropic doesn't offer an embeddings API. Consider using:
@@ -679,6 +1071,11 @@ class AnthropicClient(BaseLLMProvider):
         """Get provider name."""
         return "anthropic"
 
+    @property
+    def cache_stats(self) -> dict[str, float]:
+        """Get cumulative prompt cache token counts and hit rate."""
+        return dict(self._cache_stats)
+
     @property
     def model_name(self) -> str:
         """Get current model name."""
@@ -1,22 +1,46 @@
 """
 Base LLM Provider Interface
 
-Abstract base class for all AI model providers (Ollama, Anthropic, etc.)
+Base class for all AI model providers (Ollama, Anthropic, etc.)
 """
 
-from abc import ABC, abstractmethod
 from typing import Any
 
+import numpy as np
 
-class BaseLLMProvider(ABC):
+# Members every concrete provider must define itself
+_REQUIRED_MEMBERS = (
+    "complete",
+    "chat",
+    "generate_embeddings",
+    "provider_name",
+    "model_name",
+)
+
+
+class BaseLLMProvider:
     """
-    Abstract base class for LLM providers.
+    Base class for LLM providers.
 
     All providers (Ollama, Anthropic, Google, etc.) must implement this interface
-    to ensure consistent API across different backends.
+    to ensure consistent API across different backends. Required members are
+    checked once when a subclass is defined rather than through ABCMeta, so
+    a missing or misspelled override fails at import time.
     """
 
-    @abstractmethod
+    def __init_subclass__(cls, **kwargs: Any) -> None:
+        super().__init_subclass__(**kwargs)
+
+        missing = [
+            name
+            for name in _REQUIRED_MEMBERS
+            if getattr(cls, name) is getattr(BaseLLMProvider, name)
+        ]
+        if missing:
+            raise TypeError(
+                f"{cls.__name__} must implement: {', '.join(missing)}"
+            )
+
     async def complete(
         self,
         prompt: str,
@@ -36,9 +60,8 @@ class BaseLLMProvider(ABC):
         Returns:
             The model's response text
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
     async def chat(
         self,
         messages: list[dict[str, str]],
@@ -54,10 +77,9 @@ class BaseLLMProvider(ABC):
         Returns:
             The model's response text
         """
-        pass
+        raise NotImplementedError
 
-    @abstractmethod
-    async def generate_embeddings(self, text: str) -> list[float]:
+    async def generate_embeddings(self, text: str) -> np.ndarray:
         """
         Generate embeddings for text (for RAG/semantic search).
 
@@ -65,9 +87,26 @@ class BaseLLMProvider(ABC):
             text: Text to embed
 
         Returns:
-            Embedding vector (typically 1536 dimensions)
+            1-D float32 embedding vector (typically 1536 dimensions)
+        """
+        raise NotImplementedError
+
+    async def generate_embeddings_batch(self, texts: list[str]) -> np.ndarray:
+        """
+        Generate embeddings for several texts.
+
+        Providers with a multi-input endpoint should override this; the
+        default embeds one text at a time.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 matrix of shape (len(texts), dimensions), rows in input order
         """
-        pass
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+        return np.vstack([await self.generate_embeddings(text) for text in texts])
 
     async def with_tools(
         self,
@@ -94,7 +133,6 @@ class BaseLLMProvider(ABC):
         )
 
     @property
-    @abstractmethod
     def provider_name(self) -> str:
         """
         Get the provider name (e.g., "ollama", "anthropic").
@@ -102,10 +140,9 @@ class BaseLLMProvider(ABC):
         Returns:
             Provider name string
         """
-        pass
+        raise NotImplementedError
 
     @property
-    @abstractmethod
     def model_name(self) -> str:
         """
         Get the current model name.
@@ -113,7 +150,7 @@ class BaseLLMProvider(ABC):
         Returns:
             Model name string
         """
-        pass
+        raise NotImplementedError
 
     @property
     def supports_tools(self) -> bool:
@@ -11,11 +11,40 @@ Features:
 
 from datetime import datetime, time
 from enum import Enum
-from typing import Optional
-from pydantic import BaseModel, Field, field_validator, ConfigDict
+from typing import Annotated, Any, Optional
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict, model_validator
 import re
 
 
+# Precompiled patterns (skip the re module's pattern cache lookup per call)
+_EMAIL_RE = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
+
+# str.translate deletion tables for digit normalisation (C-level, no regex).
+# They cover Latin-1 only; non-ASCII input (U+2009 thin space, U+2011
+# non-breaking hyphen, ...) falls back to the regexes below.
+_NON_DIGIT_RE = re.compile(r'[^\d]')
+_WHITESPACE_RE = re.compile(r'\s')
+_DROP_NON_DIGITS = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(256) if chr(c) not in '0123456789')
+)
+_DROP_WHITESPACE = str.maketrans(
+    '', '', ''.join(chr(c) for c in range(256) if chr(c).isspace())
+)
+
+# ATO ABN weights (applied after subtracting 1 from the first digit)
+_ABN_WEIGHTS = (10, 1, 3, 5, 7, 9, 11, 13, 15, 17, 19)
+
+
+def _as_datetime(value: Any) -> datetime:
+    """Parse an ISO-8601 timestamp as returned by PostgREST."""
+    return value if isinstance(value, datetime) else datetime.fromisoformat(value)
+
+
+def _as_time(value: Any) -> time:
+    """Parse an ISO-8601 time-of-day as returned by PostgREST."""
+    return value if isinstance(value, time) else time.fromisoformat(value)
+
+
 class AvailabilityStatus(str, Enum):
     """Availability status for contractor slots."""
 
@@ -54,10 +83,18 @@ def validate_australian_mobile(phone: str) -> str:
         ValueError: If phone number is invalid
     """
     # Remove all spaces and special characters
-    cleaned = re.sub(r'[^\d]', '', phone)
+    if phone.isascii():
+        cleaned = phone.translate(_DROP_NON_DIGITS)
+    else:
+        cleaned = _NON_DIGIT_RE.sub('', phone)
 
     # Must be 10 digits starting with 04
-    if not re.match(r'^04\d{8}$', cleaned):
+    if not (
+        len(cleaned) == 10
+        and cleaned.startswith('04')
+        and cleaned.isascii()
+        and cleaned.isdigit()
+    ):
         raise ValueError(
             "Australian mobile must be 10 digits starting with 04 "
             "(e.g., 0412 345 678)"
@@ -71,7 +108,7 @@ def validate_australian_abn(abn: str) -> str:
     """
     Validate Australian Business Number (ABN).
 
-    Format: XX XXX XXX XXX (11 digits)
+    Format: XX XXX XXX XXX (11 digits, ATO modulus 89 checksum)
 
     Args:
         abn: ABN to validate
@@ -83,23 +120,59 @@ def validate_australian_abn(abn: str) -> str:
         ValueError: If ABN is invalid
     """
     # Remove all spaces
-    cleaned = re.sub(r'\s', '', abn)
+    if abn.isascii():
+        cleaned = abn.translate(_DROP_WHITESPACE)
+    else:
+        cleaned = _WHITESPACE_RE.sub('', abn)
 
     # Must be 11 digits
-    if not re.match(r'^\d{11}$', cleaned):
+    if not (len(cleaned) == 11 and cleaned.isascii() and cleaned.isdigit()):
         raise ValueError(
             "Australian ABN must be 11 digits "
-            "(e.g., 12 345 678 901)"
+            "(e.g., 51 824 753 556)"
         )
 
+    # ATO weighted modulus 89 checksum (bytes indexing avoids per-char int())
+    digits = cleaned.encode('ascii')
+    total = (digits[0] - 49) * 10
+    for i in range(1, 11):
+        total += (digits[i] - 48) * _ABN_WEIGHTS[i]
+    if total % 89:
+        raise ValueError("Australian ABN checksum is invalid")
+
     # Format as XX XXX XXX XXX
     return f"{cleaned[:2]} {cleaned[2:5]} {cleaned[5:8]} {cleaned[8:]}"
 
 
+def validate_email_address(email: str) -> str:
+    """
+    Validate email address shape.
+
+    Args:
+        email: Email address to validate
+
+    Returns:
+        The email address unchanged
+
+    Raises:
+        ValueError: If email address is malformed
+    """
+    if not _EMAIL_RE.match(email):
+        raise ValueError("Invalid email address (e.g., john@example.com.au)")
+    return email
+
+
+# Validated field types. Wrapping them in Optional lets pydantic-core
+# short-circuit None in Rust, so the Python validator only runs on values.
+AustralianMobile = Annotated[str, AfterValidator(validate_australian_mobile)]
+AustralianABN = Annotated[str, AfterValidator(validate_australian_abn)]
+EmailAddress = Annotated[str, AfterValidator(validate_email_address)]
+
+
 class Location(BaseModel):
     """Australian location with suburb and state."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
 
     suburb: str = Field(
         ...,
@@ -124,11 +197,24 @@ class Location(BaseModel):
         """Format location as 'Suburb, STATE' (Australian standard)."""
         return f"{self.suburb}, {self.state.value}"
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "Location":
+        """
+        Build a location from trusted storage without re-validating.
+
+        See Contractor.from_trusted_dict for the trust boundary.
+        """
+        return cls.model_construct(
+            suburb=data["suburb"],
+            state=AustralianState(data["state"]),
+            postcode=data.get("postcode"),
+        )
+
 
 class AvailabilitySlot(BaseModel):
     """Single availability time slot for a contractor."""
 
-    model_config = ConfigDict(str_strip_whitespace=True)
+    model_config = ConfigDict(str_strip_whitespace=True, frozen=True)
 
     id: Optional[str] = Field(None, description="Unique slot ID")
     date: datetime = Field(
@@ -160,15 +246,30 @@ class AvailabilitySlot(BaseModel):
         description="Additional notes about the slot"
     )
 
-    @field_validator("end_time")
-    @classmethod
-    def validate_end_after_start(cls, v: time, info) -> time:
+    @model_validator(mode="after")
+    def validate_end_after_start(self) -> "AvailabilitySlot":
         """Ensure end time is after start time."""
-        if "start_time" in info.data:
-            start = info.data["start_time"]
-            if v <= start:
-                raise ValueError("End time must be after start time")
-        return v
+        if self.end_time <= self.start_time:
+            raise ValueError("End time must be after start time")
+        return self
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "AvailabilitySlot":
+        """
+        Build a slot from a trusted availability_slots row without re-validating.
+
+        Takes the flat storage shape (suburb/state/postcode columns).
+        See Contractor.from_trusted_dict for the trust boundary.
+        """
+        return cls.model_construct(
+            id=data["id"],
+            date=_as_datetime(data["date"]),
+            start_time=_as_time(data["start_time"]),
+            end_time=_as_time(data["end_time"]),
+            location=Location.from_trusted_dict(data),
+            status=AvailabilityStatus(data["status"]),
+            notes=data.get("notes"),
+        )
 
 
 class ContractorBase(BaseModel):
@@ -183,19 +284,18 @@ class ContractorBase(BaseModel):
         description="Contractor full name",
         examples=["John Smith", "Sarah Johnson"]
     )
-    mobile: str = Field(
+    mobile: AustralianMobile = Field(
         ...,
         description="Australian mobile number (04XX XXX XXX)",
         examples=["0412 345 678", "0423 456 789"]
     )
-    abn: Optional[str] = Field(
+    abn: Optional[AustralianABN] = Field(
         None,
         description="Australian Business Number (XX XXX XXX XXX)",
-        examples=["12 345 678 901", "23 456 789 012"]
+        examples=["51 824 753 556", "53 456 789 012"]
     )
-    email: Optional[str] = Field(
+    email: Optional[EmailAddress] = Field(
         None,
-        pattern=r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$",
         description="Email address",
         examples=["john@example.com.au"]
     )
@@ -206,20 +306,6 @@ class ContractorBase(BaseModel):
         examples=["Water Damage Restoration", "Fire Damage Repair"]
     )
 
-    @field_validator("mobile")
-    @classmethod
-    def validate_mobile_format(cls, v: str) -> str:
-        """Validate and format Australian mobile number."""
-        return validate_australian_mobile(v)
-
-    @field_validator("abn")
-    @classmethod
-    def validate_abn_format(cls, v: Optional[str]) -> Optional[str]:
-        """Validate and format Australian Business Number."""
-        if v is None:
-            return None
-        return validate_australian_abn(v)
-
 
 class ContractorCreate(ContractorBase):
     """Schema for creating a new contractor."""
@@ -233,32 +319,16 @@ class ContractorUpdate(BaseModel):
     model_config = ConfigDict(str_strip_whitespace=True)
 
     name: Optional[str] = Field(None, min_length=2, max_length=100)
-    mobile: Optional[str] = None
-    abn: Optional[str] = None
-    email: Optional[str] = None
+    mobile: Optional[AustralianMobile] = None
+    abn: Optional[AustralianABN] = None
+    email: Optional[EmailAddress] = None
     specialisation: Optional[str] = Field(None, max_length=200)
 
-    @field_validator("mobile")
-    @classmethod
-    def validate_mobile_format(cls, v: Optional[str]) -> Optional[str]:
-        """Validate and format Australian mobile number."""
-        if v is None:
-            return None
-        return validate_australian_mobile(v)
-
-    @field_validator("abn")
-    @classmethod
-    def validate_abn_format(cls, v: Optional[str]) -> Optional[str]:
-        """Validate and format Australian Business Number."""
-        if v is None:
-            return None
-        return validate_australian_abn(v)
-
 
 class Contractor(ContractorBase):
     """Full contractor model with ID and metadata."""
 
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True)
 
     id: str = Field(..., description="Unique contractor ID")
     created_at: datetime = Field(
@@ -274,6 +344,38 @@ class Contractor(ContractorBase):
         description="Contractor's availability slots"
     )
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "Contractor":
+        """
+        Build a contractor from a trusted contractors row without re-validating.
+
+        Trust boundary: only pass rows read back from our own database,
+        which were validated as ContractorCreate/ContractorUpdate on write.
+        The mobile, ABN and email validators are skipped entirely; only
+        PostgREST's string encodings of timestamps are parsed. Never use
+        this for request bodies or third-party data.
+
+        Args:
+            data: Contractor row, optionally with embedded availability_slots rows
+
+        Returns:
+            Contractor instance built with model_construct
+        """
+        return cls.model_construct(
+            id=data["id"],
+            name=data["name"],
+            mobile=data["mobile"],
+            abn=data.get("abn"),
+            email=data.get("email"),
+            specialisation=data.get("specialisation"),
+            created_at=_as_datetime(data["created_at"]),
+            updated_at=_as_datetime(data["updated_at"]),
+            availability_slots=[
+                AvailabilitySlot.from_trusted_dict(slot)
+                for slot in data.get("availability_slots") or ()
+            ],
+        )
+
 
 class ContractorList(BaseModel):
     """Paginated list of contractors."""
@@ -299,6 +401,24 @@ class ContractorList(BaseModel):
         description="Number of items per page"
     )
 
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "ContractorList":
+        """
+        Build a page of contractors from trusted storage without re-validating.
+
+        Contractors may be Contractor instances or raw contractor rows.
+        See Contractor.from_trusted_dict for the trust boundary.
+        """
+        return cls.model_construct(
+            contractors=[
+                c if isinstance(c, Contractor) else Contractor.from_trusted_dict(c)
+                for c in data.get("contractors") or ()
+            ],
+            total=data["total"],
+            page=data["page"],
+            page_size=data["page_size"],
+        )
+
 
 class AvailabilitySlotCreate(BaseModel):
     """Schema for creating a new availability slot."""
@@ -328,15 +448,12 @@ class AvailabilitySlotCreate(BaseModel):
     )
     notes: Optional[str] = Field(None, max_length=500)
 
-    @field_validator("end_time")
-    @classmethod
-    def validate_end_after_start(cls, v: time, info) -> time:
+    @model_validator(mode="after")
+    def validate_end_after_start(self) -> "AvailabilitySlotCreate":
         """Ensure end time is after start time."""
-        if "start_time" in info.data:
-            start = info.data["start_time"]
-            if v <= start:
-                raise ValueError("End time must be after start time")
-        return v
+        if self.end_time <= self.start_time:
+            raise ValueError("End time must be after start time")
+        return self
 
 
 class ErrorResponse(BaseModel):
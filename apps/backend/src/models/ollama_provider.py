@@ -8,6 +8,8 @@ Runs models locally without requiring API keys.
 from typing import Any
 
 import httpx
+import numpy as np
+import orjson
 
 from src.config import get_settings
 from src.utils import get_logger
@@ -16,6 +18,9 @@ from .base_provider import BaseLLMProvider
 settings = get_settings()
 logger = get_logger(__name__)
 
+_LOCAL_HOSTS = frozenset({"localhost", "127.0.0.1", "::1"})
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class OllamaProvider(BaseLLMProvider):
     """
@@ -52,6 +57,53 @@ class OllamaProvider(BaseLLMProvider):
         self.max_tokens = settings.max_tokens
         self.temperature = settings.temperature
 
+        # Shared sampling options for calls that don't override them.
+        # Treated as read-only; overrides build their own dict.
+        self._default_options = {
+            "temperature": self.temperature,
+            "num_predict": self.max_tokens,
+        }
+
+        # One pooled client per provider so keep-alive connections are reused.
+        # Short connect timeout keeps the "Ollama not running" error fast.
+        # Local Ollama serves uncompressed; skip gzip negotiation there.
+        headers = (
+            {"Accept-Encoding": "identity"}
+            if httpx.URL(self.base_url).host in _LOCAL_HOSTS
+            else None
+        )
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            timeout=httpx.Timeout(120.0, connect=5.0),
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            headers=headers,
+        )
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self._client.aclose()
+
+    def _options(
+        self,
+        temperature: float | None,
+        max_tokens: int | None,
+    ) -> dict[str, Any]:
+        """Sampling options, reusing the shared defaults when not overridden."""
+        if temperature is None and max_tokens is None:
+            return self._default_options
+        return {
+            "temperature": self.temperature if temperature is None else temperature,
+            "num_predict": max_tokens or self.max_tokens,
+        }
+
+    async def _post_json(self, path: str, payload: dict[str, Any]) -> httpx.Response:
+        """POST a payload encoded with orjson instead of httpx's stdlib json."""
+        return await self._client.post(
+            path,
+            content=orjson.dumps(payload),
+            headers=_JSON_HEADERS,
+        )
+
     async def complete(
         self,
         prompt: str,
@@ -72,29 +124,22 @@ class OllamaProvider(BaseLLMProvider):
             The model's response text
         """
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                payload = {
-                    "model": self.model,
-                    "prompt": prompt,
-                    "stream": False,
-                    "options": {
-                        "temperature": temperature or self.temperature,
-                        "num_predict": max_tokens or self.max_tokens,
-                    },
-                }
-
-                if system:
-                    payload["system"] = system
-
-                response = await client.post(
-                    f"{self.base_url}/api/generate",
-                    json=payload,
-                )
-
-                response.raise_for_status()
-                result = response.json()
-
-                return result.get("response", "")
+            payload = {
+                "model": self.model,
+                "prompt": prompt,
+                "stream": False,
+                "options": self._options(temperature, max_tokens),
+            }
+
+            if system:
+                payload["system"] = system
+
+            response = await self._post_json("/api/generate", payload)
+
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            return result.get("response", "")
 
         except httpx.ConnectError:
             error_msg = (
@@ -123,41 +168,28 @@ class OllamaProvider(BaseLLMProvider):
             The model's response text
         """
         try:
-            async with httpx.AsyncClient(timeout=120.0) as client:
-                # Convert messages to Ollama format
-                ollama_messages = []
-                for msg in messages:
-                    ollama_messages.append({
-                        "role": msg["role"],
-                        "content": msg["content"],
-                    })
-
-                payload = {
-                    "model": self.model,
-                    "messages": ollama_messages,
-                    "stream": False,
-                    "options": {
-                        "temperature": self.temperature,
-                        "num_predict": self.max_tokens,
-                    },
-                }
-
-                if system:
-                    # Add system message as first message
-                    payload["messages"].insert(0, {
-                        "role": "system",
-                        "content": system,
-                    })
-
-                response = await client.post(
-                    f"{self.base_url}/api/chat",
-                    json=payload,
-                )
-
-                response.raise_for_status()
-                result = response.json()
-
-                return result.get("message", {}).get("content", "")
+            # Convert messages to Ollama format, system message first
+            ollama_messages = (
+                [{"role": "system", "content": system}] if system else []
+            )
+            ollama_messages.extend(
+                {"role": msg["role"], "content": msg["content"]}
+                for msg in messages
+            )
+
+            payload = {
+                "model": self.model,
+                "messages": ollama_messages,
+                "stream": False,
+                "options": self._default_options,
+            }
+
+            response = await self._post_json("/api/chat", payload)
+
+            response.raise_for_status()
+            result = orjson.loads(response.content)
+
+            return result.get("message", {}).get("content", "")
 
         except httpx.ConnectError:
             error_msg = (
@@ -170,7 +202,7 @@ class OllamaProvider(BaseLLMProvider):
             logger.error("Ollama chat error", error=str(e))
             raise
 
-    async def generate_embeddings(self, text: str) -> list[float]:
+    async def generate_embeddings(self, text: str) -> np.ndarray:
         """
         Generate embeddings using Ollama.
 
@@ -178,22 +210,42 @@ class OllamaProvider(BaseLLMProvider):
             text: Text to embed
 
         Returns:
-            Embedding vector
+            1-D float32 embedding vector
+        """
+        embeddings = await self.generate_embeddings_batch([text])
+        return embeddings[0] if len(embeddings) else np.empty(0, dtype=np.float32)
+
+    async def generate_embeddings_batch(self, texts: list[str]) -> np.ndarray:
+        """
+        Generate embeddings for many texts in one request.
+
+        Uses Ollama's /api/embed endpoint, which accepts a list of inputs,
+        so N texts cost one HTTP round trip and one model activation.
+
+        Args:
+            texts: Texts to embed
+
+        Returns:
+            float32 matrix of shape (len(texts), dimensions), rows in input order
         """
+        if not texts:
+            return np.empty((0, 0), dtype=np.float32)
+
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    f"{self.base_url}/api/embeddings",
-                    json={
-                        "model": self.embedding_model,
-                        "prompt": text,
-                    },
-                )
+            response = await self._client.post(
+                "/api/embed",
+                content=orjson.dumps({
+                    "model": self.embedding_model,
+                    "input": texts,
+                }),
+                headers=_JSON_HEADERS,
+                timeout=60.0,
+            )
 
-                response.raise_for_status()
-                result = response.json()
+            response.raise_for_status()
+            result = orjson.loads(response.content)
 
-                return result.get("embedding", [])
+            return np.asarray(result.get("embeddings", []), dtype=np.float32)
 
         except httpx.ConnectError:
             error_msg = (
@@ -229,9 +281,8 @@ class OllamaProvider(BaseLLMProvider):
             True if Ollama is running, False otherwise
         """
         try:
-            async with httpx.AsyncClient(timeout=5.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                return response.status_code == 200
+            response = await self._client.get("/api/tags", timeout=5.0)
+            return response.status_code == 200
         except Exception:
             return False
 
@@ -243,12 +294,11 @@ class OllamaProvider(BaseLLMProvider):
             List of model names
         """
         try:
-            async with httpx.AsyncClient(timeout=10.0) as client:
-                response = await client.get(f"{self.base_url}/api/tags")
-                response.raise_for_status()
-                result = response.json()
+            response = await self._client.get("/api/tags", timeout=10.0)
+            response.raise_for_status()
+            result = orjson.loads(response.content)
 
-                return [model["name"] for model in result.get("models", [])]
+            return [model["name"] for model in result.get("models", [])]
         except Exception as e:
             logger.error("Failed to list Ollama models", error=str(e))
             return []
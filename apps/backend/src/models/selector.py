@@ -19,7 +19,8 @@ class ModelSelector:
     """Selects and instantiates the appropriate model client."""
 
     def __init__(self) -> None:
-        self._clients: dict[str, BaseLLMProvider] = {}
+        # Keyed by (provider, tier); tuples hash without building a key string
+        self._clients: dict[tuple[str, str], BaseLLMProvider] = {}
 
     def get_client(
         self,
@@ -39,15 +40,24 @@ class ModelSelector:
         if provider is None:
             provider = self._get_default_provider()
 
-        cache_key = f"{provider}:{tier}"
+        cache_key = (provider, tier)
 
-        if cache_key in self._clients:
-            return self._clients[cache_key]
+        client = self._clients.get(cache_key)
+        if client is not None:
+            return client
 
         client = self._create_client(provider, tier)
         self._clients[cache_key] = client
         return client
 
+    async def aclose(self) -> None:
+        """Close pooled connections held by cached clients."""
+        for client in self._clients.values():
+            aclose = getattr(client, "aclose", None)
+            if aclose is not None:
+                await aclose()
+        self._clients.clear()
+
     def _get_default_provider(self) -> ModelProvider:
         """
         Get default provider from settings.
@@ -197,22 +197,23 @@ class AgentMetrics:
 
     async def track_iteration_count(
         self,
-        task_id: str,
+        run_id: str,
         iterations: int
     ) -> dict[str, float]:
-        """Track iteration count for a task.
+        """Track iteration count for an agent run.
 
         Args:
-            task_id: Task identifier
+            run_id: ID of the agent run (agent_runs.id)
             iterations: Number of iterations needed
 
         Returns:
             Statistics about iteration counts
         """
-        # Store iteration count
-        self.client.table("agent_runs").update(
-            {"metadata": {"iterations": iterations}}
-        ).eq("id", task_id).execute()
+        # Merge into the run's metadata in one UPDATE (keeps the stored metrics),
+        # written now so the average below includes it
+        await self.store.update_agent_run(
+            run_id, metadata={"iterations": iterations}, flush=True
+        )
 
         # Get average iterations across all tasks
         results = self.client.table("agent_runs").select("metadata").execute()
@@ -1,17 +1,81 @@
 """Document chunking strategies."""
 
+import asyncio
 import hashlib
+import time
 from abc import ABC, abstractmethod
+from functools import lru_cache
 from typing import Any
 
+import tiktoken
+
 from src.rag.models import ChunkingStrategy
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Encoding used by OpenAI's embedding and chat models
+TOKENIZER_ENCODING = "cl100k_base"
+TOKENIZER_THREADS = 8
+TOKENIZER_RETRY_SECONDS = 300.0
+
+
+@lru_cache(maxsize=1024)
+def _sha256_hex(content: str) -> str:
+    """SHA256 hex digest, memoised for repeated boilerplate chunks."""
+    return hashlib.sha256(content.encode(), usedforsecurity=False).hexdigest()
+
+
+_encoding: tiktoken.Encoding | None = None
+_encoding_retry_at = 0.0
+
+
+def _get_encoding() -> tiktoken.Encoding | None:
+    """
+    Load the BPE encoder; None while its vocabulary can't be fetched.
+
+    A loaded encoder is kept for the life of the process. After a failed
+    load (the vocabulary is downloaded on first use) the load is retried
+    at most once every TOKENIZER_RETRY_SECONDS.
+    """
+    global _encoding, _encoding_retry_at
+    if _encoding is None and time.monotonic() >= _encoding_retry_at:
+        try:
+            _encoding = tiktoken.get_encoding(TOKENIZER_ENCODING)
+        except Exception as e:
+            _encoding_retry_at = time.monotonic() + TOKENIZER_RETRY_SECONDS
+            logger.warning(
+                "Tokenizer unavailable, estimating token counts",
+                error=str(e),
+                retry_in_seconds=TOKENIZER_RETRY_SECONDS,
+            )
+    return _encoding
+
+
+def count_tokens(texts: list[str]) -> list[int]:
+    """
+    Exact BPE token counts for a batch of texts.
+
+    encode_batch runs in tiktoken's Rust core across TOKENIZER_THREADS
+    threads without the GIL. Special-token text such as "<|endoftext|>"
+    is counted as ordinary text rather than rejected. Falls back to the
+    4-chars-per-token estimate when the encoder can't be loaded.
+    """
+    encoding = _get_encoding()
+    if encoding is None:
+        return [Chunker.estimate_tokens(text) for text in texts]
+
+    token_lists = encoding.encode_batch(
+        texts, num_threads=TOKENIZER_THREADS, disallowed_special=()
+    )
+    return [len(tokens) for tokens in token_lists]
 
 
 class Chunker(ABC):
     """Abstract base for chunking strategies."""
 
     @abstractmethod
-    async def chunk(
+    def chunk(
         self,
         text: str,
         config: dict[str, Any],
@@ -33,13 +97,47 @@ class Chunker(ABC):
         """
         pass
 
-    def estimate_tokens(self, text: str) -> int:
+    def chunk_batch(
+        self,
+        texts: list[str],
+        config: dict[str, Any],
+        structures: list[list[dict[str, Any]] | None] | None = None,
+    ) -> list[list[dict[str, Any]]]:
+        """
+        Chunk several documents with this one chunker instance.
+
+        Returns:
+            One list of chunks per input text, in input order
+        """
+        if structures is None:
+            structures = [None] * len(texts)
+        return [
+            self.chunk(text, config, structure)
+            for text, structure in zip(texts, structures, strict=True)
+        ]
+
+    async def chunk_async(
+        self,
+        text: str,
+        config: dict[str, Any],
+        structure: list[dict[str, Any]] | None = None,
+    ) -> list[dict[str, Any]]:
+        """
+        Run chunk() in a worker thread.
+
+        Large documents take long enough to chunk that doing it inline
+        would stall every other request on the event loop.
+        """
+        return await asyncio.to_thread(self.chunk, text, config, structure)
+
+    @staticmethod
+    def estimate_tokens(text: str) -> int:
         """Rough token estimation (1 token ~= 4 chars)."""
-        return len(text) // 4
+        return len(text) >> 2
 
     def calculate_hash(self, content: str) -> str:
         """Calculate SHA256 hash of content."""
-        return hashlib.sha256(content.encode()).hexdigest()
+        return _sha256_hex(content)
 
 
 class ParentChildChunker(Chunker):
@@ -49,7 +147,7 @@ class ParentChildChunker(Chunker):
     Creates small child chunks for retrieval and large parent chunks for context.
     """
 
-    async def chunk(
+    def chunk(
         self,
         text: str,
         config: dict[str, Any],
@@ -60,81 +158,95 @@ class ParentChildChunker(Chunker):
         overlap = config.get("chunk_overlap", 50)
 
         chunks: list[dict[str, Any]] = []
+        append = chunks.append
+        estimate_tokens = self.estimate_tokens
 
-        # Create parent chunks
+        # Create parent chunks (loop bounds hoisted out of the hot loop)
         parent_char_size = parent_size * 4
+        text_len = len(text)
         start = 0
-        parent_index = 0
+        index = 0
 
-        while start < len(text):
-            end = min(start + parent_char_size, len(text))
+        while start < text_len:
+            end = start + parent_char_size
+            if end > text_len:
+                end = text_len
             parent_text = text[start:end]
 
-            parent_chunk_dict = {
-                "content": parent_text,
-                "chunk_index": len(chunks),
-                "chunk_level": 1,  # Parent
-                "parent_index": None,
-                "token_count": self.estimate_tokens(parent_text),
-                "metadata": {
-                    "start_char": start,
-                    "end_char": end,
-                    "is_parent": True,
-                },
-            }
-
-            parent_actual_index = len(chunks)
-            chunks.append(parent_chunk_dict)
+            append(
+                {
+                    "content": parent_text,
+                    "chunk_index": index,
+                    "chunk_level": 1,  # Parent
+                    "parent_index": None,
+                    "token_count": estimate_tokens(parent_text),
+                    "metadata": {
+                        "start_char": start,
+                        "end_char": end,
+                        "is_parent": True,
+                    },
+                }
+            )
 
-            # Create child chunks within this parent
-            child_chunks = await self._create_child_chunks(
-                parent_text, child_size, overlap, parent_actual_index
+            # Create child chunks within this parent, directly into chunks
+            index = self._create_child_chunks(
+                parent_text, child_size, overlap, index, chunks
             )
-            chunks.extend(child_chunks)
 
             start = end
-            parent_index += 1
 
         return chunks
 
-    async def _create_child_chunks(
+    def _create_child_chunks(
         self,
         parent_text: str,
         child_size: int,
         overlap: int,
         parent_chunk_index: int,
-    ) -> list[dict[str, Any]]:
-        """Create child chunks within a parent chunk."""
+        chunks: list[dict[str, Any]],
+    ) -> int:
+        """
+        Append child chunks within a parent chunk to chunks.
+
+        Returns:
+            chunk_index for the next chunk appended after these children
+        """
         child_char_size = child_size * 4
         overlap_chars = overlap * 4
+        append = chunks.append
+        estimate_tokens = self.estimate_tokens
 
-        chunks = []
+        parent_len = len(parent_text)
+        index = parent_chunk_index + 1
         start = 0
 
-        while start < len(parent_text):
-            end = min(start + child_char_size, len(parent_text))
+        while start < parent_len:
+            end = start + child_char_size
+            if end > parent_len:
+                end = parent_len
             child_text = parent_text[start:end]
 
-            chunks.append(
+            append(
                 {
                     "content": child_text,
-                    "chunk_index": 0,  # Will be set when added to main list
+                    "chunk_index": index,
                     "chunk_level": 0,  # Child
                     "parent_index": parent_chunk_index,
-                    "token_count": self.estimate_tokens(child_text),
+                    "token_count": estimate_tokens(child_text),
                     "metadata": {"parent_chunk_index": parent_chunk_index, "is_child": True},
                 }
             )
+            index += 1
 
-            start = end - overlap_chars if end < len(parent_text) else end
+            start = end - overlap_chars if end < parent_len else end
 
-        return chunks
+        return index
 
 
 class FixedSizeChunker(Chunker):
     """Fixed-size chunking with overlap."""
 
-    async def chunk(
+    def chunk(
         self,
         text: str,
         config: dict[str, Any],
@@ -147,39 +259,48 @@ class FixedSizeChunker(Chunker):
         overlap_chars = overlap * 4
 
         chunks = []
+        append = chunks.append
+        estimate_tokens = self.estimate_tokens
+        text_len = len(text)
         start = 0
         index = 0
 
-        while start < len(text):
-            end = min(start + chunk_chars, len(text))
+        while start < text_len:
+            end = start + chunk_chars
+            if end > text_len:
+                end = text_len
             chunk_text = text[start:end]
 
-            chunks.append(
+            append(
                 {
                     "content": chunk_text,
                     "chunk_index": index,
                     "chunk_level": 0,
                     "parent_index": None,
-                    "token_count": self.estimate_tokens(chunk_text),
+                    "token_count": estimate_tokens(chunk_text),
                     "metadata": {"start_char": start, "end_char": end},
                 }
             )
 
-            start = end - overlap_chars if end < len(text) else end
+            start = end - overlap_chars if end < text_len else end
             index += 1
 
         return chunks
 
 
+# Chunkers are stateless, so one shared instance per strategy
+_FIXED_SIZE_CHUNKER = FixedSizeChunker()
+_PARENT_CHILD_CHUNKER = ParentChildChunker()
+
+_CHUNKERS: dict[ChunkingStrategy, Chunker] = {
+    ChunkingStrategy.FIXED_SIZE: _FIXED_SIZE_CHUNKER,
+    ChunkingStrategy.PARENT_CHILD: _PARENT_CHILD_CHUNKER,
+    ChunkingStrategy.SEMANTIC: _FIXED_SIZE_CHUNKER,  # Fallback to fixed size
+    ChunkingStrategy.CODE_AWARE: _FIXED_SIZE_CHUNKER,  # Fallback to fixed size
+    ChunkingStrategy.RECURSIVE: _FIXED_SIZE_CHUNKER,  # Fallback to fixed size
+}
+
+
 def get_chunker(strategy: ChunkingStrategy) -> Chunker:
     """Get chunker for strategy."""
-    chunkers = {
-        ChunkingStrategy.FIXED_SIZE: FixedSizeChunker,
-        ChunkingStrategy.PARENT_CHILD: ParentChildChunker,
-        ChunkingStrategy.SEMANTIC: FixedSizeChunker,  # Fallback to fixed size
-        ChunkingStrategy.CODE_AWARE: FixedSizeChunker,  # Fallback to fixed size
-        ChunkingStrategy.RECURSIVE: FixedSizeChunker,  # Fallback to fixed size
-    }
-
-    chunker_class = chunkers.get(strategy, ParentChildChunker)
-    return chunker_class()
+    return _CHUNKERS.get(strategy, _PARENT_CHILD_CHUNKER)
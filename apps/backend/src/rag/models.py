@@ -4,7 +4,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel, Field
+import orjson
+from pydantic import BaseModel, Field, field_validator, model_validator
 
 
 class SourceType(str, Enum):
@@ -46,6 +47,13 @@ class SearchType(str, Enum):
     HYBRID = "hybrid"
 
 
+class FusionMethod(str, Enum):
+    """How hybrid search combines its retrieval signals."""
+
+    WEIGHTED = "weighted"  # vector_weight * cosine + keyword_weight * ts_rank
+    RRF = "rrf"  # Reciprocal Rank Fusion of vector, keyword and trigram ranks
+
+
 class DocumentUploadRequest(BaseModel):
     """Request to upload a document."""
 
@@ -74,6 +82,13 @@ class PipelineConfig(BaseModel):
     generate_embeddings: bool = True
     generate_keywords: bool = True
 
+    @model_validator(mode="after")
+    def validate_overlap_below_size(self) -> "PipelineConfig":
+        """Ensure chunk overlap is smaller than the chunk, so chunking advances."""
+        if self.chunk_overlap >= self.chunk_size:
+            raise ValueError("chunk_overlap must be smaller than chunk_size")
+        return self
+
 
 class DocumentSource(BaseModel):
     """Document source record."""
@@ -118,6 +133,28 @@ class DocumentChunk(BaseModel):
     created_at: str
     updated_at: str
 
+    @field_validator("embedding", mode="before")
+    @classmethod
+    def parse_vector_literal(cls, value: Any) -> Any:
+        """PostgREST returns pgvector columns as "[0.1,0.2,...]" text."""
+        if isinstance(value, str):
+            return orjson.loads(value)
+        return value
+
+    @classmethod
+    def from_trusted_dict(cls, data: dict[str, Any]) -> "DocumentChunk":
+        """
+        Build a chunk from a document_chunks row without re-validating.
+
+        Rows were validated on the way in, so only the embedding text is
+        decoded; columns the model doesn't declare are dropped. Use the
+        normal constructor for anything that didn't come from our own
+        table.
+        """
+        return cls.model_construct(
+            **{**data, "embedding": cls.parse_vector_literal(data.get("embedding"))}
+        )
+
 
 class SearchRequest(BaseModel):
     """Search request."""
@@ -131,6 +168,7 @@ class SearchRequest(BaseModel):
     vector_weight: float = 0.6
     keyword_weight: float = 0.4
     min_score: float = 0.5
+    fusion: FusionMethod = FusionMethod.WEIGHTED
     enable_reranking: bool = True
 
 
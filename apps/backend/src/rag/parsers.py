@@ -5,11 +5,66 @@ from abc import ABC, abstractmethod
 from typing import Any
 
 
+def scan_headings(text: str) -> list[dict[str, Any]]:
+    """
+    Find ATX headings (``#`` to ``######`` followed by a space or tab).
+
+    Equivalent to ``re.finditer(r"^(#{1,6})[ \\t]+(.+)$", text, re.MULTILINE)``
+    but jumps between candidate lines with ``str.find("\\n#")``, so lines
+    that don't start with ``#`` are never visited in Python.
+
+    Returns:
+        [{"level": int, "text": str, "position": int}, ...] in document order
+    """
+    structure = []
+    text_len = len(text)
+
+    if text.startswith("#"):
+        start = 0
+    else:
+        start = text.find("\n#")
+        start = start + 1 if start != -1 else -1
+
+    while start != -1:
+        line_end = text.find("\n", start)
+        if line_end == -1:
+            line_end = text_len
+
+        # Count up to 7 hashes; 7 means "not a heading"
+        i = start
+        hash_limit = min(start + 7, line_end)
+        while i < hash_limit and text[i] == "#":
+            i += 1
+
+        if i - start <= 6 and i < line_end and text[i] in " \t":
+            k = i + 1
+            while k < line_end and text[k] in " \t":
+                k += 1
+            if k < line_end:
+                heading_text = text[k:line_end]
+            elif k - i >= 2:
+                # Whitespace-only title: the regex backtracks to keep one char
+                heading_text = text[line_end - 1:line_end]
+            else:
+                heading_text = None
+
+            if heading_text is not None:
+                structure.append(
+                    {"level": i - start, "text": heading_text, "position": start}
+                )
+
+        start = text.find("\n#", line_end)
+        if start != -1:
+            start += 1
+
+    return structure
+
+
 class DocumentParser(ABC):
     """Abstract base for document parsers."""
 
     @abstractmethod
-    async def parse(self, content: bytes, metadata: dict[str, Any]) -> dict[str, Any]:
+    def parse_sync(self, content: bytes, metadata: dict[str, Any]) -> dict[str, Any]:
         """
         Parse document content.
 
@@ -22,15 +77,23 @@ class DocumentParser(ABC):
         """
         pass
 
+    async def parse(self, content: bytes, metadata: dict[str, Any]) -> dict[str, Any]:
+        """Parse document content (see parse_sync)."""
+        return self.parse_sync(content, metadata)
+
     def calculate_hash(self, content: bytes) -> str:
-        """Calculate SHA256 hash of content."""
-        return hashlib.sha256(content).hexdigest()
+        """Calculate SHA256 hash of content.
+
+        Dedup fingerprint, not a security primitive. hashlib's OpenSSL
+        backend already uses SHA-NI where the CPU supports it.
+        """
+        return hashlib.sha256(content, usedforsecurity=False).hexdigest()
 
 
 class PlainTextParser(DocumentParser):
     """Parser for plain text files."""
 
-    async def parse(self, content: bytes, metadata: dict[str, Any]) -> dict[str, Any]:
+    def parse_sync(self, content: bytes, metadata: dict[str, Any]) -> dict[str, Any]:
         text = content.decode("utf-8")
         return {"text": text, "metadata": metadata, "structure": []}
 
@@ -38,29 +101,24 @@ class PlainTextParser(DocumentParser):
 class MarkdownParser(DocumentParser):
     """Parser for Markdown files."""
 
-    async def parse(self, content: bytes, metadata: dict[str, Any]) -> dict[str, Any]:
+    def parse_sync(self, content: bytes, metadata: dict[str, Any]) -> dict[str, Any]:
         text = content.decode("utf-8")
 
-        # Extract headings using regex
-        import re
-
-        structure = []
-        for match in re.finditer(r"^(#{1,6})\s+(.+)$", text, re.MULTILINE):
-            level = len(match.group(1))
-            heading_text = match.group(2)
-            structure.append(
-                {"level": level, "text": heading_text, "position": match.start()}
-            )
+        # Extract headings with the line scanner; a memchr over the raw
+        # bytes skips the scan for documents without a single "#"
+        structure = scan_headings(text) if b"#" in content else []
 
         return {"text": text, "metadata": metadata, "structure": structure}
 
 
+# Parsers are stateless, so one shared instance per MIME type
+_PARSERS: dict[str, DocumentParser] = {
+    "text/plain": PlainTextParser(),
+    "text/markdown": MarkdownParser(),
+}
+
+
 def get_parser(mime_type: str) -> DocumentParser:
-    """Get parser for MIME type."""
-    parsers = {
-        "text/plain": PlainTextParser,
-        "text/markdown": MarkdownParser,
-    }
-
-    parser_class = parsers.get(mime_type, PlainTextParser)
-    return parser_class()
+    """Get parser for MIME type (parameters such as charset are ignored)."""
+    media_type = mime_type.partition(";")[0].strip().lower()
+    return _PARSERS.get(media_type) or _PARSERS["text/plain"]
@@ -1,5 +1,8 @@
 """RAG pipeline orchestrator."""
 
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from typing import Any
 
 from src.rag.chunkers import get_chunker
@@ -10,18 +13,107 @@ from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Documents smaller than this are parsed inline; pickling them to a worker
+# process would cost more than the parse itself
+CPU_POOL_MIN_BYTES = 64 * 1024
+
+
+def _parse_chunk_hash_batch(
+    documents: list[tuple[bytes, str, dict[str, Any]]],
+    config: PipelineConfig,
+) -> list[list[dict[str, Any]]]:
+    """
+    Parse, chunk and hash (content, mime_type, metadata) documents.
+
+    Pure CPU work with no reference to the pipeline, so it can run in a
+    worker process. One chunker instance handles every document.
+
+    Returns:
+        One list of chunks per document, as produced by the chunker,
+        plus "content_hash"
+    """
+    parsed = [
+        get_parser(mime_type).parse_sync(content, metadata)
+        for content, mime_type, metadata in documents
+    ]
+
+    chunker = get_chunker(config.chunking_strategy)
+    batches = chunker.chunk_batch(
+        [doc["text"] for doc in parsed],
+        config={
+            "chunk_size": config.chunk_size,
+            "chunk_overlap": config.chunk_overlap,
+            "parent_chunk_size": config.parent_chunk_size,
+        },
+        structures=[doc.get("structure", []) for doc in parsed],
+    )
+
+    for chunks in batches:
+        for chunk in chunks:
+            chunk["content_hash"] = chunker.calculate_hash(chunk["content"])
+
+    return batches
+
 
 class RAGPipeline:
     """Orchestrates document ingestion pipeline."""
 
     def __init__(self) -> None:
         self.store = RAGStore()
+        # Workers start on first use; spawn avoids forking a threaded server
+        self._cpu_pool = ProcessPoolExecutor(
+            mp_context=multiprocessing.get_context("spawn")
+        )
 
     async def initialize(self) -> None:
         """Initialize pipeline components."""
         await self.store.initialize()
         logger.info("RAG pipeline initialized")
 
+    async def close(self) -> None:
+        """Shut down the parse/chunk worker processes and store clients."""
+        self._cpu_pool.shutdown(wait=False, cancel_futures=True)
+        await self.store.aclose()
+
+    async def _run_cpu_stage(
+        self,
+        documents: list[tuple[bytes, str, dict[str, Any]]],
+        config: PipelineConfig,
+    ) -> list[list[dict[str, Any]]]:
+        """Run the CPU stage, in the worker pool unless the input is small."""
+        if sum(len(content) for content, _, _ in documents) < CPU_POOL_MIN_BYTES:
+            return _parse_chunk_hash_batch(documents, config)
+
+        return await asyncio.get_running_loop().run_in_executor(
+            self._cpu_pool, _parse_chunk_hash_batch, documents, config
+        )
+
+    @staticmethod
+    def _chunk_rows(
+        chunks: list[dict[str, Any]],
+        source_id: str,
+        project_id: str,
+        user_id: str | None,
+        config: PipelineConfig,
+    ) -> list[dict[str, Any]]:
+        """Build document_chunks rows for one source."""
+        return [
+            {
+                "source_id": source_id,
+                "project_id": project_id,
+                "user_id": user_id,
+                "chunk_index": i,
+                "chunk_level": chunk["chunk_level"],
+                "parent_chunk_id": None,  # Will be resolved if needed
+                "content": chunk["content"],
+                "content_hash": chunk["content_hash"],
+                "token_count": chunk["token_count"],
+                "metadata": chunk.get("metadata", {}),
+                "generate_embedding": config.generate_embeddings,
+            }
+            for i, chunk in enumerate(chunks)
+        ]
+
     async def process_document(
         self,
         content: bytes,
@@ -56,53 +148,24 @@ class RAGPipeline:
             # Update status to processing
             await self.store.update_source_status(source_id, ProcessingStatus.PROCESSING)
 
-            # 2. Parse document
-            logger.info("Parsing document", source_id=source_id, mime_type=mime_type)
-            parser = get_parser(mime_type)
-            parsed = await parser.parse(content, metadata or {})
-
-            text = parsed["text"]
-            structure = parsed.get("structure", [])
-
-            # 3. Chunk document
+            # 2-3. Parse, chunk and hash the document
             logger.info(
-                "Chunking document",
+                "Parsing and chunking document",
                 source_id=source_id,
+                mime_type=mime_type,
                 strategy=config.chunking_strategy,
             )
-            chunker = get_chunker(config.chunking_strategy)
-            chunks = await chunker.chunk(
-                text=text,
-                config={
-                    "chunk_size": config.chunk_size,
-                    "chunk_overlap": config.chunk_overlap,
-                    "parent_chunk_size": config.parent_chunk_size,
-                },
-                structure=structure,
+            (chunks,) = await self._run_cpu_stage(
+                [(content, mime_type, metadata or {})], config
             )
 
             logger.info("Created chunks", count=len(chunks), source_id=source_id)
 
             # 4. Prepare chunks for storage
-            chunk_data = []
-            for i, chunk in enumerate(chunks):
-                chunk_dict = {
-                    "source_id": source_id,
-                    "project_id": project_id,
-                    "user_id": user_id,
-                    "chunk_index": i,
-                    "chunk_level": chunk["chunk_level"],
-                    "parent_chunk_id": None,  # Will be resolved if needed
-                    "content": chunk["content"],
-                    "content_hash": chunker.calculate_hash(chunk["content"]),
-                    "token_count": chunk["token_count"],
-                    "metadata": chunk.get("metadata", {}),
-                    "generate_embedding": config.generate_embeddings,
-                }
-                chunk_data.append(chunk_dict)
+            chunk_data = self._chunk_rows(chunks, source_id, project_id, user_id, config)
 
             # 5. Store chunks
-            await self.store.batch_create_chunks(chunk_data)
+            await self.store.batch_create_chunks(chunk_data, raw=True)
 
             # 6. Update source status
             await self.store.update_source_status(source_id, ProcessingStatus.COMPLETED)
@@ -124,3 +187,83 @@ class RAGPipeline:
                     error_message=str(e),
                 )
             raise
+
+    async def process_documents(
+        self,
+        documents: list[dict[str, Any]],
+        project_id: str,
+        config: PipelineConfig,
+        user_id: str | None = None,
+    ) -> list[str]:
+        """
+        Process several documents as one batch.
+
+        Each document is a dict with "content", "mime_type", "source_uri"
+        and optional "metadata". Parsing and chunking run in a single
+        worker call, and all chunks are stored through one
+        batch_create_chunks, so per-document overhead is paid once. The
+        batch succeeds or fails as a whole.
+
+        Returns:
+            source_ids in input order
+        """
+        source_ids: list[str] = []
+
+        try:
+            # 1. Create source records
+            for doc in documents:
+                source = await self.store.create_source(
+                    project_id=project_id,
+                    source_type=SourceType.UPLOAD.value,
+                    source_uri=doc["source_uri"],
+                    user_id=user_id,
+                    mime_type=doc["mime_type"],
+                    file_size_bytes=len(doc["content"]),
+                    metadata=doc.get("metadata") or {},
+                )
+                source_ids.append(source.id)
+                await self.store.update_source_status(source.id, ProcessingStatus.PROCESSING)
+
+            # 2-3. Parse, chunk and hash every document together
+            logger.info(
+                "Parsing and chunking documents",
+                count=len(documents),
+                strategy=config.chunking_strategy,
+            )
+            batches = await self._run_cpu_stage(
+                [
+                    (doc["content"], doc["mime_type"], doc.get("metadata") or {})
+                    for doc in documents
+                ],
+                config,
+            )
+
+            # 4-5. Store all chunks in one batch
+            chunk_data: list[dict[str, Any]] = []
+            for source_id, chunks in zip(source_ids, batches, strict=True):
+                chunk_data.extend(
+                    self._chunk_rows(chunks, source_id, project_id, user_id, config)
+                )
+            await self.store.batch_create_chunks(chunk_data, raw=True)
+
+            # 6. Update source statuses
+            for source_id in source_ids:
+                await self.store.update_source_status(source_id, ProcessingStatus.COMPLETED)
+
+            logger.info(
+                "Batch processing completed",
+                documents=len(documents),
+                chunks_created=len(chunk_data),
+            )
+
+            return source_ids
+
+        except Exception as e:
+            logger.error("Batch pipeline processing failed", error=str(e), source_ids=source_ids)
+            for source_id in source_ids:
+                await self.store.update_source_status(
+                    source_id,
+                    ProcessingStatus.FAILED,
+                    error_message=str(e),
+                )
+            raise
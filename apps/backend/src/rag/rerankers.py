@@ -0,0 +1,111 @@
+"""Second-pass rerankers for RAG search results.
+
+A reranker scores (query, chunk) pairs jointly with a cross-encoder, which
+is more accurate than the bi-encoder cosine + keyword score used to fetch
+candidates. Search fetches a wider candidate set and keeps the top results
+by rerank score.
+"""
+
+import os
+from abc import ABC, abstractmethod
+
+import httpx
+
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+
+class Reranker(ABC):
+    """Abstract base class for rerankers."""
+
+    @abstractmethod
+    async def rerank(self, query: str, documents: list[str]) -> list[float]:
+        """Score documents for relevance to query.
+
+        Args:
+            query: Search query
+            documents: Candidate chunk contents
+
+        Returns:
+            Relevance scores, in the same order as documents (higher is better)
+        """
+        pass
+
+    async def aclose(self) -> None:
+        """Release any pooled connections."""
+
+
+class CohereReranker(Reranker):
+    """Cohere rerank API (hosted cross-encoder)."""
+
+    def __init__(self, api_key: str) -> None:
+        """Initialize with API key."""
+        self.api_key = api_key
+        self.client = httpx.AsyncClient()
+        self.model = "rerank-v3.5"
+
+    async def rerank(self, query: str, documents: list[str]) -> list[float]:
+        """Score all documents in one rerank request.
+
+        Raises:
+            Exception: If API call fails
+        """
+        if not documents:
+            return []
+
+        try:
+            response = await self.client.post(
+                "https://api.cohere.com/v2/rerank",
+                headers={
+                    "Authorization": f"Bearer {self.api_key}",
+                    "Content-Type": "application/json",
+                },
+                json={
+                    "model": self.model,
+                    "query": query,
+                    "documents": documents,
+                },
+                timeout=30.0,
+            )
+
+            response.raise_for_status()
+            data = response.json()
+
+        except httpx.HTTPStatusError as e:
+            logger.error(
+                "Cohere rerank API error",
+                status_code=e.response.status_code,
+                error=str(e),
+            )
+            raise Exception(f"Failed to rerank results: {e}")
+        except Exception as e:
+            logger.error("Reranking failed", error=str(e))
+            raise
+
+        # Results come back sorted by score; map them to input order
+        scores = [0.0] * len(documents)
+        for item in data["results"]:
+            scores[item["index"]] = item["relevance_score"]
+        return scores
+
+    async def aclose(self) -> None:
+        """Close the pooled HTTP client."""
+        await self.client.aclose()
+
+
+def get_reranker() -> Reranker | None:
+    """Get the configured reranker.
+
+    Returns:
+        CohereReranker if COHERE_API_KEY is set, otherwise None (results
+        keep their retrieval order)
+    """
+    cohere_key = os.getenv("COHERE_API_KEY")
+
+    if cohere_key:
+        logger.info("Using Cohere reranker")
+        return CohereReranker(cohere_key)
+
+    logger.info("No reranker configured, search results use retrieval scores")
+    return None
@@ -1,15 +1,52 @@
 """RAG storage layer for document chunks."""
 
-from datetime import datetime
+import asyncio
+from collections import OrderedDict
 from typing import Any
 
+import numpy as np
+import orjson
+
 from src.memory.embeddings import get_embedding_provider
-from src.rag.models import DocumentChunk, DocumentSource, ProcessingStatus
+from src.rag.chunkers import count_tokens
+from src.rag.models import DocumentChunk, DocumentSource, FusionMethod, ProcessingStatus
+from src.rag.rerankers import get_reranker
 from src.state.supabase import SupabaseStateStore
 from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Rows per PostgREST insert; keeps request bodies well under gateway limits
+CHUNK_INSERT_BATCH_SIZE = 500
+
+# Chunk ids per rollback delete; ids travel in the query string
+CHUNK_DELETE_BATCH_SIZE = 100
+
+# Chunks embedded per window, and embedded windows buffered ahead of the
+# inserter; inserts overlap with embedding the next windows
+EMBEDDING_WINDOW_SIZE = 128
+EMBEDDED_WINDOW_QUEUE_SIZE = 8
+
+# Concurrent embedding provider calls per store, and embeddings kept by content_hash
+EMBEDDING_CONCURRENCY = 16
+EMBEDDING_CACHE_SIZE = 50_000
+
+# Candidates fetched per requested result when a reranker is configured
+RERANK_CANDIDATE_MULTIPLIER = 5
+
+
+def _vector_literal(embedding: list[float]) -> str:
+    """
+    Encode an embedding as a pgvector text literal ("[0.1,0.2,...]").
+
+    pgvector stores float32, so nothing is lost by narrowing first; orjson
+    then writes the shortest float32 repr for every element in C, far
+    faster and smaller than the stdlib json pass PostgREST would make.
+    """
+    return orjson.dumps(
+        np.asarray(embedding, dtype=np.float32), option=orjson.OPT_SERIALIZE_NUMPY
+    ).decode()
+
 
 class RAGStore:
     """Storage layer for RAG pipeline."""
@@ -18,14 +55,23 @@ class RAGStore:
         self.supabase = SupabaseStateStore()
         self.client = self.supabase.client
         self.embedding_provider = None
+        self.reranker = None
+        self._embed_sem = asyncio.Semaphore(EMBEDDING_CONCURRENCY)
+        self._embed_cache: OrderedDict[tuple[str, str], list[float]] = OrderedDict()
 
     async def initialize(self) -> None:
         """Initialize store and embedding provider."""
         from src.memory.embeddings import EmbeddingProvider
 
         self.embedding_provider: EmbeddingProvider = get_embedding_provider()
+        self.reranker = get_reranker()
         logger.info("RAG store initialized")
 
+    async def aclose(self) -> None:
+        """Close the reranker's pooled connections."""
+        if self.reranker:
+            await self.reranker.aclose()
+
     # Document Sources
 
     async def create_source(
@@ -46,7 +92,9 @@ class RAGStore:
             **kwargs,
         }
 
-        result = self.client.table("document_sources").insert(data).execute()
+        result = await asyncio.to_thread(
+            self.client.table("document_sources").insert(data).execute
+        )
 
         if not result.data:
             raise Exception("Failed to create document source")
@@ -61,14 +109,18 @@ class RAGStore:
         status: ProcessingStatus,
         error_message: str | None = None,
     ) -> None:
-        """Update source processing status."""
-        data = {"status": status.value, "updated_at": datetime.now().isoformat()}
+        """
+        Update source processing status.
+
+        updated_at and processed_at are stamped by database triggers.
+        """
+        data = {"status": status.value}
         if error_message:
             data["error_message"] = error_message
-        if status == ProcessingStatus.COMPLETED:
-            data["processed_at"] = datetime.now().isoformat()
 
-        self.client.table("document_sources").update(data).eq("id", source_id).execute()
+        await asyncio.to_thread(
+            self.client.table("document_sources").update(data).eq("id", source_id).execute
+        )
 
     # Document Chunks
 
@@ -85,12 +137,7 @@ class RAGStore:
         metadata: dict[str, Any] | None = None,
         generate_embedding: bool = True,
     ) -> DocumentChunk:
-        """Create a document chunk."""
-        # Generate embedding
-        embedding = None
-        if generate_embedding and self.embedding_provider:
-            embedding = await self.embedding_provider.get_embedding(content)
-
+        """Create a document chunk (through the batch insert path)."""
         data = {
             "source_id": source_id,
             "project_id": project_id,
@@ -101,14 +148,12 @@ class RAGStore:
             "parent_chunk_id": parent_chunk_id,
             "user_id": user_id,
             "metadata": metadata or {},
-            "embedding": embedding,
-            "token_count": len(content) // 4,
+            "embedding": None,
+            "token_count": None,  # Counted in batch_create_chunks
+            "generate_embedding": generate_embedding,
         }
 
-        result = self.client.table("document_chunks").insert(data).execute()
-
-        if not result.data:
-            raise Exception("Failed to create document chunk")
+        (chunk,) = await self.batch_create_chunks([data])
 
         logger.debug(
             "Chunk created",
@@ -117,52 +162,182 @@ class RAGStore:
             chunk_level=chunk_level,
         )
 
-        result_data = result.data[0] if isinstance(result.data, list) else result.data
-        return DocumentChunk(**result_data)  # type: ignore[arg-type]
+        return chunk
 
     async def batch_create_chunks(
         self,
         chunks: list[dict[str, Any]],
-    ) -> list[DocumentChunk]:
-        """Batch create chunks for efficiency."""
-        # Generate embeddings
-        if self.embedding_provider:
-            for chunk in chunks:
-                if chunk.get("generate_embedding", True):
-                    embedding = await self.embedding_provider.get_embedding(
-                        chunk["content"]
-                    )
-                    chunk["embedding"] = embedding
-
-        # Remove generate_embedding flag before insert
-        for chunk in chunks:
-            chunk.pop("generate_embedding", None)
+        raw: bool = False,
+    ) -> list[DocumentChunk] | list[dict[str, Any]]:
+        """
+        Batch create chunks for efficiency.
+
+        Returns:
+            Created chunks, or the inserted rows as plain dicts if raw=True
+            (for callers that don't need models)
+        """
+        # Exact token counts; the tokenizer releases the GIL, so keep it
+        # off the event loop
+        token_counts = await asyncio.to_thread(
+            count_tokens, [chunk["content"] for chunk in chunks]
+        )
+        for chunk, token_count in zip(chunks, token_counts):
+            chunk["token_count"] = token_count
+
+        # Embed windows of chunks and insert them as they arrive, so DB
+        # writes overlap with the remaining embedding calls
+        queue: asyncio.Queue[list[dict[str, Any]] | None] = asyncio.Queue(
+            maxsize=EMBEDDED_WINDOW_QUEUE_SIZE
+        )
+        result_data_list: list[dict[str, Any]] = []
+        producer = asyncio.create_task(self._embed_windows(chunks, queue))
+        consumer = asyncio.create_task(self._insert_windows(queue, result_data_list))
+        try:
+            done, _ = await asyncio.wait(
+                (producer, consumer), return_when=asyncio.FIRST_EXCEPTION
+            )
+        finally:
+            producer.cancel()
+            consumer.cancel()
+
+        for task in (producer, consumer):
+            if task in done and task.exception() is not None:
+                # Inserts span several requests with no shared transaction,
+                # so remove the rows that did land before surfacing the error
+                await asyncio.to_thread(
+                    self._delete_chunks, [row["id"] for row in result_data_list]
+                )
+                raise task.exception()  # type: ignore[misc]
+
+        logger.info("Batch chunks created", count=len(result_data_list))
+
+        if raw:
+            return result_data_list
+        return [DocumentChunk.from_trusted_dict(data) for data in result_data_list]
+
+    async def _embed_windows(
+        self,
+        chunks: list[dict[str, Any]],
+        queue: asyncio.Queue[list[dict[str, Any]] | None],
+    ) -> None:
+        """Embed chunks EMBEDDING_WINDOW_SIZE at a time; None marks the end."""
+        for start in range(0, len(chunks), EMBEDDING_WINDOW_SIZE):
+            window = chunks[start:start + EMBEDDING_WINDOW_SIZE]
 
-        # Batch insert
-        result = self.client.table("document_chunks").insert(chunks).execute()
+            if self.embedding_provider:
+                to_embed = [
+                    chunk for chunk in window if chunk.get("generate_embedding", True)
+                ]
+                if to_embed:
+                    await self._embed_chunks(to_embed)
+
+            # Remove generate_embedding flag before insert
+            for chunk in window:
+                chunk.pop("generate_embedding", None)
+
+            await queue.put(window)
+
+        await queue.put(None)
+
+    async def _insert_windows(
+        self,
+        queue: asyncio.Queue[list[dict[str, Any]] | None],
+        result_data_list: list[dict[str, Any]],
+    ) -> None:
+        """
+        Insert queued chunks, CHUNK_INSERT_BATCH_SIZE rows per request.
+
+        Inserted rows are appended to result_data_list as each request
+        completes, so the caller can see them even if a later one fails.
+        """
+        pending: list[dict[str, Any]] = []
+
+        while (window := await queue.get()) is not None:
+            pending.extend(window)
+            while len(pending) >= CHUNK_INSERT_BATCH_SIZE:
+                batch = pending[:CHUNK_INSERT_BATCH_SIZE]
+                pending = pending[CHUNK_INSERT_BATCH_SIZE:]
+                result_data_list.extend(await asyncio.to_thread(self._insert_chunks, batch))
+
+        if pending:
+            result_data_list.extend(await asyncio.to_thread(self._insert_chunks, pending))
+
+    def _insert_chunks(self, batch: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        """Insert one batch of chunk rows (blocking Supabase call)."""
+        rows = [
+            {**chunk, "embedding": _vector_literal(chunk["embedding"])}
+            if chunk.get("embedding") is not None
+            else chunk
+            for chunk in batch
+        ]
+        result = self.client.table("document_chunks").insert(rows).execute()
 
         if not result.data:
             raise Exception("Failed to batch create chunks")
 
-        result_data_list = result.data if isinstance(result.data, list) else [result.data]
-        logger.info("Batch chunks created", count=len(result_data_list))
+        return result.data if isinstance(result.data, list) else [result.data]
+
+    def _delete_chunks(self, chunk_ids: list[str]) -> None:
+        """Delete chunk rows by id (blocking Supabase call)."""
+        for start in range(0, len(chunk_ids), CHUNK_DELETE_BATCH_SIZE):
+            batch = chunk_ids[start:start + CHUNK_DELETE_BATCH_SIZE]
+            self.client.table("document_chunks").delete().in_("id", batch).execute()
+
+        if chunk_ids:
+            logger.warning("Rolled back partially inserted chunks", count=len(chunk_ids))
+
+    async def _embed_chunks(self, chunks: list[dict[str, Any]]) -> None:
+        """
+        Set chunk["embedding"] on each chunk, reusing cached vectors.
+
+        Embeddings are cached by (provider model, content_hash) (LRU,
+        EMBEDDING_CACHE_SIZE entries), so repeated boilerplate is embedded
+        once and switching providers never reuses another model's vectors.
+        Only unique misses reach the provider, as one batch under the
+        concurrency cap.
+        """
+        cache = self._embed_cache
+        provider = self.embedding_provider
+        model_id = f"{type(provider).__name__}:{getattr(provider, 'model', '')}"
+        resolved: dict[str, list[float]] = {}
+        missing: dict[str, str] = {}
+        for chunk in chunks:
+            content_hash = chunk["content_hash"]
+            if content_hash in resolved or content_hash in missing:
+                continue
+            cached = cache.get((model_id, content_hash))
+            if cached is not None:
+                cache.move_to_end((model_id, content_hash))
+                resolved[content_hash] = cached
+            else:
+                missing[content_hash] = chunk["content"]
+
+        if missing:
+            async with self._embed_sem:
+                embeddings = await provider.get_embedding_batch(list(missing.values()))
+            for content_hash, embedding in zip(missing, embeddings, strict=True):
+                resolved[content_hash] = embedding
+                cache[(model_id, content_hash)] = embedding
+            while len(cache) > EMBEDDING_CACHE_SIZE:
+                cache.popitem(last=False)
 
-        return [DocumentChunk(**data) for data in result_data_list]  # type: ignore[arg-type]
+        for chunk in chunks:
+            chunk["embedding"] = resolved[chunk["content_hash"]]
 
     async def get_chunk(self, chunk_id: str) -> DocumentChunk | None:
         """Get a chunk by ID."""
-        result = (
+        result = await asyncio.to_thread(
             self.client.table("document_chunks")
             .select("*")
             .eq("id", chunk_id)
-            .execute()
+            .execute
         )
 
         if not result.data:
             return None
 
         result_data = result.data[0] if isinstance(result.data, list) else result.data
-        return DocumentChunk(**result_data)  # type: ignore[arg-type]
+        return DocumentChunk.from_trusted_dict(result_data)
 
     async def hybrid_search(
         self,
@@ -172,29 +347,79 @@ class RAGStore:
         keyword_weight: float = 0.4,
         limit: int = 10,
         threshold: float = 0.5,
+        rerank: bool = True,
+        fusion: FusionMethod = FusionMethod.WEIGHTED,
     ) -> list[dict[str, Any]]:
-        """Hybrid vector + keyword search."""
+        """Hybrid vector + keyword search.
+
+        fusion=RRF adds trigram similarity as a third signal and fuses the
+        three rankings with Reciprocal Rank Fusion; weights and threshold
+        don't apply to it (RRF scores are rank-based, not similarities).
+
+        With a reranker configured (and rerank=True), fetches
+        limit * RERANK_CANDIDATE_MULTIPLIER candidates and returns the top
+        limit by cross-encoder score, which becomes the combined_score.
+        """
         if not self.embedding_provider:
             raise Exception("Embedding provider not initialized")
 
+        use_reranker = rerank and self.reranker is not None
+        match_count = limit * RERANK_CANDIDATE_MULTIPLIER if use_reranker else limit
+
         # Generate query embedding
         query_embedding = await self.embedding_provider.get_embedding(query)
 
         # Call hybrid search function
-        result = self.client.rpc(
-            "hybrid_search",
-            {
-                "query_text": query,
-                "query_embedding": query_embedding,
-                "project_id_filter": project_id,
-                "vector_weight": vector_weight,
-                "keyword_weight": keyword_weight,
-                "match_threshold": threshold,
-                "match_count": limit,
-            },
-        ).execute()
+        if fusion == FusionMethod.RRF:
+            result = await asyncio.to_thread(
+                self.client.rpc(
+                    "hybrid_search_rrf",
+                    {
+                        "query_text": query,
+                        "query_embedding": query_embedding,
+                        "project_id_filter": project_id,
+                        "match_count": match_count,
+                    },
+                ).execute
+            )
+        else:
+            result = await asyncio.to_thread(
+                self.client.rpc(
+                    "hybrid_search",
+                    {
+                        "query_text": query,
+                        "query_embedding": query_embedding,
+                        "project_id_filter": project_id,
+                        "vector_weight": vector_weight,
+                        "keyword_weight": keyword_weight,
+                        "match_threshold": threshold,
+                        "match_count": match_count,
+                    },
+                ).execute
+            )
 
-        return result.data or []
+        candidates = result.data or []
+        if not use_reranker or not candidates:
+            return candidates
+
+        return await self._rerank(query, candidates, limit)
+
+    async def _rerank(
+        self,
+        query: str,
+        candidates: list[dict[str, Any]],
+        limit: int,
+    ) -> list[dict[str, Any]]:
+        """Reorder candidates by reranker score and keep the top limit."""
+        scores = await self.reranker.rerank(
+            query, [candidate["content"] for candidate in candidates]
+        )
+        for candidate, score in zip(candidates, scores, strict=True):
+            candidate["rerank_score"] = score
+            candidate["combined_score"] = score
+
+        candidates.sort(key=lambda candidate: candidate["rerank_score"], reverse=True)
+        return candidates[:limit]
 
     async def vector_search(
         self,
@@ -208,34 +433,19 @@ class RAGStore:
             raise Exception("Embedding provider not initialized")
 
         # Generate query embedding
-        _query_embedding = await self.embedding_provider.get_embedding(query)
-
-        # Vector search using cosine similarity
-        # Note: For full vector search, use hybrid_search or custom RPC function
-        result = (
-            self.client.table("document_chunks")
-            .select("id, source_id, content, metadata, heading_hierarchy, summary")
-            .match({"project_id": project_id})
-            .order("embedding", desc=False)
-            .limit(limit)
-            .execute()
-        )
+        query_embedding = await self.embedding_provider.get_embedding(query)
 
-        # Add scores
-        results_with_scores = []
-        for item in result.data or []:
-            results_with_scores.append(
+        # Cosine ranking happens in Postgres (match_chunks, HNSW index)
+        result = await asyncio.to_thread(
+            self.client.rpc(
+                "match_chunks",
                 {
-                    "chunk_id": item["id"],
-                    "source_id": item["source_id"],
-                    "content": item["content"],
-                    "vector_score": 0.8,  # Placeholder score
-                    "keyword_score": 0.0,
-                    "combined_score": 0.8,
-                    "metadata": item.get("metadata", {}),
-                    "heading_hierarchy": item.get("heading_hierarchy", []),
-                    "summary": item.get("summary"),
-                }
-            )
+                    "query_embedding": query_embedding,
+                    "project_id_filter": project_id,
+                    "match_threshold": threshold,
+                    "match_count": limit,
+                },
+            ).execute
+        )
 
-        return results_with_scores
+        return result.data or []
@@ -27,6 +27,8 @@ Usage:
     )
 """
 
+import time
+from collections import OrderedDict
 from typing import Any
 from uuid import uuid4
 
@@ -35,17 +37,71 @@ from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Local run cache bounds: entry cap, default TTL, and the shorter TTL for
+# runs in a terminal state (callers rarely re-query those)
+RUN_CACHE_MAX_SIZE = 10_000
+RUN_CACHE_TTL_SECONDS = 3600.0
+RUN_CACHE_TERMINAL_TTL_SECONDS = 60.0
+
+
+class _RunCache:
+    """Size-bounded LRU of agent runs with per-entry expiry."""
+
+    __slots__ = ("_entries", "maxsize")
+
+    def __init__(self, maxsize: int = RUN_CACHE_MAX_SIZE) -> None:
+        self.maxsize = maxsize
+        # run_id -> (expires_at, run), oldest use first
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def get(self, run_id: str) -> dict[str, Any] | None:
+        """Return the cached run, or None if missing or expired."""
+        entry = self._entries.get(run_id)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[run_id]
+            return None
+        self._entries.move_to_end(run_id)
+        return entry[1]
+
+    def set(
+        self,
+        run_id: str,
+        run: dict[str, Any],
+        ttl: float = RUN_CACHE_TTL_SECONDS,
+    ) -> None:
+        """Cache a run for ttl seconds, evicting the least recently used."""
+        self._entries[run_id] = (time.monotonic() + ttl, run)
+        self._entries.move_to_end(run_id)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+
+_TERMINAL_STATUSES = frozenset({"completed", "failed", "escalated_to_human"})
+
+
+def _status_ttl(status: str | None) -> float:
+    """Cache TTL for a run in the given status."""
+    if status in _TERMINAL_STATUSES:
+        return RUN_CACHE_TERMINAL_TTL_SECONDS
+    return RUN_CACHE_TTL_SECONDS
+
 
 class AgentEventPublisher:
     """Publishes agent execution events to Supabase Realtime.
 
     This allows frontend to subscribe to agent status updates in real-time.
-    Now includes local caching for improved performance.
+    Now includes local caching for improved performance. The cache is
+    bounded (LRU + TTL) so long-lived workers don't accumulate stale runs.
     """
 
     def __init__(self) -> None:
         self.store = SupabaseStateStore()
-        self.local_cache: dict[str, dict[str, Any]] = {}
+        self.local_cache = _RunCache()
 
     async def start_run(
         self,
@@ -84,7 +140,7 @@ class AgentEventPublisher:
             raise Exception("Failed to create agent run")
 
         # Cache the run locally
-        self.local_cache[run["id"]] = run
+        self.local_cache.set(run["id"], run)
 
         logger.info(
             "Started agent run",
@@ -120,7 +176,7 @@ class AgentEventPublisher:
 
         # Update local cache
         if run:
-            self.local_cache[run_id] = run
+            self.local_cache.set(run_id, run)
 
         logger.debug(
             "Updated agent progress",
@@ -151,9 +207,9 @@ class AgentEventPublisher:
             metadata=metadata,
         )
 
-        # Update local cache
+        # Update local cache (terminal states expire sooner)
         if run:
-            self.local_cache[run_id] = run
+            self.local_cache.set(run_id, run, ttl=_status_ttl(status))
 
         logger.info(
             "Updated agent status",
@@ -214,9 +270,9 @@ class AgentEventPublisher:
             metadata=metadata,
         )
 
-        # Update local cache
+        # Update local cache (terminal state, expires sooner)
         if run:
-            self.local_cache[run_id] = run
+            self.local_cache.set(run_id, run, ttl=RUN_CACHE_TERMINAL_TTL_SECONDS)
 
         logger.info(
             "Completed agent run",
@@ -243,9 +299,9 @@ class AgentEventPublisher:
             metadata=metadata,
         )
 
-        # Update local cache
+        # Update local cache (terminal state, expires sooner)
         if run:
-            self.local_cache[run_id] = run
+            self.local_cache.set(run_id, run, ttl=RUN_CACHE_TERMINAL_TTL_SECONDS)
 
         logger.error(
             "Failed agent run",
@@ -291,13 +347,14 @@ class AgentEventPublisher:
             Agent run data or None if not found
         """
         # Check local cache first
-        if run_id in self.local_cache:
-            return self.local_cache[run_id]
+        cached = self.local_cache.get(run_id)
+        if cached is not None:
+            return cached
 
         # Fall back to database
         run = await self.store.get_agent_run(run_id)
         if run:
-            self.local_cache[run_id] = run
+            self.local_cache.set(run_id, run, ttl=_status_ttl(run.get("status")))
         return run
 
     async def get_active_runs(self, user_id: str) -> list[dict[str, Any]]:
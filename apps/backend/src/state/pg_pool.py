@@ -0,0 +1,130 @@
+"""Shared asyncpg connection pool for state queries.
+
+SupabaseStateStore talks to Postgres directly over this pool instead of
+issuing a blocking PostgREST request per call.
+"""
+
+import asyncio
+import struct
+from collections.abc import Callable, Sequence
+from typing import Any
+
+import asyncpg
+import numpy as np
+import orjson
+
+from src.config import get_settings
+from src.utils import get_logger
+
+settings = get_settings()
+logger = get_logger(__name__)
+
+POOL_MIN_SIZE = 10
+POOL_MAX_SIZE = 50
+POOL_MAX_INACTIVE_CONNECTION_LIFETIME = 300.0
+POOL_COMMAND_TIMEOUT = 60.0
+
+_pool: asyncpg.Pool | None = None
+_pool_lock = asyncio.Lock()
+
+
+def _encode_json(value: object) -> bytes:
+    return orjson.dumps(value)
+
+
+def _decode_json(data: bytes) -> Any:
+    return orjson.loads(data)
+
+
+def _encode_jsonb(value: object) -> bytes:
+    """jsonb binary format is a version byte (1) followed by the JSON text."""
+    return b"\x01" + orjson.dumps(value)
+
+
+def _decode_jsonb(data: bytes) -> Any:
+    return orjson.loads(memoryview(data)[1:])
+
+
+def _vector_codec(dtype: str) -> tuple[Callable[..., bytes], Callable[[bytes], list[float]]]:
+    """Binary codec for a pgvector type with the given big-endian element dtype.
+
+    The wire format is dim and an unused field (int16 each) then the elements.
+    """
+
+    def encode(value: Sequence[float]) -> bytes:
+        array = np.asarray(value, dtype=dtype)
+        return struct.pack(">HH", array.shape[0], 0) + array.tobytes()
+
+    def decode(data: bytes) -> list[float]:
+        return np.frombuffer(data, dtype=dtype, offset=4).tolist()
+
+    return encode, decode
+
+
+# pgvector type name -> element dtype (vector is float4, halfvec float2)
+_VECTOR_DTYPES = {"vector": ">f4", "halfvec": ">f2"}
+
+
+async def _init_connection(con: asyncpg.Connection) -> None:
+    """Decode rows into the same JSON-compatible shapes PostgREST returned.
+
+    pgvector values travel in binary, so embeddings are bound as float lists
+    with no text literal to build or parse. Binding a list to a halfvec
+    parameter rounds it to fp16 on the client.
+    """
+    # Binary format hands orjson bytes directly, skipping a str round trip
+    await con.set_type_codec(
+        "json", encoder=_encode_json, decoder=_decode_json, schema="pg_catalog", format="binary"
+    )
+    await con.set_type_codec(
+        "jsonb", encoder=_encode_jsonb, decoder=_decode_jsonb, schema="pg_catalog", format="binary"
+    )
+    for name in ("uuid", "timestamptz"):
+        await con.set_type_codec(
+            name, encoder=str, decoder=str, schema="pg_catalog", format="text"
+        )
+    for name, schema in await con.fetch(
+        "SELECT typname, typnamespace::regnamespace::text FROM pg_type"
+        " WHERE typname = ANY($1::text[])",
+        list(_VECTOR_DTYPES),
+    ):
+        encoder, decoder = _vector_codec(_VECTOR_DTYPES[name])
+        await con.set_type_codec(
+            name, encoder=encoder, decoder=decoder, schema=schema, format="binary"
+        )
+
+
+async def get_pool() -> asyncpg.Pool:
+    """Return the process-wide pool, creating it on first use."""
+    global _pool
+    if _pool is not None:
+        return _pool
+
+    async with _pool_lock:
+        if _pool is None:
+            if not settings.supabase_db_url:
+                raise ValueError("Supabase database URL not configured")
+
+            # statement_cache_size=0: the Supavisor transaction pooler hands each
+            # transaction a different backend, so prepared statements can't persist
+            _pool = await asyncpg.create_pool(
+                dsn=settings.supabase_db_url,
+                min_size=POOL_MIN_SIZE,
+                max_size=POOL_MAX_SIZE,
+                max_inactive_connection_lifetime=POOL_MAX_INACTIVE_CONNECTION_LIFETIME,
+                command_timeout=POOL_COMMAND_TIMEOUT,
+                statement_cache_size=0,
+                init=_init_connection,
+            )
+            logger.info(
+                "Created Postgres pool", min_size=POOL_MIN_SIZE, max_size=POOL_MAX_SIZE
+            )
+    return _pool
+
+
+async def close_pool() -> None:
+    """Close the pool if it was created."""
+    global _pool
+    if _pool is not None:
+        pool, _pool = _pool, None
+        await pool.close()
@@ -1,35 +1,362 @@
 """Supabase state persistence."""
 
+import asyncio
+import time
+import weakref
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Sequence
+from contextlib import suppress
+from functools import lru_cache
 from typing import Any
-from datetime import datetime
 
-from supabase import create_client, Client
+import httpx
+import orjson
+from realtime import AsyncRealtimeClient
+from realtime.types import RealtimeSubscribeStates
+from supabase import ClientOptions, create_client, Client
 
 from src.config import get_settings
 from src.utils import get_logger
 
+from .pg_pool import get_pool
+
 settings = get_settings()
 logger = get_logger(__name__)
 
+ACTIVE_RUN_STATUSES = [
+    "pending", "in_progress", "awaiting_verification", "verification_in_progress",
+]
+# What the active-runs dashboard reads; leaves out metadata and verification_evidence
+ACTIVE_RUN_COLUMNS = (
+    "id", "task_id", "agent_name", "status", "progress_percent", "current_step",
+    "error", "result", "verification_attempts", "started_at", "completed_at",
+)
+
+
+# Connection pool for the PostgREST/auth HTTP session shared by all stores
+HTTP_MAX_CONNECTIONS = 100
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 50
+HTTP_TIMEOUT_SECONDS = 30.0
+HTTP_CONNECT_TIMEOUT_SECONDS = 5.0
+
+
+# Realtime resubscription: the delay doubles from the initial value up to the
+# cap, and the subscription gives up after this many consecutive failures
+REALTIME_BACKOFF_INITIAL_SECONDS = 1.0
+REALTIME_BACKOFF_MAX_SECONDS = 30.0
+REALTIME_MAX_ATTEMPTS = 10
+# A subscription with no events for this long is re-established: with the
+# library's reconnect off, a dropped socket raises nothing
+REALTIME_IDLE_TIMEOUT_SECONDS = 60.0
+
+
+# By-id read cache: repeated loads of the same conversation, agent run or
+# memory within a task are served locally for a few seconds
+ROW_CACHE_MAX_SIZE = 1024
+ROW_CACHE_TTL_SECONDS = 5.0
+
+
+class _RowCache:
+    """Size-bounded LRU of rows with a fixed expiry."""
+
+    __slots__ = ("_entries", "maxsize", "ttl")
+
+    def __init__(
+        self,
+        maxsize: int = ROW_CACHE_MAX_SIZE,
+        ttl: float = ROW_CACHE_TTL_SECONDS,
+    ) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        # id -> (expires_at, row), oldest use first
+        self._entries: OrderedDict[str, tuple[float, dict[str, Any]]] = OrderedDict()
+
+    def get(self, key: str) -> dict[str, Any] | None:
+        """Return a copy of the cached row, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return dict(entry[1])
+
+    def set(self, key: str, row: dict[str, Any]) -> None:
+        """Cache a copy of row, evicting the least recently used."""
+        self._entries[key] = (time.monotonic() + self.ttl, dict(row))
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def pop(self, key: str) -> None:
+        """Drop key after a write that didn't return the new row."""
+        self._entries.pop(key, None)
+
+    def clear(self) -> None:
+        """Drop every entry."""
+        self._entries.clear()
+
+
+# Shared by all store instances, like the client and pool
+_conversation_cache = _RowCache()
+_agent_run_cache = _RowCache()
+_memory_cache = _RowCache()
+
+# Non-terminal agent run updates are coalesced per run for this long, so a
+# burst of progress ticks becomes one UPDATE and one Realtime event
+AGENT_RUN_FLUSH_DELAY_SECONDS = 0.1
+TERMINAL_RUN_STATUSES = frozenset({"completed", "failed", "escalated_to_human"})
+
+# run_id -> latest value per column (plus merged "metadata") awaiting a flush
+_pending_run_updates: dict[str, dict[str, Any]] = {}
+_run_flush_tasks: dict[str, asyncio.Task[None]] = {}
+# run_id -> error from a background flush, raised by the run's next update
+_run_flush_errors: dict[str, Exception] = {}
+# Held while a run's UPDATE is in flight, so flushes land in order
+_run_write_locks: weakref.WeakValueDictionary[str, asyncio.Lock] = (
+    weakref.WeakValueDictionary()
+)
+
+
+class _OrjsonClient(httpx.Client):
+    """httpx.Client that encodes json= request bodies with orjson.
+
+    postgrest-py passes payloads as json=, which httpx serializes with the
+    stdlib encoder; conversation histories and memory values make that slow.
+    """
+
+    def build_request(  # type: ignore[override]
+        self,
+        method: str,
+        url: httpx.URL | str,
+        *,
+        json: Any = None,
+        headers: httpx.Headers | dict[str, str] | None = None,
+        **kwargs: Any,
+    ) -> httpx.Request:
+        if json is not None:
+            kwargs["content"] = orjson.dumps(json, option=orjson.OPT_SERIALIZE_NUMPY)
+            headers = httpx.Headers(headers)
+            if "content-type" not in headers:
+                headers["Content-Type"] = "application/json"
+        return super().build_request(method, url, headers=headers, **kwargs)
+
+
+@lru_cache
+def _get_http_client() -> httpx.Client:
+    """Build the keep-alive HTTP/2 session the Supabase client sends requests on."""
+    logger.info(
+        "Created Supabase HTTP client",
+        max_connections=HTTP_MAX_CONNECTIONS,
+        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+    )
+    return _OrjsonClient(
+        limits=httpx.Limits(
+            max_connections=HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS,
+        ),
+        timeout=httpx.Timeout(HTTP_TIMEOUT_SECONDS, connect=HTTP_CONNECT_TIMEOUT_SECONDS),
+        http2=True,
+        follow_redirects=True,
+    )
+
+
+@lru_cache
+def _get_client() -> Client:
+    """Build the process-wide Supabase client on first use."""
+    if not settings.supabase_url or not settings.supabase_service_role_key:
+        raise ValueError("Supabase credentials not configured")
+
+    return create_client(
+        settings.supabase_url,
+        settings.supabase_service_role_key,
+        options=ClientOptions(httpx_client=_get_http_client()),
+    )
+
+
+def close_client() -> None:
+    """Close the shared HTTP session; the next use builds a fresh client."""
+    if _get_http_client.cache_info().currsize:
+        _get_http_client().close()
+    _get_http_client.cache_clear()
+    _get_client.cache_clear()
+
+
+def _realtime_client() -> AsyncRealtimeClient:
+    """Build a Realtime websocket client for one subscription.
+
+    The library's own reconnect is disabled: its backoff is uncapped, and
+    subscribe_task_agent_runs retries at the channel level instead.
+    """
+    if not settings.supabase_url or not settings.supabase_service_role_key:
+        raise ValueError("Supabase credentials not configured")
+
+    return AsyncRealtimeClient(
+        f"{settings.supabase_url}/realtime/v1",
+        token=settings.supabase_service_role_key,
+        auto_reconnect=False,
+    )
+
+
+def _quote_ident(name: str) -> str:
+    """Quote a column name for interpolation into SQL."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def _select_list(columns: Sequence[str] | None) -> str:
+    """SELECT list for the requested columns, or every column if None."""
+    return ", ".join(map(_quote_ident, columns)) if columns else "*"
+
+
+async def _fetch_rows_by_ids(
+    table: str,
+    ids: list[str],
+    cache: _RowCache | None = None,
+) -> dict[str, dict[str, Any]]:
+    """Fetch rows by id with one ANY() query, serving cached rows first."""
+    rows: dict[str, dict[str, Any]] = {}
+    missing: list[str] = []
+    for row_id in dict.fromkeys(ids):
+        cached = cache.get(row_id) if cache is not None else None
+        if cached is not None:
+            rows[row_id] = cached
+        else:
+            missing.append(row_id)
+
+    if missing:
+        pool = await get_pool()
+        for record in await pool.fetch(
+            f"SELECT * FROM {table} WHERE id = ANY($1::uuid[])", missing
+        ):
+            row = dict(record)
+            rows[row["id"]] = row
+            if cache is not None:
+                cache.set(row["id"], row)
+    return rows
+
+
+def _with_pending_updates(run_id: str, run: dict[str, Any]) -> dict[str, Any]:
+    """A run row with its buffered, not yet written updates applied."""
+    pending = _pending_run_updates.get(run_id)
+    if not pending:
+        return run
+    merged = {**run, **pending}
+    if "metadata" in pending:
+        merged["metadata"] = {**(run.get("metadata") or {}), **pending["metadata"]}
+    return merged
+
+
+def _restore_pending_updates(
+    run_id: str,
+    update_data: dict[str, Any],
+    metadata: dict[str, Any] | None,
+) -> None:
+    """Put updates from a failed flush back, under any buffered since."""
+    newer = _pending_run_updates.get(run_id, {})
+    restored = {**update_data, **newer}
+    if metadata is not None or "metadata" in newer:
+        restored["metadata"] = {**(metadata or {}), **newer.get("metadata", {})}
+    _pending_run_updates[run_id] = restored
+
+
+async def _flush_agent_run(run_id: str) -> dict[str, Any] | None:
+    """Write a run's buffered updates as one UPDATE and return the new row."""
+    lock = _run_write_locks.setdefault(run_id, asyncio.Lock())
+    async with lock:
+        update_data = _pending_run_updates.pop(run_id, None)
+        if not update_data:
+            return None
+        metadata = update_data.pop("metadata", None)
+
+        try:
+            params: list[Any] = [run_id]
+            assignments: list[str] = []
+            for column, value in update_data.items():
+                params.append(value)
+                assignments.append(f"{column} = ${len(params)}")
+
+            if metadata is not None:
+                # Merge in the same statement rather than read-modify-write
+                params.append(metadata)
+                assignments.append(
+                    f"metadata = COALESCE(metadata, '{{}}'::jsonb) || ${len(params)}"
+                )
+
+            pool = await get_pool()
+            row = await pool.fetchrow(
+                f"UPDATE agent_runs SET {', '.join(assignments)} WHERE id = $1 RETURNING *",
+                *params,
+            )
+
+            run = dict(row) if row else None
+            if run:
+                _agent_run_cache.set(run_id, run)
+                logger.info(
+                    "Updated agent run",
+                    run_id=run_id,
+                    status=update_data.get("status"),
+                    step=update_data.get("current_step"),
+                )
+            else:
+                _agent_run_cache.pop(run_id)
+            return run
+
+        except Exception as e:
+            logger.error("Failed to update agent run", run_id=run_id, error=str(e))
+            # Kept for the next flush rather than dropped
+            _restore_pending_updates(run_id, update_data, metadata)
+            raise
+
+
+async def _flush_agent_run_later(run_id: str) -> None:
+    """Flush a run's buffered updates once its coalescing window closes."""
+    await asyncio.sleep(AGENT_RUN_FLUSH_DELAY_SECONDS)
+    _run_flush_tasks.pop(run_id, None)
+    try:
+        await _flush_agent_run(run_id)
+    except Exception as e:
+        # The updates stay buffered; the run's next update retries and raises this
+        _run_flush_errors[run_id] = e
+    else:
+        _run_flush_errors.pop(run_id, None)
+
+
+async def flush_agent_run_updates() -> None:
+    """Write every buffered agent run update now, e.g. before shutdown.
+
+    Raises:
+        Exception: The first flush that failed, after every run was tried
+    """
+    for timer in _run_flush_tasks.values():
+        timer.cancel()
+    _run_flush_tasks.clear()
+    run_ids = list(_pending_run_updates)
+    results = await asyncio.gather(
+        *(_flush_agent_run(run_id) for run_id in run_ids),
+        return_exceptions=True,
+    )
+    errors = []
+    for run_id, outcome in zip(run_ids, results, strict=True):
+        if isinstance(outcome, Exception):
+            errors.append(outcome)
+        else:
+            _run_flush_errors.pop(run_id, None)
+    if errors:
+        raise errors[0]
+
 
 class SupabaseStateStore:
-    """Persistent state storage using Supabase."""
+    """Persistent state storage using Supabase.
 
-    def __init__(self) -> None:
-        self._client: Client | None = None
+    State CRUD runs over the shared asyncpg pool; ``client`` remains for
+    callers that still go through PostgREST.
+    """
 
     @property
     def client(self) -> Client:
-        """Lazy-initialize Supabase client."""
-        if self._client is None:
-            if not settings.supabase_url or not settings.supabase_service_role_key:
-                raise ValueError("Supabase credentials not configured")
-
-            self._client = create_client(
-                settings.supabase_url,
-                settings.supabase_service_role_key,
-            )
-        return self._client
+        """Supabase client shared by every store instance."""
+        return _get_client()
 
     async def save_conversation(
         self,
@@ -40,14 +367,23 @@ class SupabaseStateStore:
     ) -> None:
         """Save conversation to Supabase."""
         try:
-            self.client.table("conversations").upsert({
-                "id": conversation_id,
-                "user_id": user_id,
-                "messages": messages,
-                "context": context or {},
-                "updated_at": datetime.now().isoformat(),
-            }).execute()
+            pool = await get_pool()
+            await pool.execute(
+                """
+                INSERT INTO conversations (id, user_id, messages, context)
+                VALUES ($1, $2, $3, $4)
+                ON CONFLICT (id) DO UPDATE SET
+                    user_id = EXCLUDED.user_id,
+                    messages = EXCLUDED.messages,
+                    context = EXCLUDED.context
+                """,
+                conversation_id,
+                user_id,
+                messages,
+                context or {},
+            )
 
+            _conversation_cache.pop(conversation_id)
             logger.info("Saved conversation", id=conversation_id)
 
         except Exception as e:
@@ -59,12 +395,21 @@ class SupabaseStateStore:
         conversation_id: str,
     ) -> dict[str, Any] | None:
         """Load conversation from Supabase."""
+        cached = _conversation_cache.get(conversation_id)
+        if cached is not None:
+            return cached
+
         try:
-            result = self.client.table("conversations").select("*").eq(
-                "id", conversation_id
-            ).single().execute()
+            pool = await get_pool()
+            row = await pool.fetchrow(
+                "SELECT * FROM conversations WHERE id = $1", conversation_id
+            )
 
-            return result.data
+            if not row:
+                return None
+            conversation = dict(row)
+            _conversation_cache.set(conversation_id, conversation)
+            return conversation
 
         except Exception as e:
             logger.error("Failed to load conversation", error=str(e))
@@ -81,15 +426,25 @@ class SupabaseStateStore:
     ) -> None:
         """Save task to Supabase."""
         try:
-            self.client.table("tasks").upsert({
-                "id": task_id,
-                "conversation_id": conversation_id,
-                "description": description,
-                "status": status,
-                "result": result,
-                "error": error,
-                "updated_at": datetime.now().isoformat(),
-            }).execute()
+            pool = await get_pool()
+            await pool.execute(
+                """
+                INSERT INTO tasks (id, conversation_id, description, status, result, error)
+                VALUES ($1, $2, $3, $4, $5, $6)
+                ON CONFLICT (id) DO UPDATE SET
+                    conversation_id = EXCLUDED.conversation_id,
+                    description = EXCLUDED.description,
+                    status = EXCLUDED.status,
+                    result = EXCLUDED.result,
+                    error = EXCLUDED.error
+                """,
+                task_id,
+                conversation_id,
+                description,
+                status,
+                result,
+                error,
+            )
 
             logger.info("Saved task", id=task_id, status=status)
 
@@ -100,28 +455,43 @@ class SupabaseStateStore:
     async def load_task(self, task_id: str) -> dict[str, Any] | None:
         """Load task from Supabase."""
         try:
-            result = self.client.table("tasks").select("*").eq(
-                "id", task_id
-            ).single().execute()
+            pool = await get_pool()
+            row = await pool.fetchrow("SELECT * FROM tasks WHERE id = $1", task_id)
 
-            return result.data
+            return dict(row) if row else None
 
         except Exception as e:
             logger.error("Failed to load task", error=str(e))
             return None
 
+    async def load_tasks_by_ids(self, task_ids: list[str]) -> dict[str, dict[str, Any]]:
+        """Load many tasks in one query, keyed by id (missing ids are absent)."""
+        try:
+            return await _fetch_rows_by_ids("tasks", task_ids)
+
+        except Exception as e:
+            logger.error("Failed to load tasks", count=len(task_ids), error=str(e))
+            return {}
+
     async def get_user_conversations(
         self,
         user_id: str,
         limit: int = 50,
+        columns: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Get all conversations for a user."""
+        """Get all conversations for a user (only the given columns, if any)."""
         try:
-            result = self.client.table("conversations").select("*").eq(
-                "user_id", user_id
-            ).order("updated_at", desc=True).limit(limit).execute()
+            pool = await get_pool()
+            rows = await pool.fetch(
+                f"""
+                SELECT {_select_list(columns)} FROM conversations WHERE user_id = $1
+                ORDER BY updated_at DESC LIMIT $2
+                """,
+                user_id,
+                limit,
+            )
 
-            return result.data
+            return [dict(row) for row in rows]
 
         except Exception as e:
             logger.error("Failed to get user conversations", error=str(e))
@@ -130,14 +500,20 @@ class SupabaseStateStore:
     async def get_conversation_tasks(
         self,
         conversation_id: str,
+        columns: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Get all tasks for a conversation."""
+        """Get all tasks for a conversation (only the given columns, if any)."""
         try:
-            result = self.client.table("tasks").select("*").eq(
-                "conversation_id", conversation_id
-            ).order("created_at", desc=True).execute()
+            pool = await get_pool()
+            rows = await pool.fetch(
+                f"""
+                SELECT {_select_list(columns)} FROM tasks WHERE conversation_id = $1
+                ORDER BY created_at DESC
+                """,
+                conversation_id,
+            )
 
-            return result.data
+            return [dict(row) for row in rows]
 
         except Exception as e:
             logger.error("Failed to get conversation tasks", error=str(e))
@@ -170,17 +546,23 @@ class SupabaseStateStore:
             Created agent run record
         """
         try:
-            result = self.client.table("agent_runs").insert({
-                "task_id": task_id,
-                "user_id": user_id,
-                "agent_name": agent_name,
-                "agent_id": agent_id,
-                "status": "pending",
-                "metadata": metadata or {},
-            }).execute()
-
-            run = result.data[0] if result.data else None
+            pool = await get_pool()
+            row = await pool.fetchrow(
+                """
+                INSERT INTO agent_runs (task_id, user_id, agent_name, agent_id, status, metadata)
+                VALUES ($1, $2, $3, $4, 'pending', $5)
+                RETURNING *
+                """,
+                task_id,
+                user_id,
+                agent_name,
+                agent_id,
+                metadata or {},
+            )
+
+            run = dict(row) if row else None
             if run:
+                _agent_run_cache.set(run["id"], run)
                 logger.info(
                     "Created agent run",
                     run_id=run["id"],
@@ -204,10 +586,15 @@ class SupabaseStateStore:
         verification_attempts: int | None = None,
         verification_evidence: list[dict[str, Any]] | None = None,
         metadata: dict[str, Any] | None = None,
+        flush: bool = False,
     ) -> dict[str, Any] | None:
         """Update an agent run.
 
         This will trigger a Realtime event that frontend subscribers will receive.
+        Updates are buffered per run for AGENT_RUN_FLUSH_DELAY_SECONDS and
+        written as one UPDATE keeping the latest value per column; a terminal
+        status flushes the buffer immediately. If a buffered write fails, its
+        updates stay buffered and the run's next update raises the error.
 
         Args:
             run_id: ID of the agent run
@@ -219,112 +606,236 @@ class SupabaseStateStore:
             verification_attempts: Number of verification attempts
             verification_evidence: Verification evidence array
             metadata: Additional metadata to merge
+            flush: Write now, with anything already buffered, instead of
+                waiting for the window (e.g. before reading the table back)
 
         Returns:
-            Updated agent run record
+            Updated agent run record; while buffered, the last read row with
+            the pending updates applied
         """
-        try:
-            update_data: dict[str, Any] = {}
+        update_data: dict[str, Any] = {}
 
-            if status is not None:
-                update_data["status"] = status
+        # completed_at is stamped by a trigger on terminal status
+        if status is not None:
+            update_data["status"] = status
 
-                # Auto-set completed_at when reaching terminal states
-                if status in ["completed", "failed", "escalated_to_human"]:
-                    update_data["completed_at"] = datetime.now().isoformat()
+        if current_step is not None:
+            update_data["current_step"] = current_step
 
-            if current_step is not None:
-                update_data["current_step"] = current_step
+        # Clamped into 0-100 by a trigger
+        if progress_percent is not None:
+            update_data["progress_percent"] = progress_percent
 
-            if progress_percent is not None:
-                update_data["progress_percent"] = max(0.0, min(100.0, progress_percent))
+        if result is not None:
+            update_data["result"] = result
 
-            if result is not None:
-                update_data["result"] = result
+        if error is not None:
+            update_data["error"] = error
 
-            if error is not None:
-                update_data["error"] = error
+        if verification_attempts is not None:
+            update_data["verification_attempts"] = verification_attempts
 
-            if verification_attempts is not None:
-                update_data["verification_attempts"] = verification_attempts
-
-            if verification_evidence is not None:
-                update_data["verification_evidence"] = verification_evidence
-
-            if metadata is not None:
-                # Fetch current metadata and merge
-                current = self.client.table("agent_runs").select("metadata").eq(
-                    "id", run_id
-                ).single().execute()
-
-                current_metadata = current.data.get("metadata", {}) if current.data else {}
-                update_data["metadata"] = {**current_metadata, **metadata}
-
-            if update_data:
-                result = self.client.table("agent_runs").update(update_data).eq(
-                    "id", run_id
-                ).execute()
-
-                run = result.data[0] if result.data else None
-                if run:
-                    logger.info(
-                        "Updated agent run",
-                        run_id=run_id,
-                        status=status,
-                        step=current_step,
-                    )
-                return run
+        if verification_evidence is not None:
+            update_data["verification_evidence"] = verification_evidence
 
+        if not update_data and metadata is None:
             return None
 
-        except Exception as e:
-            logger.error("Failed to update agent run", run_id=run_id, error=str(e))
-            raise
+        pending = _pending_run_updates.setdefault(run_id, {})
+        pending.update(update_data)
+        if metadata is not None:
+            pending["metadata"] = {**pending.get("metadata", {}), **metadata}
+
+        if flush or status in TERMINAL_RUN_STATUSES:
+            timer = _run_flush_tasks.pop(run_id, None)
+            if timer is not None:
+                timer.cancel()
+            _run_flush_errors.pop(run_id, None)
+            return await _flush_agent_run(run_id)
+
+        if run_id not in _run_flush_tasks:
+            _run_flush_tasks[run_id] = asyncio.create_task(_flush_agent_run_later(run_id))
+        error = _run_flush_errors.pop(run_id, None)
+        if error is not None:
+            raise error
+        return await self.get_agent_run(run_id)
 
     async def get_agent_run(self, run_id: str) -> dict[str, Any] | None:
-        """Get agent run by ID."""
+        """Get agent run by ID, including updates still buffered for writing."""
         try:
-            result = self.client.table("agent_runs").select("*").eq(
-                "id", run_id
-            ).single().execute()
-
-            return result.data
+            # Taken alongside flushes, so an in-flight UPDATE lands first and a
+            # read never caches a row older than the one it returned
+            async with _run_write_locks.setdefault(run_id, asyncio.Lock()):
+                run = _agent_run_cache.get(run_id)
+                if run is None:
+                    pool = await get_pool()
+                    row = await pool.fetchrow("SELECT * FROM agent_runs WHERE id = $1", run_id)
+                    if not row:
+                        return None
+                    run = dict(row)
+                    _agent_run_cache.set(run_id, run)
+            return _with_pending_updates(run_id, run)
 
         except Exception as e:
             logger.error("Failed to get agent run", run_id=run_id, error=str(e))
             return None
 
+    async def get_agent_runs_by_ids(
+        self,
+        run_ids: list[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Get many agent runs in one query, keyed by id (missing ids are absent)."""
+        try:
+            return await _fetch_rows_by_ids("agent_runs", run_ids, _agent_run_cache)
+
+        except Exception as e:
+            logger.error("Failed to get agent runs", count=len(run_ids), error=str(e))
+            return {}
+
     async def get_task_agent_runs(
         self,
         task_id: str,
         limit: int = 10,
+        columns: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
-        """Get all agent runs for a task."""
+        """Get all agent runs for a task (only the given columns, if any)."""
         try:
-            result = self.client.table("agent_runs").select("*").eq(
-                "task_id", task_id
-            ).order("started_at", desc=True).limit(limit).execute()
+            pool = await get_pool()
+            rows = await pool.fetch(
+                f"""
+                SELECT {_select_list(columns)} FROM agent_runs WHERE task_id = $1
+                ORDER BY started_at DESC LIMIT $2
+                """,
+                task_id,
+                limit,
+            )
 
-            return result.data
+            return [dict(row) for row in rows]
 
         except Exception as e:
             logger.error("Failed to get task agent runs", task_id=task_id, error=str(e))
             return []
 
+    async def subscribe_task_agent_runs(
+        self,
+        task_id: str,
+    ) -> AsyncIterator[dict[str, Any]]:
+        """Yield agent_runs change payloads for a task as Realtime pushes them.
+
+        An event-driven alternative to polling get_task_agent_runs. A failed
+        or closed subscription is re-established with exponential backoff;
+        after REALTIME_MAX_ATTEMPTS consecutive failures the error is raised.
+        With no events for REALTIME_IDLE_TIMEOUT_SECONDS the subscription is
+        re-established too, since a dropped socket is otherwise silent.
+
+        Changes made while resubscribing aren't replayed, so once each new
+        subscription is confirmed {"type": "snapshot", "records": [...]} is
+        yielded, holding the task's runs as re-read with get_task_agent_runs.
+        """
+        attempts = 0
+        resubscribing = False
+        while True:
+            events: asyncio.Queue[
+                dict[str, Any] | RealtimeSubscribeStates | BaseException
+            ] = asyncio.Queue()
+            # Bound now so late callbacks from a closed client hit its own queue
+            push = events.put_nowait
+
+            def on_status(
+                state: RealtimeSubscribeStates,
+                error: Exception | None,
+                push: Any = push,
+            ) -> None:
+                if state == RealtimeSubscribeStates.SUBSCRIBED:
+                    push(state)
+                else:
+                    push(error or ConnectionError(f"Realtime subscription {state.value}"))
+
+            idle = False
+            error: BaseException | None = None
+            client = _realtime_client()
+            try:
+                channel = client.channel(f"task:{task_id}")
+                channel.on_postgres_changes(
+                    "*",
+                    callback=push,
+                    schema="public",
+                    table="agent_runs",
+                    filter=f"task_id=eq.{task_id}",
+                )
+                await channel.subscribe(on_status)
+                while True:
+                    try:
+                        event = await asyncio.wait_for(
+                            events.get(), REALTIME_IDLE_TIMEOUT_SECONDS
+                        )
+                    except TimeoutError:
+                        idle = True
+                        break
+                    if isinstance(event, BaseException):
+                        error = event
+                        break
+                    if event is RealtimeSubscribeStates.SUBSCRIBED:
+                        attempts = 0
+                        if resubscribing:
+                            records = await self.get_task_agent_runs(task_id)
+                            yield {"type": "snapshot", "records": records}
+                        continue
+                    yield event
+            except Exception as e:
+                error = e
+            finally:
+                with suppress(Exception):
+                    await client.close()
+
+            resubscribing = True
+            if idle:
+                logger.debug("Agent run subscription idle, resubscribing", task_id=task_id)
+                continue
+
+            attempts += 1
+            if attempts >= REALTIME_MAX_ATTEMPTS:
+                logger.error(
+                    "Agent run subscription failed", task_id=task_id, error=str(error)
+                )
+                raise ConnectionError(
+                    f"Realtime subscription for task {task_id} failed"
+                ) from error
+
+            delay = min(
+                REALTIME_BACKOFF_INITIAL_SECONDS * 2 ** (attempts - 1),
+                REALTIME_BACKOFF_MAX_SECONDS,
+            )
+            logger.warning(
+                "Agent run subscription lost, retrying",
+                task_id=task_id,
+                attempt=attempts,
+                delay=delay,
+                error=str(error),
+            )
+            await asyncio.sleep(delay)
+
     async def get_active_agent_runs(
         self,
         user_id: str,
     ) -> list[dict[str, Any]]:
-        """Get all active (in-progress) agent runs for a user."""
+        """Get all active (in-progress) agent runs for a user.
+
+        Returns the ACTIVE_RUN_COLUMNS the dashboard shows, not full rows.
+        """
         try:
-            result = self.client.table("agent_runs").select("*").eq(
-                "user_id", user_id
-            ).in_(
-                "status",
-                ["pending", "in_progress", "awaiting_verification", "verification_in_progress"]
-            ).order("started_at", desc=True).execute()
+            pool = await get_pool()
+            rows = await pool.fetch(
+                f"""
+                SELECT {_select_list(ACTIVE_RUN_COLUMNS)} FROM agent_runs
+                WHERE user_id = $1 AND status = ANY($2::text[])
+                ORDER BY started_at DESC
+                """,
+                user_id,
+                ACTIVE_RUN_STATUSES,
+            )
 
-            return result.data
+            return [dict(row) for row in rows]
 
         except Exception as e:
             logger.error("Failed to get active agent runs", user_id=user_id, error=str(e))
@@ -361,19 +872,27 @@ class SupabaseStateStore:
             Created memory entry
         """
         try:
-            result = self.client.table("domain_memories").insert({
-                "domain": domain,
-                "category": category,
-                "key": key,
-                "value": value,
-                "user_id": user_id,
-                "embedding": embedding,
-                "source": source,
-                "tags": tags or [],
-            }).execute()
-
-            memory = result.data[0] if result.data else None
+            pool = await get_pool()
+            row = await pool.fetchrow(
+                """
+                INSERT INTO domain_memories
+                    (domain, category, key, value, user_id, embedding, source, tags)
+                VALUES ($1, $2, $3, $4, $5, $6::halfvec, $7, $8)
+                RETURNING *
+                """,
+                domain,
+                category,
+                key,
+                value,
+                user_id,
+                embedding,
+                source,
+                tags or [],
+            )
+
+            memory = dict(row) if row else None
             if memory:
+                _memory_cache.set(memory["id"], memory)
                 logger.info(
                     "Created memory",
                     domain=domain,
@@ -389,17 +908,36 @@ class SupabaseStateStore:
 
     async def get_memory(self, memory_id: str) -> dict[str, Any] | None:
         """Get a memory entry by ID."""
+        cached = _memory_cache.get(memory_id)
+        if cached is not None:
+            return cached
+
         try:
-            result = self.client.table("domain_memories").select("*").eq(
-                "id", memory_id
-            ).single().execute()
+            pool = await get_pool()
+            row = await pool.fetchrow("SELECT * FROM domain_memories WHERE id = $1", memory_id)
 
-            return result.data
+            if not row:
+                return None
+            memory = dict(row)
+            _memory_cache.set(memory_id, memory)
+            return memory
 
         except Exception as e:
             logger.error("Failed to get memory", memory_id=memory_id, error=str(e))
             return None
 
+    async def get_memories_by_ids(
+        self,
+        memory_ids: list[str],
+    ) -> dict[str, dict[str, Any]]:
+        """Get many memory entries in one query, keyed by id (missing ids are absent)."""
+        try:
+            return await _fetch_rows_by_ids("domain_memories", memory_ids, _memory_cache)
+
+        except Exception as e:
+            logger.error("Failed to get memories", count=len(memory_ids), error=str(e))
+            return {}
+
     async def update_memory(
         self,
         memory_id: str,
@@ -415,13 +953,27 @@ class SupabaseStateStore:
             Updated memory entry
         """
         try:
-            result = self.client.table("domain_memories").update(updates).eq(
-                "id", memory_id
-            ).execute()
+            if not updates:
+                return await self.get_memory(memory_id)
+
+            params: list[Any] = [memory_id]
+            assignments: list[str] = []
+            for column, value in updates.items():
+                params.append(value)
+                assignments.append(f"{_quote_ident(column)} = ${len(params)}")
+
+            pool = await get_pool()
+            row = await pool.fetchrow(
+                f"UPDATE domain_memories SET {', '.join(assignments)} WHERE id = $1 RETURNING *",
+                *params,
+            )
 
-            memory = result.data[0] if result.data else None
+            memory = dict(row) if row else None
             if memory:
+                _memory_cache.set(memory_id, memory)
                 logger.info("Updated memory", memory_id=memory_id, updates=list(updates.keys()))
+            else:
+                _memory_cache.pop(memory_id)
             return memory
 
         except Exception as e:
@@ -438,11 +990,13 @@ class SupabaseStateStore:
             True if deleted, False if not found
         """
         try:
-            result = self.client.table("domain_memories").delete().eq(
-                "id", memory_id
-            ).execute()
+            pool = await get_pool()
+            deleted = await pool.fetchval(
+                "DELETE FROM domain_memories WHERE id = $1 RETURNING id", memory_id
+            )
 
-            success = bool(result.data)
+            _memory_cache.pop(memory_id)
+            success = deleted is not None
             if success:
                 logger.info("Deleted memory", memory_id=memory_id)
             return success
@@ -459,6 +1013,7 @@ class SupabaseStateStore:
         tags: list[str] | None = None,
         limit: int = 10,
         offset: int = 0,
+        columns: Sequence[str] | None = None,
     ) -> list[dict[str, Any]]:
         """Query memories with filters.
 
@@ -469,27 +1024,34 @@ class SupabaseStateStore:
             tags: Filter by tags (must contain all)
             limit: Maximum results
             offset: Result offset for pagination
+            columns: Columns to return (all if None)
 
         Returns:
             List of matching memory entries
         """
         try:
-            query = self.client.table("domain_memories").select("*")
-
-            if domain:
-                query = query.eq("domain", domain)
-            if category:
-                query = query.eq("category", category)
-            if user_id:
-                query = query.eq("user_id", user_id)
+            params: list[Any] = []
+            conditions: list[str] = []
+            for column, value in (("domain", domain), ("category", category), ("user_id", user_id)):
+                if value:
+                    params.append(value)
+                    conditions.append(f"{column} = ${len(params)}")
             if tags:
-                for tag in tags:
-                    query = query.contains("tags", [tag])
-
-            query = query.order("created_at", desc=True).range(offset, offset + limit - 1)
-
-            result = query.execute()
-            return result.data
+                params.append(tags)
+                conditions.append(f"tags @> ${len(params)}::jsonb")
+
+            where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+            params.extend([limit, offset])
+
+            pool = await get_pool()
+            rows = await pool.fetch(
+                f"""
+                SELECT {_select_list(columns)} FROM domain_memories {where}
+                ORDER BY created_at DESC LIMIT ${len(params) - 1} OFFSET ${len(params)}
+                """,
+                *params,
+            )
+            return [dict(row) for row in rows]
 
         except Exception as e:
             logger.error("Failed to query memories", error=str(e))
@@ -516,21 +1078,24 @@ class SupabaseStateStore:
             List of similar memories with similarity scores
         """
         try:
-            import json
-
-            result = self.client.rpc(
-                "find_similar_memories",
-                {
-                    "query_embedding": json.dumps(query_embedding),
-                    "match_threshold": match_threshold,
-                    "match_count": match_count,
-                    "filter_domain": domain,
-                    "filter_user_id": user_id,
-                },
-            ).execute()
+            pool = await get_pool()
+            rows = await pool.fetch(
+                "SELECT * FROM find_similar_memories($1::vector, $2, $3, $4, $5)",
+                query_embedding,
+                match_threshold,
+                match_count,
+                domain,
+                user_id,
+            )
 
-            return result.data or []
+            return [dict(row) for row in rows]
 
         except Exception as e:
             logger.error("Failed to find similar memories", error=str(e))
             return []
+
+
+@lru_cache
+def get_state_store() -> SupabaseStateStore:
+    """Return the shared state store."""
+    return SupabaseStateStore()
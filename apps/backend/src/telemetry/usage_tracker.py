@@ -1,50 +1,60 @@
 """Usage tracking for API calls and costs."""
 
-from decimal import Decimal
+import asyncio
 from typing import Any
 
-from src.state.supabase import SupabaseStateStore
+from src.state.pg_pool import get_pool
+from src.state.supabase import get_state_store
 from src.utils import get_logger
 
 logger = get_logger(__name__)
 
+# Usage rows are buffered and written in batches of up to this many rows,
+# at most USAGE_FLUSH_INTERVAL_SECONDS after the first row of a batch arrives
+USAGE_FLUSH_MAX_ROWS = 100
+USAGE_FLUSH_INTERVAL_SECONDS = 0.5
+# Rows beyond this are dropped (with a warning) rather than growing unbounded
+USAGE_QUEUE_MAX_SIZE = 10_000
+
+# Costs are bound as float8 and cast by the numeric columns
+INSERT_USAGE_SQL = """
+    INSERT INTO api_usage (
+        agent_run_id, provider, model, input_tokens, output_tokens,
+        cost_per_input_token, cost_per_output_token, metadata
+    )
+    VALUES ($1, $2, $3, $4, $5, $6::float8, $7::float8, $8)
+"""
+
 
-# Model pricing (updated as of December 2024)
-MODEL_PRICING = {
+# Model pricing in USD per token as (input, output) (updated as of December 2024)
+MODEL_PRICING: dict[str, tuple[float, float]] = {
     # Anthropic models
-    "claude-opus-4-5-20251101": {
-        "input": Decimal("0.000015"),  # $15 per million tokens
-        "output": Decimal("0.000075"),  # $75 per million tokens
-    },
-    "claude-sonnet-4-5-20250929": {
-        "input": Decimal("0.000003"),  # $3 per million tokens
-        "output": Decimal("0.000015"),  # $15 per million tokens
-    },
-    "claude-3-5-sonnet-20241022": {
-        "input": Decimal("0.000003"),  # $3 per million tokens
-        "output": Decimal("0.000015"),  # $15 per million tokens
-    },
-    "claude-3-5-haiku-20241022": {
-        "input": Decimal("0.0000008"),  # $0.80 per million tokens
-        "output": Decimal("0.000004"),  # $4 per million tokens
-    },
+    "claude-opus-4-5-20251101": (15e-6, 75e-6),  # $15 / $75 per million tokens
+    "claude-sonnet-4-5-20250929": (3e-6, 15e-6),  # $3 / $15 per million tokens
+    "claude-3-5-sonnet-20241022": (3e-6, 15e-6),  # $3 / $15 per million tokens
+    "claude-3-5-haiku-20241022": (0.8e-6, 4e-6),  # $0.80 / $4 per million tokens
     # OpenAI models
-    "text-embedding-3-small": {
-        "input": Decimal("0.00000002"),  # $0.02 per million tokens
-        "output": Decimal("0"),  # No output for embeddings
-    },
-    "text-embedding-3-large": {
-        "input": Decimal("0.00000013"),  # $0.13 per million tokens
-        "output": Decimal("0"),
-    },
+    "text-embedding-3-small": (0.02e-6, 0.0),  # $0.02 per million tokens, no output
+    "text-embedding-3-large": (0.13e-6, 0.0),  # $0.13 per million tokens, no output
 }
+# Fallback for models missing from the table
+DEFAULT_PRICING = (1e-6, 5e-6)
 
 
 class UsageTracker:
-    """Track API usage and costs."""
+    """Track API usage and costs.
+
+    track_api_call only enqueues the row; a background task writes queued
+    rows in batches so telemetry stays off the request path.
+    """
 
     def __init__(self) -> None:
-        self.supabase = SupabaseStateStore()
+        self.supabase = get_state_store()
+        # None is the shutdown sentinel for the flusher
+        self._queue: asyncio.Queue[tuple[Any, ...] | None] = asyncio.Queue(
+            maxsize=USAGE_QUEUE_MAX_SIZE
+        )
+        self._flusher: asyncio.Task[None] | None = None
 
     async def track_api_call(
         self,
@@ -57,27 +67,21 @@ class UsageTracker:
     ) -> None:
         """Track an API call for cost analysis."""
         try:
-            # Get pricing for model
-            pricing = MODEL_PRICING.get(
-                model,
-                {
-                    "input": Decimal("0.000001"),  # Default fallback
-                    "output": Decimal("0.000005"),
-                },
+            cost_per_input_token, cost_per_output_token = MODEL_PRICING.get(
+                model, DEFAULT_PRICING
             )
-
-            data = {
-                "agent_run_id": agent_run_id,
-                "provider": provider,
-                "model": model,
-                "input_tokens": input_tokens,
-                "output_tokens": output_tokens,
-                "cost_per_input_token": float(pricing["input"]),
-                "cost_per_output_token": float(pricing["output"]),
-                "metadata": metadata or {},
-            }
-
-            self.supabase.client.table("api_usage").insert(data).execute()
+            self._queue.put_nowait((
+                agent_run_id,
+                provider,
+                model,
+                input_tokens,
+                output_tokens,
+                cost_per_input_token,
+                cost_per_output_token,
+                metadata or {},
+            ))
+            if self._flusher is None:
+                self._flusher = asyncio.create_task(self._flush_loop())
 
             logger.debug(
                 "API usage tracked",
@@ -86,10 +90,57 @@ class UsageTracker:
                 output_tokens=output_tokens,
             )
 
+        except asyncio.QueueFull:
+            logger.warning("API usage queue full, dropping row", model=model)
+
         except Exception as e:
             logger.error("Failed to track API usage", error=str(e))
             # Don't raise - telemetry failures shouldn't break execution
 
+    async def aclose(self) -> None:
+        """Write out every queued row and stop the flusher."""
+        if self._flusher is None:
+            return
+
+        await self._queue.put(None)
+        await self._flusher
+        self._flusher = None
+
+    async def _flush_loop(self) -> None:
+        """Collect queued rows into batches and write them until shut down."""
+        loop = asyncio.get_running_loop()
+        while True:
+            row = await self._queue.get()
+            if row is None:
+                return
+
+            batch = [row]
+            deadline = loop.time() + USAGE_FLUSH_INTERVAL_SECONDS
+            stopping = False
+            while len(batch) < USAGE_FLUSH_MAX_ROWS:
+                try:
+                    row = await asyncio.wait_for(self._queue.get(), deadline - loop.time())
+                except TimeoutError:
+                    break
+                if row is None:
+                    stopping = True
+                    break
+                batch.append(row)
+
+            await self._write(batch)
+            if stopping:
+                return
+
+    async def _write(self, batch: list[tuple[Any, ...]]) -> None:
+        """Insert a batch of usage rows in one pipelined round trip."""
+        try:
+            pool = await get_pool()
+            await pool.executemany(INSERT_USAGE_SQL, batch)
+            logger.debug("API usage flushed", rows=len(batch))
+
+        except Exception as e:
+            logger.error("Failed to write API usage", rows=len(batch), error=str(e))
+
 
 # Global instance
 _tracker: UsageTracker | None = None
@@ -103,6 +154,12 @@ def get_tracker() -> UsageTracker:
     return _tracker
 
 
+async def aclose_tracker() -> None:
+    """Flush and stop the global tracker, if one was created."""
+    if _tracker is not None:
+        await _tracker.aclose()
+
+
 async def track_api_call(
     agent_run_id: str,
     provider: str,
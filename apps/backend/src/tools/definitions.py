@@ -9,8 +9,15 @@ Tools are organized by category:
 - CORE: Always loaded, frequently used
 - DEFERRED: Loaded on-demand via Tool Search
 - PROGRAMMATIC: Can be called from code execution
+
+Each tool is a spec in ``_TOOL_SPECS`` (ToolDefinition keyword arguments).
+Deferred tools are registered as factories, so their definitions are only
+constructed when something first asks for them.
 """
 
+from functools import cache, partial
+from typing import Any, Final
+
 from .registry import (
     ToolDefinition,
     ToolConfig,
@@ -21,548 +28,989 @@ from .registry import (
 )
 
 
-def register_core_tools(registry: ToolRegistry) -> None:
-    """Register core tools that are always loaded.
+# Schema fragments and settings repeated across tools, shared by all of them
+_STRING_SCHEMA: Final[dict[str, Any]] = {"type": "string"}
+_CODE_EXECUTION_CALLERS: Final[tuple[str, ...]] = ("code_execution_20250825",)
 
-    These are high-frequency tools that should always be available.
-    Keep this list minimal (3-5 tools) to preserve context.
-    """
 
-    # Health Check - Always available
-    registry.register(
-        ToolDefinition(
-            name="health_check",
-            description="Check system health status including all dependencies",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "deep": {
-                        "type": "boolean",
-                        "description": "Perform deep health check including all dependencies",
-                        "default": False,
-                    },
-                },
-            },
-            config=ToolConfig(
-                defer_loading=False,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-                cache_results=True,
-                cache_ttl_seconds=30,
-            ),
-            examples=[
-                ToolExample(
-                    description="Quick health check",
-                    input={},
-                    expected_behavior="Returns basic health status",
-                ),
-                ToolExample(
-                    description="Deep health check with dependencies",
-                    input={"deep": True},
-                    expected_behavior="Checks database, backend, and verification system",
-                ),
-            ],
-            categories=[ToolCategory.CORE, ToolCategory.MONITORING],
-            keywords=["health", "status", "ping", "alive", "check"],
-        )
-    )
-
-    # Task Status - Core workflow tool
-    registry.register(
-        ToolDefinition(
-            name="get_task_status",
-            description="Get the current status of a task by ID",
-            input_schema={
+# Input schemas and examples are pure data: built once at import and shared
+# by every registration, instead of rebuilt each time a tool is defined
+_HEALTH_CHECK_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "deep": {
+            "type": "boolean",
+            "description": "Perform deep health check including all dependencies",
+            "default": False,
+        },
+    },
+}
+_HEALTH_CHECK_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Quick health check",
+        input={},
+        expected_behavior="Returns basic health status",
+    ),
+    ToolExample(
+        description="Deep health check with dependencies",
+        input={"deep": True},
+        expected_behavior="Checks database, backend, and verification system",
+    ),
+)
+
+_GET_TASK_STATUS_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "task_id": {
+            "type": "string",
+            "description": "The unique task identifier",
+        },
+    },
+    "required": ["task_id"],
+}
+_GET_TASK_STATUS_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Check task status",
+        input={"task_id": "task_abc123"},
+        expected_behavior="Returns task status, progress, and any errors",
+    ),
+)
+
+_VERIFICATION_VERIFY_TASK_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "task_id": {
+            "type": "string",
+            "description": "Task to verify",
+        },
+        "criteria": {
+            "type": "array",
+            "items": {
                 "type": "object",
                 "properties": {
-                    "task_id": {
+                    "type": {
                         "type": "string",
-                        "description": "The unique task identifier",
+                        "enum": [
+                            "file_exists",
+                            "file_not_empty",
+                            "no_placeholders",
+                            "code_compiles",
+                            "tests_pass",
+                        ],
                     },
+                    "target": _STRING_SCHEMA,
                 },
-                "required": ["task_id"],
             },
-            config=ToolConfig(
-                defer_loading=False,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Check task status",
-                    input={"task_id": "task_abc123"},
-                    expected_behavior="Returns task status, progress, and any errors",
-                ),
+            "description": "Verification criteria to check",
+        },
+    },
+    "required": ["task_id", "criteria"],
+}
+_VERIFICATION_VERIFY_TASK_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Verify file creation",
+        input={
+            "task_id": "task_123",
+            "criteria": [
+                {"type": "file_exists", "target": "/src/component.tsx"},
+                {"type": "no_placeholders", "target": "/src/component.tsx"},
+            ],
+        },
+        expected_behavior="Returns verification result with evidence",
+    ),
+    ToolExample(
+        description="Verify code compiles",
+        input={
+            "task_id": "task_456",
+            "criteria": [
+                {"type": "code_compiles", "target": "pnpm type-check"},
+                {"type": "tests_pass", "target": "pnpm test"},
             ],
-            categories=[ToolCategory.CORE],
-            keywords=["task", "status", "progress", "check"],
-        )
-    )
+        },
+    ),
+)
 
+_VERIFICATION_COLLECT_EVIDENCE_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "type": {
+            "type": "string",
+            "enum": ["screenshot", "log", "metric", "trace"],
+        },
+        "source": _STRING_SCHEMA,
+        "category": {
+            "type": "string",
+            "enum": ["pass", "fail", "warning", "info"],
+        },
+        "content": _STRING_SCHEMA,
+        "metadata": {"type": "object"},
+    },
+    "required": ["type", "source", "category", "content"],
+}
 
-def register_verification_tools(registry: ToolRegistry) -> None:
-    """Register verification tools - deferred for context efficiency."""
-
-    # Independent Verification
-    registry.register(
-        ToolDefinition(
-            name="verification.verify_task",
-            description="Independently verify a task's outputs without self-attestation",
-            input_schema={
+_AUDIT_RUN_JOURNEY_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "journey_id": {
+            "type": "string",
+            "description": "ID of predefined journey or 'custom'",
+        },
+        "steps": {
+            "type": "array",
+            "items": {
                 "type": "object",
                 "properties": {
-                    "task_id": {
-                        "type": "string",
-                        "description": "Task to verify",
-                    },
-                    "criteria": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "type": {
-                                    "type": "string",
-                                    "enum": [
-                                        "file_exists",
-                                        "file_not_empty",
-                                        "no_placeholders",
-                                        "code_compiles",
-                                        "tests_pass",
-                                    ],
-                                },
-                                "target": {"type": "string"},
-                            },
-                        },
-                        "description": "Verification criteria to check",
-                    },
+                    "action": _STRING_SCHEMA,
+                    "target": _STRING_SCHEMA,
+                    "expected": _STRING_SCHEMA,
                 },
-                "required": ["task_id", "criteria"],
             },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Verify file creation",
-                    input={
-                        "task_id": "task_123",
-                        "criteria": [
-                            {"type": "file_exists", "target": "/src/component.tsx"},
-                            {"type": "no_placeholders", "target": "/src/component.tsx"},
-                        ],
-                    },
-                    expected_behavior="Returns verification result with evidence",
-                ),
-                ToolExample(
-                    description="Verify code compiles",
-                    input={
-                        "task_id": "task_456",
-                        "criteria": [
-                            {"type": "code_compiles", "target": "pnpm type-check"},
-                            {"type": "tests_pass", "target": "pnpm test"},
-                        ],
-                    },
-                ),
+            "description": "Journey steps (required if journey_id is 'custom')",
+        },
+    },
+    "required": ["journey_id"],
+}
+_AUDIT_RUN_JOURNEY_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Run health check journey",
+        input={"journey_id": "health_check"},
+        expected_behavior="Executes all health endpoints and reports results",
+    ),
+    ToolExample(
+        description="Run custom journey",
+        input={
+            "journey_id": "custom",
+            "steps": [
+                {"action": "navigate", "target": "/", "expected": "page loads"},
+                {"action": "click", "target": "#login", "expected": "modal opens"},
             ],
-            categories=[ToolCategory.VERIFICATION],
-            keywords=["verify", "check", "validate", "confirm", "evidence"],
-            aliases=["verify", "check_task", "validate_output"],
-        )
-    )
-
-    # Evidence Collection
-    registry.register(
-        ToolDefinition(
-            name="verification.collect_evidence",
-            description="Collect and store evidence for verification claims",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "type": {
-                        "type": "string",
-                        "enum": ["screenshot", "log", "metric", "trace"],
-                    },
-                    "source": {"type": "string"},
-                    "category": {
-                        "type": "string",
-                        "enum": ["pass", "fail", "warning", "info"],
-                    },
-                    "content": {"type": "string"},
-                    "metadata": {"type": "object"},
-                },
-                "required": ["type", "source", "category", "content"],
+        },
+    ),
+)
+
+_AUDIT_AUDIT_ROUTES_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "routes": {
+            "type": "array",
+            "items": _STRING_SCHEMA,
+            "description": "Specific routes to audit (empty = all routes)",
+        },
+        "checks": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": [
+                    "security",
+                    "validation",
+                    "error_handling",
+                    "performance",
+                    "documentation",
+                ],
             },
-            config=ToolConfig(
-                defer_loading=True,
-                parallel_safe=True,
-            ),
-            categories=[ToolCategory.VERIFICATION],
-            keywords=["evidence", "collect", "store", "proof", "capture"],
-        )
-    )
+            "description": "Types of checks to perform",
+        },
+    },
+}
+_AUDIT_AUDIT_ROUTES_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Full route audit",
+        input={"routes": [], "checks": ["security", "validation", "error_handling"]},
+    ),
+    ToolExample(
+        description="Security audit only",
+        input={"routes": ["/api/auth/*"], "checks": ["security"]},
+    ),
+)
 
+_AUDIT_DETECT_FRICTION_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "journey_result_id": {
+            "type": "string",
+            "description": "ID of a completed journey result to analyze",
+        },
+    },
+    "required": ["journey_result_id"],
+}
 
-def register_audit_tools(registry: ToolRegistry) -> None:
-    """Register audit tools - deferred for context efficiency."""
-
-    # User Journey Runner
-    registry.register(
-        ToolDefinition(
-            name="audit.run_journey",
-            description="Execute a user journey and collect evidence at each step",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "journey_id": {
-                        "type": "string",
-                        "description": "ID of predefined journey or 'custom'",
-                    },
-                    "steps": {
-                        "type": "array",
-                        "items": {
-                            "type": "object",
-                            "properties": {
-                                "action": {"type": "string"},
-                                "target": {"type": "string"},
-                                "expected": {"type": "string"},
-                            },
-                        },
-                        "description": "Journey steps (required if journey_id is 'custom')",
-                    },
-                },
-                "required": ["journey_id"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=False,
-            ),
-            examples=[
-                ToolExample(
-                    description="Run health check journey",
-                    input={"journey_id": "health_check"},
-                    expected_behavior="Executes all health endpoints and reports results",
-                ),
-                ToolExample(
-                    description="Run custom journey",
-                    input={
-                        "journey_id": "custom",
-                        "steps": [
-                            {"action": "navigate", "target": "/", "expected": "page loads"},
-                            {"action": "click", "target": "#login", "expected": "modal opens"},
-                        ],
-                    },
-                ),
-            ],
-            categories=[ToolCategory.AUDIT],
-            keywords=["journey", "flow", "user", "test", "e2e", "integration"],
-        )
-    )
-
-    # API Route Auditor
-    registry.register(
-        ToolDefinition(
-            name="audit.audit_routes",
-            description="Audit API routes for security, validation, and error handling",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "routes": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Specific routes to audit (empty = all routes)",
-                    },
-                    "checks": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": [
-                                "security",
-                                "validation",
-                                "error_handling",
-                                "performance",
-                                "documentation",
-                            ],
-                        },
-                        "description": "Types of checks to perform",
-                    },
-                },
+_AUDIT_GENERATE_REPORT_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "format": {
+            "type": "string",
+            "enum": ["json", "markdown", "html"],
+            "default": "markdown",
+        },
+        "include": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": [
+                    "health",
+                    "journeys",
+                    "routes",
+                    "friction",
+                    "recommendations",
+                ],
             },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Full route audit",
-                    input={"routes": [], "checks": ["security", "validation", "error_handling"]},
-                ),
-                ToolExample(
-                    description="Security audit only",
-                    input={"routes": ["/api/auth/*"], "checks": ["security"]},
-                ),
-            ],
-            categories=[ToolCategory.AUDIT, ToolCategory.API],
-            keywords=["audit", "routes", "api", "security", "validation"],
-        )
-    )
-
-    # Friction Detector
-    registry.register(
-        ToolDefinition(
-            name="audit.detect_friction",
-            description="Analyze user journeys for UX friction points",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "journey_result_id": {
-                        "type": "string",
-                        "description": "ID of a completed journey result to analyze",
-                    },
-                },
-                "required": ["journey_result_id"],
+        },
+    },
+}
+_AUDIT_GENERATE_REPORT_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Full markdown report",
+        input={"format": "markdown", "include": ["health", "journeys", "routes", "recommendations"]},
+    ),
+    ToolExample(
+        description="JSON health report",
+        input={"format": "json", "include": ["health"]},
+    ),
+)
+
+_DATABASE_QUERY_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "table": {
+            "type": "string",
+            "description": "Table to query",
+        },
+        "select": {
+            "type": "array",
+            "items": _STRING_SCHEMA,
+            "description": "Columns to select",
+        },
+        "filters": {
+            "type": "object",
+            "description": "Filter conditions",
+        },
+        "limit": {
+            "type": "integer",
+            "default": 100,
+        },
+    },
+    "required": ["table"],
+}
+_DATABASE_QUERY_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Query users",
+        input={
+            "table": "profiles",
+            "select": ["id", "email", "created_at"],
+            "filters": {"status": "active"},
+            "limit": 50,
+        },
+    ),
+    ToolExample(
+        description="Query recent evidence",
+        input={
+            "table": "audit_evidence",
+            "select": ["*"],
+            "filters": {"category": "fail"},
+            "limit": 10,
+        },
+    ),
+)
+
+_DATABASE_INSERT_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "table": _STRING_SCHEMA,
+        "data": {"type": "object"},
+    },
+    "required": ["table", "data"],
+}
+
+_FILE_READ_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "path": {
+            "type": "string",
+            "description": "Absolute path to file",
+        },
+        "encoding": {
+            "type": "string",
+            "default": "utf-8",
+        },
+    },
+    "required": ["path"],
+}
+_FILE_READ_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Read TypeScript file",
+        input={"path": "/src/components/Button.tsx"},
+    ),
+    ToolExample(
+        description="Read JSON config",
+        input={"path": "/package.json", "encoding": "utf-8"},
+    ),
+)
+
+_FILE_WRITE_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "path": _STRING_SCHEMA,
+        "content": _STRING_SCHEMA,
+        "encoding": {"type": "string", "default": "utf-8"},
+    },
+    "required": ["path", "content"],
+}
+
+_FILE_LIST_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "path": _STRING_SCHEMA,
+        "pattern": {
+            "type": "string",
+            "description": "Glob pattern (e.g., '*.ts')",
+        },
+        "recursive": {"type": "boolean", "default": False},
+    },
+    "required": ["path"],
+}
+_FILE_LIST_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="List TypeScript files",
+        input={"path": "/src", "pattern": "*.ts", "recursive": True},
+    ),
+)
+
+_COPYWRITING_RESEARCH_AUDIENCE_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "business_id": {
+            "type": "string",
+            "description": "ID of the business",
+        },
+        "sources": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": ["reviews", "forums", "social", "interviews", "support"],
             },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-            ),
-            categories=[ToolCategory.AUDIT],
-            keywords=["friction", "ux", "usability", "analyze"],
-        )
-    )
-
-    # Report Generator
-    registry.register(
-        ToolDefinition(
-            name="audit.generate_report",
-            description="Generate comprehensive audit report in various formats",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "format": {
-                        "type": "string",
-                        "enum": ["json", "markdown", "html"],
-                        "default": "markdown",
-                    },
-                    "include": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": [
-                                "health",
-                                "journeys",
-                                "routes",
-                                "friction",
-                                "recommendations",
-                            ],
-                        },
-                    },
-                },
+            "description": "Data sources to search",
+        },
+        "category": {
+            "type": "string",
+            "enum": ["pain_point", "symptom", "dream_outcome", "failed_solution", "buying_decision"],
+            "description": "Category of quotes to collect",
+        },
+    },
+    "required": ["business_id"],
+}
+_COPYWRITING_RESEARCH_AUDIENCE_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Collect pain points from reviews",
+        input={
+            "business_id": "biz_123",
+            "sources": ["reviews", "forums"],
+            "category": "pain_point",
+        },
+        expected_behavior="Returns exact customer quotes categorized by type",
+    ),
+)
+
+_COPYWRITING_ANALYZE_COMPETITOR_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "competitor_url": {
+            "type": "string",
+            "description": "URL of competitor page to analyze",
+        },
+        "page_type": {
+            "type": "string",
+            "enum": ["homepage", "services", "about", "contact", "pricing", "faq"],
+            "description": "Type of page being analyzed",
+        },
+    },
+    "required": ["competitor_url", "page_type"],
+}
+_COPYWRITING_ANALYZE_COMPETITOR_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Analyze competitor homepage",
+        input={
+            "competitor_url": "https://competitor.com.au",
+            "page_type": "homepage",
+        },
+        expected_behavior="Returns page sections in order with notes",
+    ),
+)
+
+_COPYWRITING_GENERATE_COPY_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "business_id": {
+            "type": "string",
+            "description": "ID of the business",
+        },
+        "page_type": {
+            "type": "string",
+            "enum": ["homepage", "services", "about", "contact", "landing"],
+            "description": "Type of page to generate copy for",
+        },
+        "section": {
+            "type": "string",
+            "enum": ["hero", "problem", "value_props", "social_proof", "process", "faq", "cta"],
+            "description": "Specific section (optional)",
+        },
+        "research_ids": {
+            "type": "array",
+            "items": _STRING_SCHEMA,
+            "description": "IDs of audience research to use as inspiration",
+        },
+    },
+    "required": ["business_id", "page_type"],
+}
+_COPYWRITING_GENERATE_COPY_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Generate homepage hero",
+        input={
+            "business_id": "biz_123",
+            "page_type": "homepage",
+            "section": "hero",
+            "research_ids": ["research_abc", "research_def"],
+        },
+        expected_behavior="Returns unique, customer-voice copy with claims to verify",
+    ),
+)
+
+_COPYWRITING_VALIDATE_COPY_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "content": {
+            "type": "string",
+            "description": "Copy content to validate",
+        },
+        "checks": {
+            "type": "array",
+            "items": {
+                "type": "string",
+                "enum": ["plagiarism", "uniqueness", "verifiability", "jargon", "tone"],
             },
-            config=ToolConfig(
-                defer_loading=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Full markdown report",
-                    input={"format": "markdown", "include": ["health", "journeys", "routes", "recommendations"]},
-                ),
-                ToolExample(
-                    description="JSON health report",
-                    input={"format": "json", "include": ["health"]},
-                ),
-            ],
-            categories=[ToolCategory.AUDIT],
-            keywords=["report", "generate", "summary", "export"],
-        )
-    )
+            "description": "Validation checks to run",
+        },
+    },
+    "required": ["content"],
+}
+_COPYWRITING_VALIDATE_COPY_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Full integrity check",
+        input={
+            "content": "Your copy here...",
+            "checks": ["plagiarism", "uniqueness", "verifiability"],
+        },
+        expected_behavior="Returns integrity scores and claims requiring evidence",
+    ),
+)
+
+_CONSISTENCY_AUDIT_NAP_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "business_id": {
+            "type": "string",
+            "description": "ID of the business to audit",
+        },
+        "platform_tiers": {
+            "type": "array",
+            "items": {"type": "integer", "minimum": 1, "maximum": 5},
+            "description": "Platform tiers to audit (1-5)",
+        },
+    },
+    "required": ["business_id"],
+}
+_CONSISTENCY_AUDIT_NAP_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Full NAP audit",
+        input={
+            "business_id": "biz_123",
+            "platform_tiers": [1, 2, 3],
+        },
+        expected_behavior="Returns consistency score and platform-by-platform breakdown",
+    ),
+)
+
+_CONSISTENCY_GENERATE_SCHEMA_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "business_id": {
+            "type": "string",
+            "description": "ID of the business",
+        },
+        "schema_type": {
+            "type": "string",
+            "enum": ["LocalBusiness", "Organization", "FAQ", "HowTo", "Service"],
+            "description": "Type of schema to generate",
+        },
+    },
+    "required": ["business_id", "schema_type"],
+}
+_CONSISTENCY_GENERATE_SCHEMA_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Generate LocalBusiness schema",
+        input={
+            "business_id": "biz_123",
+            "schema_type": "LocalBusiness",
+        },
+        expected_behavior="Returns valid JSON-LD schema with all NAP data",
+    ),
+)
+
+_CONSISTENCY_CHECK_PLATFORM_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "business_id": {
+            "type": "string",
+            "description": "ID of the business",
+        },
+        "platform_name": {
+            "type": "string",
+            "description": "Platform to check (e.g., 'Google Business Profile')",
+        },
+        "listing_url": {
+            "type": "string",
+            "description": "URL of the listing to check",
+        },
+    },
+    "required": ["business_id", "platform_name"],
+}
+_CONSISTENCY_CHECK_PLATFORM_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Check Google Business Profile",
+        input={
+            "business_id": "biz_123",
+            "platform_name": "Google Business Profile",
+        },
+        expected_behavior="Returns field-by-field comparison with master document",
+    ),
+)
+
+_CONSISTENCY_EXPORT_MASTER_INPUT_SCHEMA: Final[dict[str, Any]] = {
+    "type": "object",
+    "properties": {
+        "business_id": {
+            "type": "string",
+            "description": "ID of the business",
+        },
+        "format": {
+            "type": "string",
+            "enum": ["yaml", "json", "markdown"],
+            "default": "yaml",
+            "description": "Export format",
+        },
+    },
+    "required": ["business_id"],
+}
+_CONSISTENCY_EXPORT_MASTER_EXAMPLES: Final[tuple[ToolExample, ...]] = (
+    ToolExample(
+        description="Export as YAML",
+        input={
+            "business_id": "biz_123",
+            "format": "yaml",
+        },
+        expected_behavior="Returns complete master document in YAML format",
+    ),
+)
+
+
+# One spec per tool: the ToolDefinition keyword arguments
+
+# Health Check - Always available
+_HEALTH_CHECK_SPEC: Final[dict[str, Any]] = {
+    "name": "health_check",
+    "description": "Check system health status including all dependencies",
+    "input_schema": _HEALTH_CHECK_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=False,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+        cache_results=True,
+        cache_ttl_seconds=30,
+    ),
+    "examples": _HEALTH_CHECK_EXAMPLES,
+    "categories": [ToolCategory.CORE, ToolCategory.MONITORING],
+    "keywords": ["health", "status", "ping", "alive", "check"],
+}
+
+# Task Status - Core workflow tool
+_GET_TASK_STATUS_SPEC: Final[dict[str, Any]] = {
+    "name": "get_task_status",
+    "description": "Get the current status of a task by ID",
+    "input_schema": _GET_TASK_STATUS_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=False,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _GET_TASK_STATUS_EXAMPLES,
+    "categories": [ToolCategory.CORE],
+    "keywords": ["task", "status", "progress", "check"],
+}
+
+# Independent Verification
+_VERIFICATION_VERIFY_TASK_SPEC: Final[dict[str, Any]] = {
+    "name": "verification.verify_task",
+    "description": "Independently verify a task's outputs without self-attestation",
+    "input_schema": _VERIFICATION_VERIFY_TASK_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _VERIFICATION_VERIFY_TASK_EXAMPLES,
+    "categories": [ToolCategory.VERIFICATION],
+    "keywords": ["verify", "check", "validate", "confirm", "evidence"],
+    "aliases": ["verify", "check_task", "validate_output"],
+}
+
+# Evidence Collection
+_VERIFICATION_COLLECT_EVIDENCE_SPEC: Final[dict[str, Any]] = {
+    "name": "verification.collect_evidence",
+    "description": "Collect and store evidence for verification claims",
+    "input_schema": _VERIFICATION_COLLECT_EVIDENCE_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        parallel_safe=True,
+    ),
+    "categories": [ToolCategory.VERIFICATION],
+    "keywords": ["evidence", "collect", "store", "proof", "capture"],
+}
+
+# User Journey Runner
+_AUDIT_RUN_JOURNEY_SPEC: Final[dict[str, Any]] = {
+    "name": "audit.run_journey",
+    "description": "Execute a user journey and collect evidence at each step",
+    "input_schema": _AUDIT_RUN_JOURNEY_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=False,
+    ),
+    "examples": _AUDIT_RUN_JOURNEY_EXAMPLES,
+    "categories": [ToolCategory.AUDIT],
+    "keywords": ["journey", "flow", "user", "test", "e2e", "integration"],
+}
+
+# API Route Auditor
+_AUDIT_AUDIT_ROUTES_SPEC: Final[dict[str, Any]] = {
+    "name": "audit.audit_routes",
+    "description": "Audit API routes for security, validation, and error handling",
+    "input_schema": _AUDIT_AUDIT_ROUTES_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _AUDIT_AUDIT_ROUTES_EXAMPLES,
+    "categories": [ToolCategory.AUDIT, ToolCategory.API],
+    "keywords": ["audit", "routes", "api", "security", "validation"],
+}
+
+# Friction Detector
+_AUDIT_DETECT_FRICTION_SPEC: Final[dict[str, Any]] = {
+    "name": "audit.detect_friction",
+    "description": "Analyze user journeys for UX friction points",
+    "input_schema": _AUDIT_DETECT_FRICTION_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+    ),
+    "categories": [ToolCategory.AUDIT],
+    "keywords": ["friction", "ux", "usability", "analyze"],
+}
+
+# Report Generator
+_AUDIT_GENERATE_REPORT_SPEC: Final[dict[str, Any]] = {
+    "name": "audit.generate_report",
+    "description": "Generate comprehensive audit report in various formats",
+    "input_schema": _AUDIT_GENERATE_REPORT_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+    ),
+    "examples": _AUDIT_GENERATE_REPORT_EXAMPLES,
+    "categories": [ToolCategory.AUDIT],
+    "keywords": ["report", "generate", "summary", "export"],
+}
+
+_DATABASE_QUERY_SPEC: Final[dict[str, Any]] = {
+    "name": "database.query",
+    "description": "Execute a database query and return results",
+    "input_schema": _DATABASE_QUERY_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+        cache_results=True,
+        cache_ttl_seconds=60,
+    ),
+    "examples": _DATABASE_QUERY_EXAMPLES,
+    "categories": [ToolCategory.DATABASE],
+    "keywords": ["database", "query", "select", "supabase", "sql"],
+    "aliases": ["db_query", "sql_query"],
+}
+
+_DATABASE_INSERT_SPEC: Final[dict[str, Any]] = {
+    "name": "database.insert",
+    "description": "Insert a record into a database table",
+    "input_schema": _DATABASE_INSERT_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=False,
+        retry_safe=False,
+    ),
+    "categories": [ToolCategory.DATABASE],
+    "keywords": ["database", "insert", "create", "add"],
+}
+
+_FILE_READ_SPEC: Final[dict[str, Any]] = {
+    "name": "file.read",
+    "description": "Read contents of a file",
+    "input_schema": _FILE_READ_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _FILE_READ_EXAMPLES,
+    "categories": [ToolCategory.FILE_SYSTEM],
+    "keywords": ["file", "read", "content", "load"],
+}
+
+_FILE_WRITE_SPEC: Final[dict[str, Any]] = {
+    "name": "file.write",
+    "description": "Write contents to a file",
+    "input_schema": _FILE_WRITE_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=False,
+    ),
+    "categories": [ToolCategory.FILE_SYSTEM],
+    "keywords": ["file", "write", "save", "create"],
+}
+
+_FILE_LIST_SPEC: Final[dict[str, Any]] = {
+    "name": "file.list",
+    "description": "List files in a directory matching a pattern",
+    "input_schema": _FILE_LIST_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _FILE_LIST_EXAMPLES,
+    "categories": [ToolCategory.FILE_SYSTEM],
+    "keywords": ["file", "list", "directory", "find", "glob"],
+}
+
+# Audience Research
+_COPYWRITING_RESEARCH_AUDIENCE_SPEC: Final[dict[str, Any]] = {
+    "name": "copywriting.research_audience",
+    "description": "Research audience pain points, symptoms, and desires from real sources",
+    "input_schema": _COPYWRITING_RESEARCH_AUDIENCE_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _COPYWRITING_RESEARCH_AUDIENCE_EXAMPLES,
+    "categories": [ToolCategory.MARKETING],
+    "keywords": ["research", "audience", "voice", "customer", "quotes", "pain", "copywriting"],
+}
+
+# Competitor Analysis
+_COPYWRITING_ANALYZE_COMPETITOR_SPEC: Final[dict[str, Any]] = {
+    "name": "copywriting.analyze_competitor",
+    "description": "Analyze competitor pages for structure and sections",
+    "input_schema": _COPYWRITING_ANALYZE_COMPETITOR_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _COPYWRITING_ANALYZE_COMPETITOR_EXAMPLES,
+    "categories": [ToolCategory.MARKETING],
+    "keywords": ["competitor", "analysis", "pages", "sections", "structure", "copywriting"],
+}
+
+# Copy Generation
+_COPYWRITING_GENERATE_COPY_SPEC: Final[dict[str, Any]] = {
+    "name": "copywriting.generate_copy",
+    "description": "Generate conversion-focused copy using customer language (100% original required)",
+    "input_schema": _COPYWRITING_GENERATE_COPY_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _COPYWRITING_GENERATE_COPY_EXAMPLES,
+    "categories": [ToolCategory.MARKETING],
+    "keywords": ["copy", "generate", "write", "content", "conversion", "copywriting"],
+}
+
+# Copy Validation
+_COPYWRITING_VALIDATE_COPY_SPEC: Final[dict[str, Any]] = {
+    "name": "copywriting.validate_copy",
+    "description": "Validate copy for integrity: uniqueness, plagiarism, verifiability",
+    "input_schema": _COPYWRITING_VALIDATE_COPY_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _COPYWRITING_VALIDATE_COPY_EXAMPLES,
+    "categories": [ToolCategory.MARKETING, ToolCategory.VERIFICATION],
+    "keywords": ["validate", "copy", "integrity", "plagiarism", "verify", "copywriting"],
+}
+
+# NAP Audit
+_CONSISTENCY_AUDIT_NAP_SPEC: Final[dict[str, Any]] = {
+    "name": "consistency.audit_nap",
+    "description": "Audit NAP consistency across all platforms",
+    "input_schema": _CONSISTENCY_AUDIT_NAP_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _CONSISTENCY_AUDIT_NAP_EXAMPLES,
+    "categories": [ToolCategory.MARKETING],
+    "keywords": ["audit", "nap", "consistency", "local", "seo", "business"],
+}
+
+# Schema Generation
+_CONSISTENCY_GENERATE_SCHEMA_SPEC: Final[dict[str, Any]] = {
+    "name": "consistency.generate_schema",
+    "description": "Generate JSON-LD schema markup from business data",
+    "input_schema": _CONSISTENCY_GENERATE_SCHEMA_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _CONSISTENCY_GENERATE_SCHEMA_EXAMPLES,
+    "categories": [ToolCategory.MARKETING],
+    "keywords": ["schema", "jsonld", "structured", "data", "local", "business"],
+}
+
+# Platform Check
+_CONSISTENCY_CHECK_PLATFORM_SPEC: Final[dict[str, Any]] = {
+    "name": "consistency.check_platform",
+    "description": "Check a specific platform listing for NAP accuracy",
+    "input_schema": _CONSISTENCY_CHECK_PLATFORM_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _CONSISTENCY_CHECK_PLATFORM_EXAMPLES,
+    "categories": [ToolCategory.MARKETING],
+    "keywords": ["platform", "listing", "check", "nap", "consistency"],
+}
+
+# Export Master Document
+_CONSISTENCY_EXPORT_MASTER_SPEC: Final[dict[str, Any]] = {
+    "name": "consistency.export_master",
+    "description": "Export the master consistency document for a business",
+    "input_schema": _CONSISTENCY_EXPORT_MASTER_INPUT_SCHEMA,
+    "config": ToolConfig(
+        defer_loading=True,
+        allowed_callers=_CODE_EXECUTION_CALLERS,
+        parallel_safe=True,
+    ),
+    "examples": _CONSISTENCY_EXPORT_MASTER_EXAMPLES,
+    "categories": [ToolCategory.MARKETING],
+    "keywords": ["export", "master", "document", "consistency", "nap"],
+}
+
+
+_CORE_TOOL_SPECS: Final[tuple[dict[str, Any], ...]] = (
+    _HEALTH_CHECK_SPEC,
+    _GET_TASK_STATUS_SPEC,
+)
+_VERIFICATION_TOOL_SPECS: Final[tuple[dict[str, Any], ...]] = (
+    _VERIFICATION_VERIFY_TASK_SPEC,
+    _VERIFICATION_COLLECT_EVIDENCE_SPEC,
+)
+_AUDIT_TOOL_SPECS: Final[tuple[dict[str, Any], ...]] = (
+    _AUDIT_RUN_JOURNEY_SPEC,
+    _AUDIT_AUDIT_ROUTES_SPEC,
+    _AUDIT_DETECT_FRICTION_SPEC,
+    _AUDIT_GENERATE_REPORT_SPEC,
+)
+_DATABASE_TOOL_SPECS: Final[tuple[dict[str, Any], ...]] = (
+    _DATABASE_QUERY_SPEC,
+    _DATABASE_INSERT_SPEC,
+)
+_FILE_TOOL_SPECS: Final[tuple[dict[str, Any], ...]] = (
+    _FILE_READ_SPEC,
+    _FILE_WRITE_SPEC,
+    _FILE_LIST_SPEC,
+)
+_COPYWRITING_TOOL_SPECS: Final[tuple[dict[str, Any], ...]] = (
+    _COPYWRITING_RESEARCH_AUDIENCE_SPEC,
+    _COPYWRITING_ANALYZE_COMPETITOR_SPEC,
+    _COPYWRITING_GENERATE_COPY_SPEC,
+    _COPYWRITING_VALIDATE_COPY_SPEC,
+)
+_CONSISTENCY_TOOL_SPECS: Final[tuple[dict[str, Any], ...]] = (
+    _CONSISTENCY_AUDIT_NAP_SPEC,
+    _CONSISTENCY_GENERATE_SCHEMA_SPEC,
+    _CONSISTENCY_CHECK_PLATFORM_SPEC,
+    _CONSISTENCY_EXPORT_MASTER_SPEC,
+)
+_TOOL_SPECS: Final[tuple[dict[str, Any], ...]] = (
+    *_CORE_TOOL_SPECS,
+    *_VERIFICATION_TOOL_SPECS,
+    *_AUDIT_TOOL_SPECS,
+    *_DATABASE_TOOL_SPECS,
+    *_FILE_TOOL_SPECS,
+    *_COPYWRITING_TOOL_SPECS,
+    *_CONSISTENCY_TOOL_SPECS,
+)
+
+
+def _register_specs(registry: ToolRegistry, specs: tuple[dict[str, Any], ...]) -> None:
+    """Register tool specs, deferred ones as factories built on first use."""
+    for spec in specs:
+        if spec["config"].defer_loading:
+            registry.register_factory(
+                spec["name"],
+                partial(ToolDefinition, **spec),
+                categories=spec["categories"],
+                programmatic="code_execution_20250825" in spec["config"].allowed_callers,
+            )
+        else:
+            registry.register(ToolDefinition(**spec))
+
+
+def register_core_tools(registry: ToolRegistry) -> None:
+    """Register core tools that are always loaded.
+
+    These are high-frequency tools that should always be available.
+    Keep this list minimal (3-5 tools) to preserve context.
+    """
+    _register_specs(registry, _CORE_TOOL_SPECS)
+
+
+def register_verification_tools(registry: ToolRegistry) -> None:
+    """Register verification tools - deferred for context efficiency."""
+    _register_specs(registry, _VERIFICATION_TOOL_SPECS)
+
+
+def register_audit_tools(registry: ToolRegistry) -> None:
+    """Register audit tools - deferred for context efficiency."""
+    _register_specs(registry, _AUDIT_TOOL_SPECS)
 
 
 def register_database_tools(registry: ToolRegistry) -> None:
     """Register database tools - deferred and programmatic."""
-
-    registry.register(
-        ToolDefinition(
-            name="database.query",
-            description="Execute a database query and return results",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "table": {
-                        "type": "string",
-                        "description": "Table to query",
-                    },
-                    "select": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "Columns to select",
-                    },
-                    "filters": {
-                        "type": "object",
-                        "description": "Filter conditions",
-                    },
-                    "limit": {
-                        "type": "integer",
-                        "default": 100,
-                    },
-                },
-                "required": ["table"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-                cache_results=True,
-                cache_ttl_seconds=60,
-            ),
-            examples=[
-                ToolExample(
-                    description="Query users",
-                    input={
-                        "table": "profiles",
-                        "select": ["id", "email", "created_at"],
-                        "filters": {"status": "active"},
-                        "limit": 50,
-                    },
-                ),
-                ToolExample(
-                    description="Query recent evidence",
-                    input={
-                        "table": "audit_evidence",
-                        "select": ["*"],
-                        "filters": {"category": "fail"},
-                        "limit": 10,
-                    },
-                ),
-            ],
-            categories=[ToolCategory.DATABASE],
-            keywords=["database", "query", "select", "supabase", "sql"],
-            aliases=["db_query", "sql_query"],
-        )
-    )
-
-    registry.register(
-        ToolDefinition(
-            name="database.insert",
-            description="Insert a record into a database table",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "table": {"type": "string"},
-                    "data": {"type": "object"},
-                },
-                "required": ["table", "data"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=False,
-                retry_safe=False,
-            ),
-            categories=[ToolCategory.DATABASE],
-            keywords=["database", "insert", "create", "add"],
-        )
-    )
+    _register_specs(registry, _DATABASE_TOOL_SPECS)
 
 
 def register_file_tools(registry: ToolRegistry) -> None:
     """Register file system tools - deferred and programmatic."""
-
-    registry.register(
-        ToolDefinition(
-            name="file.read",
-            description="Read contents of a file",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "path": {
-                        "type": "string",
-                        "description": "Absolute path to file",
-                    },
-                    "encoding": {
-                        "type": "string",
-                        "default": "utf-8",
-                    },
-                },
-                "required": ["path"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Read TypeScript file",
-                    input={"path": "/src/components/Button.tsx"},
-                ),
-                ToolExample(
-                    description="Read JSON config",
-                    input={"path": "/package.json", "encoding": "utf-8"},
-                ),
-            ],
-            categories=[ToolCategory.FILE_SYSTEM],
-            keywords=["file", "read", "content", "load"],
-        )
-    )
-
-    registry.register(
-        ToolDefinition(
-            name="file.write",
-            description="Write contents to a file",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string"},
-                    "content": {"type": "string"},
-                    "encoding": {"type": "string", "default": "utf-8"},
-                },
-                "required": ["path", "content"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=False,
-            ),
-            categories=[ToolCategory.FILE_SYSTEM],
-            keywords=["file", "write", "save", "create"],
-        )
-    )
-
-    registry.register(
-        ToolDefinition(
-            name="file.list",
-            description="List files in a directory matching a pattern",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "path": {"type": "string"},
-                    "pattern": {
-                        "type": "string",
-                        "description": "Glob pattern (e.g., '*.ts')",
-                    },
-                    "recursive": {"type": "boolean", "default": False},
-                },
-                "required": ["path"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="List TypeScript files",
-                    input={"path": "/src", "pattern": "*.ts", "recursive": True},
-                ),
-            ],
-            categories=[ToolCategory.FILE_SYSTEM],
-            keywords=["file", "list", "directory", "find", "glob"],
-        )
-    )
+    _register_specs(registry, _FILE_TOOL_SPECS)
 
 
 def register_copywriting_tools(registry: ToolRegistry) -> None:
@@ -573,376 +1021,24 @@ def register_copywriting_tools(registry: ToolRegistry) -> None:
     - ZERO PLAGIARISM: Not even close paraphrasing
     - 100% VERIFIABLE: Every claim must have evidence
     """
-
-    # Audience Research
-    registry.register(
-        ToolDefinition(
-            name="copywriting.research_audience",
-            description="Research audience pain points, symptoms, and desires from real sources",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "business_id": {
-                        "type": "string",
-                        "description": "ID of the business",
-                    },
-                    "sources": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["reviews", "forums", "social", "interviews", "support"],
-                        },
-                        "description": "Data sources to search",
-                    },
-                    "category": {
-                        "type": "string",
-                        "enum": ["pain_point", "symptom", "dream_outcome", "failed_solution", "buying_decision"],
-                        "description": "Category of quotes to collect",
-                    },
-                },
-                "required": ["business_id"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Collect pain points from reviews",
-                    input={
-                        "business_id": "biz_123",
-                        "sources": ["reviews", "forums"],
-                        "category": "pain_point",
-                    },
-                    expected_behavior="Returns exact customer quotes categorized by type",
-                ),
-            ],
-            categories=[ToolCategory.MARKETING],
-            keywords=["research", "audience", "voice", "customer", "quotes", "pain", "copywriting"],
-        )
-    )
-
-    # Competitor Analysis
-    registry.register(
-        ToolDefinition(
-            name="copywriting.analyze_competitor",
-            description="Analyze competitor pages for structure and sections",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "competitor_url": {
-                        "type": "string",
-                        "description": "URL of competitor page to analyze",
-                    },
-                    "page_type": {
-                        "type": "string",
-                        "enum": ["homepage", "services", "about", "contact", "pricing", "faq"],
-                        "description": "Type of page being analyzed",
-                    },
-                },
-                "required": ["competitor_url", "page_type"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Analyze competitor homepage",
-                    input={
-                        "competitor_url": "https://competitor.com.au",
-                        "page_type": "homepage",
-                    },
-                    expected_behavior="Returns page sections in order with notes",
-                ),
-            ],
-            categories=[ToolCategory.MARKETING],
-            keywords=["competitor", "analysis", "pages", "sections", "structure", "copywriting"],
-        )
-    )
-
-    # Copy Generation
-    registry.register(
-        ToolDefinition(
-            name="copywriting.generate_copy",
-            description="Generate conversion-focused copy using customer language (100% original required)",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "business_id": {
-                        "type": "string",
-                        "description": "ID of the business",
-                    },
-                    "page_type": {
-                        "type": "string",
-                        "enum": ["homepage", "services", "about", "contact", "landing"],
-                        "description": "Type of page to generate copy for",
-                    },
-                    "section": {
-                        "type": "string",
-                        "enum": ["hero", "problem", "value_props", "social_proof", "process", "faq", "cta"],
-                        "description": "Specific section (optional)",
-                    },
-                    "research_ids": {
-                        "type": "array",
-                        "items": {"type": "string"},
-                        "description": "IDs of audience research to use as inspiration",
-                    },
-                },
-                "required": ["business_id", "page_type"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Generate homepage hero",
-                    input={
-                        "business_id": "biz_123",
-                        "page_type": "homepage",
-                        "section": "hero",
-                        "research_ids": ["research_abc", "research_def"],
-                    },
-                    expected_behavior="Returns unique, customer-voice copy with claims to verify",
-                ),
-            ],
-            categories=[ToolCategory.MARKETING],
-            keywords=["copy", "generate", "write", "content", "conversion", "copywriting"],
-        )
-    )
-
-    # Copy Validation
-    registry.register(
-        ToolDefinition(
-            name="copywriting.validate_copy",
-            description="Validate copy for integrity: uniqueness, plagiarism, verifiability",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "content": {
-                        "type": "string",
-                        "description": "Copy content to validate",
-                    },
-                    "checks": {
-                        "type": "array",
-                        "items": {
-                            "type": "string",
-                            "enum": ["plagiarism", "uniqueness", "verifiability", "jargon", "tone"],
-                        },
-                        "description": "Validation checks to run",
-                    },
-                },
-                "required": ["content"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Full integrity check",
-                    input={
-                        "content": "Your copy here...",
-                        "checks": ["plagiarism", "uniqueness", "verifiability"],
-                    },
-                    expected_behavior="Returns integrity scores and claims requiring evidence",
-                ),
-            ],
-            categories=[ToolCategory.MARKETING, ToolCategory.VERIFICATION],
-            keywords=["validate", "copy", "integrity", "plagiarism", "verify", "copywriting"],
-        )
-    )
+    _register_specs(registry, _COPYWRITING_TOOL_SPECS)
 
 
 def register_consistency_tools(registry: ToolRegistry) -> None:
     """Register business consistency tools - deferred for context efficiency."""
-
-    # NAP Audit
-    registry.register(
-        ToolDefinition(
-            name="consistency.audit_nap",
-            description="Audit NAP consistency across all platforms",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "business_id": {
-                        "type": "string",
-                        "description": "ID of the business to audit",
-                    },
-                    "platform_tiers": {
-                        "type": "array",
-                        "items": {"type": "integer", "minimum": 1, "maximum": 5},
-                        "description": "Platform tiers to audit (1-5)",
-                    },
-                },
-                "required": ["business_id"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Full NAP audit",
-                    input={
-                        "business_id": "biz_123",
-                        "platform_tiers": [1, 2, 3],
-                    },
-                    expected_behavior="Returns consistency score and platform-by-platform breakdown",
-                ),
-            ],
-            categories=[ToolCategory.MARKETING],
-            keywords=["audit", "nap", "consistency", "local", "seo", "business"],
-        )
-    )
-
-    # Schema Generation
-    registry.register(
-        ToolDefinition(
-            name="consistency.generate_schema",
-            description="Generate JSON-LD schema markup from business data",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "business_id": {
-                        "type": "string",
-                        "description": "ID of the business",
-                    },
-                    "schema_type": {
-                        "type": "string",
-                        "enum": ["LocalBusiness", "Organization", "FAQ", "HowTo", "Service"],
-                        "description": "Type of schema to generate",
-                    },
-                },
-                "required": ["business_id", "schema_type"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Generate LocalBusiness schema",
-                    input={
-                        "business_id": "biz_123",
-                        "schema_type": "LocalBusiness",
-                    },
-                    expected_behavior="Returns valid JSON-LD schema with all NAP data",
-                ),
-            ],
-            categories=[ToolCategory.MARKETING],
-            keywords=["schema", "jsonld", "structured", "data", "local", "business"],
-        )
-    )
-
-    # Platform Check
-    registry.register(
-        ToolDefinition(
-            name="consistency.check_platform",
-            description="Check a specific platform listing for NAP accuracy",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "business_id": {
-                        "type": "string",
-                        "description": "ID of the business",
-                    },
-                    "platform_name": {
-                        "type": "string",
-                        "description": "Platform to check (e.g., 'Google Business Profile')",
-                    },
-                    "listing_url": {
-                        "type": "string",
-                        "description": "URL of the listing to check",
-                    },
-                },
-                "required": ["business_id", "platform_name"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Check Google Business Profile",
-                    input={
-                        "business_id": "biz_123",
-                        "platform_name": "Google Business Profile",
-                    },
-                    expected_behavior="Returns field-by-field comparison with master document",
-                ),
-            ],
-            categories=[ToolCategory.MARKETING],
-            keywords=["platform", "listing", "check", "nap", "consistency"],
-        )
-    )
-
-    # Export Master Document
-    registry.register(
-        ToolDefinition(
-            name="consistency.export_master",
-            description="Export the master consistency document for a business",
-            input_schema={
-                "type": "object",
-                "properties": {
-                    "business_id": {
-                        "type": "string",
-                        "description": "ID of the business",
-                    },
-                    "format": {
-                        "type": "string",
-                        "enum": ["yaml", "json", "markdown"],
-                        "default": "yaml",
-                        "description": "Export format",
-                    },
-                },
-                "required": ["business_id"],
-            },
-            config=ToolConfig(
-                defer_loading=True,
-                allowed_callers=["code_execution_20250825"],
-                parallel_safe=True,
-            ),
-            examples=[
-                ToolExample(
-                    description="Export as YAML",
-                    input={
-                        "business_id": "biz_123",
-                        "format": "yaml",
-                    },
-                    expected_behavior="Returns complete master document in YAML format",
-                ),
-            ],
-            categories=[ToolCategory.MARKETING],
-            keywords=["export", "master", "document", "consistency", "nap"],
-        )
-    )
+    _register_specs(registry, _CONSISTENCY_TOOL_SPECS)
 
 
+@cache
 def register_all_tools() -> ToolRegistry:
     """Register all tools and return the registry.
 
-    This is the main entry point for tool registration.
+    This is the main entry point for tool registration. Registration runs
+    once per process; later calls return the same registry.
     """
     registry = get_registry()
 
-    # Register all tool categories
-    register_core_tools(registry)
-    register_verification_tools(registry)
-    register_audit_tools(registry)
-    register_database_tools(registry)
-    register_file_tools(registry)
-    # Marketing tools
-    register_copywriting_tools(registry)
-    register_consistency_tools(registry)
+    _register_specs(registry, _TOOL_SPECS)
     # RAG tools
     register_rag_tools(registry)
 
@@ -962,11 +1058,7 @@ def get_tool_stats() -> dict:
     registry = get_registry()
     stats = registry.get_context_stats()
 
-    stats["categories"] = {}
-    for tool in registry._tools.values():
-        for cat in tool.categories:
-            stats["categories"][cat.value] = stats["categories"].get(cat.value, 0) + 1
-
-    stats["programmatic_tools"] = len(registry.get_programmatic_tools())
+    stats["categories"] = registry.get_category_counts()
+    stats["programmatic_tools"] = registry.get_programmatic_count()
 
     return stats
@@ -0,0 +1,53 @@
+"""Ahead-of-time compilation of tool input validators.
+
+Writes one fastjsonschema module per distinct tool input schema into
+``_generated_validators/``, named by schema hash, so startup imports plain
+Python functions instead of generating and exec'ing validator code. Modules
+whose hash still matches are left alone; ones for schemas that no longer
+exist are removed.
+
+Usage:
+    python -m src.tools.generate_validators
+"""
+
+from pathlib import Path
+
+import fastjsonschema
+
+from .definitions import register_all_tools
+from .registry import GENERATED_VALIDATORS_DIR, schema_key
+
+
+def generate_validators(directory: Path = GENERATED_VALIDATORS_DIR) -> list[Path]:
+    """Write validator modules for every registered tool schema.
+
+    Returns:
+        Paths of the modules written (not the ones already up to date)
+    """
+    registry = register_all_tools()
+    schemas = {
+        schema_key(tool.input_schema): tool.input_schema
+        for tool in registry.all_tools()
+    }
+
+    directory.mkdir(exist_ok=True)
+    # Build output, never committed
+    (directory / ".gitignore").write_text("*\n")
+
+    written: list[Path] = []
+    for key, schema in schemas.items():
+        path = directory / f"v_{key}.py"
+        if not path.exists():
+            path.write_text(fastjsonschema.compile_to_code(schema, use_default=False))
+            written.append(path)
+
+    for path in directory.glob("v_*.py"):
+        if path.stem[2:] not in schemas:
+            path.unlink()
+
+    return written
+
+
+if __name__ == "__main__":
+    written = generate_validators()
+    print(f"Generated {len(written)} tool input validators in {GENERATED_VALIDATORS_DIR}")
@@ -189,11 +189,7 @@ class ProgrammaticToolCaller:
 
     def get_programmatic_tools(self) -> List[ToolDefinition]:
         """Get tools enabled for programmatic calling."""
-        return [
-            tool
-            for tool in self.registry._tools.values()
-            if self.CODE_EXECUTION_CALLER in tool.config.allowed_callers
-        ]
+        return self.registry.get_programmatic_tools()
 
     def generate_python_stubs(self) -> str:
         """Generate Python function stubs for programmatic tools.
@@ -337,6 +333,8 @@ class ProgrammaticToolCaller:
         if not handler:
             raise ValueError(f"No handler registered for tool: {call.name}")
 
+        self.registry.validate_input(call.name, call.input)
+
         call.status = ExecutionStatus.RUNNING
         result = handler(**call.input)
 
@@ -10,10 +10,64 @@ This reduces context window usage by 85%+ when working with large tool libraries
 
 from __future__ import annotations
 
+import bisect
+import hashlib
+import importlib.util
+import json
 import re
+import sys
+from collections import defaultdict
+from collections.abc import Callable, Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from pathlib import Path
+from typing import Any
+
+import fastjsonschema
+import orjson
+
+# Validator modules written ahead of time by generate_validators
+GENERATED_VALIDATORS_DIR = Path(__file__).with_name("_generated_validators")
+
+# Compiled input validators keyed by schema hash, so tools with identical
+# schemas share one compiled function
+_compiled_validators: dict[str, Callable[[Any], Any]] = {}
+
+
+def schema_key(schema: dict[str, Any]) -> str:
+    """Stable hash of a JSON Schema, used to name its compiled validator."""
+    canonical = json.dumps(schema, sort_keys=True).encode()
+    return hashlib.sha256(canonical).hexdigest()[:16]
+
+
+def _load_generated_validator(key: str) -> Callable[[Any], Any] | None:
+    """Import the ahead-of-time validator for a schema hash, if one was generated."""
+    path = GENERATED_VALIDATORS_DIR / f"v_{key}.py"
+    if not path.is_file():
+        return None
+    module_name = f"{__package__}._generated_validators.v_{key}"
+    spec = importlib.util.spec_from_file_location(module_name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module.validate
+
+
+def compile_validator(schema: dict[str, Any]) -> Callable[[Any], Any]:
+    """Compile a JSON Schema into a validator, once per distinct schema.
+
+    Uses the module written by generate_validators when there is one, and
+    compiles at runtime otherwise. Validators raise
+    fastjsonschema.JsonSchemaValueException (a ValueError) on invalid input
+    and leave valid input unchanged.
+    """
+    key = schema_key(schema)
+    validator = _compiled_validators.get(key)
+    if validator is None:
+        validator = _load_generated_validator(key) or fastjsonschema.compile(
+            schema, use_default=False
+        )
+        _compiled_validators[key] = validator
+    return validator
 
 
 class ToolCategory(str, Enum):
@@ -32,7 +86,13 @@ class ToolCategory(str, Enum):
     MARKETING = "marketing"
 
 
-@dataclass
+# One bit per category, packed into ToolDefinition.category_mask
+_CATEGORY_BITS: dict[ToolCategory, int] = {
+    category: 1 << i for i, category in enumerate(ToolCategory)
+}
+
+
+@dataclass(frozen=True, slots=True)
 class ToolExample:
     """Example input for a tool demonstrating correct usage.
 
@@ -43,10 +103,10 @@ class ToolExample:
     """
 
     description: str
-    input: Dict[str, Any]
-    expected_behavior: Optional[str] = None
+    input: dict[str, Any]
+    expected_behavior: str | None = None
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         """Convert to API-compatible format."""
         result = {"input": self.input}
         if self.expected_behavior:
@@ -56,7 +116,7 @@ class ToolExample:
         return result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolConfig:
     """Configuration for advanced tool use features."""
 
@@ -65,7 +125,7 @@ class ToolConfig:
 
     # allowed_callers: List of callers that can invoke this tool
     # "code_execution_20250825" enables programmatic tool calling
-    allowed_callers: List[str] = field(default_factory=list)
+    allowed_callers: Sequence[str] = field(default_factory=tuple)
 
     # parallel_safe: Tool can be called in parallel (idempotent)
     parallel_safe: bool = True
@@ -79,7 +139,7 @@ class ToolConfig:
     # cache_ttl_seconds: How long to cache results
     cache_ttl_seconds: int = 300
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         """Convert to API-compatible format."""
         result = {}
         if self.defer_loading:
@@ -89,25 +149,52 @@ class ToolConfig:
         return result
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ToolDefinition:
-    """Complete tool definition with advanced features."""
+    """Complete tool definition with advanced features.
+
+    Immutable: definitions are built once and shared by the registry.
+    """
 
     name: str
     description: str
-    input_schema: Dict[str, Any]
-    handler: Optional[Callable] = None
+    input_schema: dict[str, Any]
+    handler: Callable | None = None
 
     # Advanced features
     config: ToolConfig = field(default_factory=ToolConfig)
-    examples: List[ToolExample] = field(default_factory=list)
-    categories: List[ToolCategory] = field(default_factory=list)
+    examples: Sequence[ToolExample] = field(default_factory=list)
+    categories: list[ToolCategory] = field(default_factory=list)
 
     # Metadata for search
-    keywords: List[str] = field(default_factory=list)
-    aliases: List[str] = field(default_factory=list)
+    keywords: Sequence[str] = field(default_factory=tuple)
+    aliases: Sequence[str] = field(default_factory=tuple)
+    # Lowercased keywords, aliases and name, for membership tests and query overlap
+    keyword_set: frozenset[str] = field(init=False, repr=False, compare=False)
+    # Bits of this tool's categories, for in_category()
+    category_mask: int = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        # Interned so registry lookups compare keys by identity
+        object.__setattr__(self, "name", sys.intern(self.name))
+        object.__setattr__(self, "keywords", tuple(map(sys.intern, self.keywords)))
+        object.__setattr__(self, "aliases", tuple(map(sys.intern, self.aliases)))
+        object.__setattr__(
+            self,
+            "keyword_set",
+            frozenset(
+                sys.intern(kw.lower()) for kw in (*self.keywords, *self.aliases, self.name)
+            ),
+        )
+        object.__setattr__(
+            self, "category_mask", sum({_CATEGORY_BITS[c] for c in self.categories})
+        )
+
+    def in_category(self, category: ToolCategory) -> bool:
+        """Whether this tool belongs to a category."""
+        return bool(self.category_mask & _CATEGORY_BITS[category])
 
-    def to_api_format(self, include_deferred: bool = False) -> Optional[Dict[str, Any]]:
+    def to_api_format(self, include_deferred: bool = False) -> dict[str, Any] | None:
         """Convert to Claude API tool format.
 
         Args:
@@ -119,7 +206,7 @@ class ToolDefinition:
         if self.config.defer_loading and not include_deferred:
             return None
 
-        result: Dict[str, Any] = {
+        result: dict[str, Any] = {
             "name": self.name,
             "description": self.description,
             "input_schema": self.input_schema,
@@ -159,10 +246,7 @@ class ToolDefinition:
             score += 0.6
 
         # Keyword matches
-        tool_keywords = set(
-            kw.lower() for kw in self.keywords + self.aliases + [self.name]
-        )
-        keyword_overlap = len(query_terms & tool_keywords) / max(len(query_terms), 1)
+        keyword_overlap = len(query_terms & self.keyword_set) / max(len(query_terms), 1)
         score += keyword_overlap * 0.5
 
         # Description contains query terms
@@ -190,26 +274,129 @@ class ToolRegistry:
     """
 
     def __init__(self) -> None:
-        self._tools: Dict[str, ToolDefinition] = {}
-        self._loaded_tools: Set[str] = set()
-        self._usage_count: Dict[str, int] = {}
+        self._tools: dict[str, ToolDefinition] = {}
+        self._loaded_tools: set[str] = set()
+        self._usage_count: dict[str, int] = {}
+        self._validators: dict[str, Callable[[Any], Any]] = {}
+        # Each tool's full API definition, serialized once at registration
+        self._api_json: dict[str, bytes] = {}
+        # Deferred tools registered by name whose definitions aren't built yet
+        self._factories: dict[str, Callable[[], ToolDefinition]] = {}
+        # Inverted indexes kept up to date by register(); each maps to tool
+        # names in registration order (dicts used as ordered sets)
+        self._by_category: defaultdict[ToolCategory, dict[str, None]] = defaultdict(dict)
+        self._by_keyword: defaultdict[str, dict[str, None]] = defaultdict(dict)
+        self._programmatic: dict[str, None] = {}
+        self._deferred: dict[str, None] = {}
+        # Factories declared callable from code execution, counted before they're built
+        self._programmatic_factories: dict[str, None] = {}
+        # Sorted keys of _by_keyword for prefix lookups, rebuilt after changes
+        self._sorted_keywords: list[str] | None = None
+        # (JSON body, ETag) of the loaded tools' API definitions
+        self._manifest: tuple[bytes, str] | None = None
 
     def register(self, tool: ToolDefinition) -> None:
-        """Register a tool definition."""
+        """Register a tool definition and compile its input validator."""
+        if self._tools.get(tool.name) is tool:
+            return
+        self._factories.pop(tool.name, None)
+        self._programmatic_factories.pop(tool.name, None)
+        previous = self._tools.get(tool.name)
+        if previous is not None:
+            self._unindex(previous)
         self._tools[tool.name] = tool
-        if not tool.config.defer_loading:
+        self._validators[tool.name] = compile_validator(tool.input_schema)
+        self._api_json[tool.name] = orjson.dumps(tool.to_api_format(include_deferred=True))
+        if tool.config.defer_loading:
+            self._deferred[tool.name] = None
+        else:
             self._loaded_tools.add(tool.name)
 
-    def register_many(self, tools: List[ToolDefinition]) -> None:
+        for category in tool.categories:
+            self._by_category[category][tool.name] = None
+        for keyword in (*tool.keywords, *tool.aliases):
+            self._by_keyword[sys.intern(keyword.lower())][tool.name] = None
+        self._sorted_keywords = None
+        self._manifest = None
+        if "code_execution_20250825" in tool.config.allowed_callers:
+            self._programmatic[tool.name] = None
+
+    def _unindex(self, tool: ToolDefinition) -> None:
+        """Drop a replaced tool from the inverted indexes."""
+        for category in tool.categories:
+            self._by_category[category].pop(tool.name, None)
+        for keyword in (*tool.keywords, *tool.aliases):
+            self._by_keyword[keyword.lower()].pop(tool.name, None)
+        self._programmatic.pop(tool.name, None)
+        self._deferred.pop(tool.name, None)
+
+    def register_many(self, tools: list[ToolDefinition]) -> None:
         """Register multiple tools."""
         for tool in tools:
             self.register(tool)
 
-    def get(self, name: str) -> Optional[ToolDefinition]:
+    def register_factory(
+        self,
+        name: str,
+        factory: Callable[[], ToolDefinition],
+        categories: list[ToolCategory] | None = None,
+        programmatic: bool = False,
+    ) -> None:
+        """Register a deferred tool by name, building its definition on first use.
+
+        Args:
+            name: Tool name the factory's definition will carry
+            factory: Builds the full ToolDefinition
+            categories: Categories, known without building the definition
+            programmatic: Whether the definition allows calls from code execution
+        """
+        if name not in self._tools:
+            self._factories[name] = factory
+            for category in categories or []:
+                self._by_category[category][name] = None
+            if programmatic:
+                self._programmatic_factories[name] = None
+
+    def _build(self, name: str) -> ToolDefinition | None:
+        """Build and register a factory-registered tool."""
+        factory = self._factories.pop(name, None)
+        if factory is None:
+            return None
+        # The built definition's categories replace the ones declared up front
+        for names in self._by_category.values():
+            names.pop(name, None)
+        self._programmatic_factories.pop(name, None)
+        tool = factory()
+        self.register(tool)
+        return tool
+
+    def all_tools(self) -> list[ToolDefinition]:
+        """Get every registered tool, building any not built yet."""
+        for name in list(self._factories):
+            self._build(name)
+        return list(self._tools.values())
+
+    def get(self, name: str) -> ToolDefinition | None:
         """Get a tool by name."""
-        return self._tools.get(name)
+        tool = self._tools.get(name)
+        if tool is None and name in self._factories:
+            tool = self._build(name)
+        return tool
+
+    def validate_input(self, name: str, tool_input: dict[str, Any]) -> None:
+        """Check a tool call's input against the tool's compiled schema.
+
+        Builds a factory-registered tool first, so its validator exists.
 
-    def get_loaded_tools(self) -> List[ToolDefinition]:
+        Raises:
+            fastjsonschema.JsonSchemaValueException: If the input doesn't match
+        """
+        self.get(name)
+        validator = self._validators.get(name)
+        if validator is not None:
+            validator(tool_input)
+
+    def get_loaded_tools(self) -> list[ToolDefinition]:
         """Get all currently loaded (non-deferred) tools."""
         return [
             self._tools[name]
@@ -217,17 +404,17 @@ class ToolRegistry:
             if name in self._tools
         ]
 
-    def get_deferred_tools(self) -> List[ToolDefinition]:
+    def get_deferred_tools(self) -> list[ToolDefinition]:
         """Get all deferred tools."""
         return [
             tool
-            for tool in self._tools.values()
+            for tool in self.all_tools()
             if tool.config.defer_loading
         ]
 
-    def load_tool(self, name: str) -> Optional[ToolDefinition]:
+    def load_tool(self, name: str) -> ToolDefinition | None:
         """Load a deferred tool into active context."""
-        tool = self._tools.get(name)
+        tool = self.get(name)
         if tool:
             self._loaded_tools.add(name)
             return tool
@@ -237,7 +424,7 @@ class ToolRegistry:
         """Remove a tool from active context."""
         self._loaded_tools.discard(name)
 
-    def search(self, query: str, limit: int = 5) -> List[ToolDefinition]:
+    def search(self, query: str, limit: int = 5) -> list[ToolDefinition]:
         """Search for tools matching a query.
 
         Args:
@@ -249,7 +436,7 @@ class ToolRegistry:
         """
         scored_tools = [
             (tool, tool.matches_query(query))
-            for tool in self._tools.values()
+            for tool in self.all_tools()
         ]
 
         # Filter and sort by score
@@ -260,27 +447,57 @@ class ToolRegistry:
 
         return [tool for tool, _ in scored_tools[:limit]]
 
-    def search_by_category(self, category: ToolCategory) -> List[ToolDefinition]:
+    def search_by_category(self, category: ToolCategory) -> list[ToolDefinition]:
         """Get all tools in a category."""
-        return [
-            tool
-            for tool in self._tools.values()
-            if category in tool.categories
-        ]
+        tools = [self.get(name) for name in list(self._by_category.get(category, ()))]
+        return [tool for tool in tools if tool is not None and tool.in_category(category)]
 
-    def get_programmatic_tools(self) -> List[ToolDefinition]:
+    def search_by_keyword(self, keyword: str) -> list[ToolDefinition]:
+        """Get all tools with a keyword or alias (case-insensitive)."""
+        self.all_tools()
+        return [self._tools[name] for name in self._by_keyword.get(keyword.lower(), ())]
+
+    def search_keyword_prefix(self, prefix: str) -> list[ToolDefinition]:
+        """Get tools with a keyword or alias starting with prefix (case-insensitive).
+
+        Binary-searches the sorted keyword index, so the cost is in the number
+        of matches rather than the number of tools.
+        """
+        self.all_tools()
+        if self._sorted_keywords is None:
+            self._sorted_keywords = sorted(k for k, names in self._by_keyword.items() if names)
+
+        prefix = prefix.lower()
+        keywords = self._sorted_keywords
+        names: dict[str, None] = {}
+        for i in range(bisect.bisect_left(keywords, prefix), len(keywords)):
+            if not keywords[i].startswith(prefix):
+                break
+            names.update(self._by_keyword[keywords[i]])
+        return [self._tools[name] for name in names]
+
+    def get_programmatic_tools(self) -> list[ToolDefinition]:
         """Get tools that can be called from code execution."""
-        return [
-            tool
-            for tool in self._tools.values()
-            if "code_execution_20250825" in tool.config.allowed_callers
-        ]
+        self.all_tools()
+        return [self._tools[name] for name in self._programmatic]
+
+    def get_programmatic_count(self) -> int:
+        """Number of tools callable from code execution, including tools not built yet."""
+        return len(self._programmatic) + len(self._programmatic_factories)
+
+    def get_category_counts(self) -> dict[str, int]:
+        """Number of tools per category, including tools not built yet."""
+        return {
+            category.value: len(names)
+            for category, names in self._by_category.items()
+            if names
+        }
 
     def record_usage(self, name: str) -> None:
         """Record tool usage for optimization."""
         self._usage_count[name] = self._usage_count.get(name, 0) + 1
 
-    def get_usage_stats(self) -> Dict[str, int]:
+    def get_usage_stats(self) -> dict[str, int]:
         """Get tool usage statistics."""
         return dict(self._usage_count)
 
@@ -289,7 +506,7 @@ class ToolRegistry:
         include_search_tool: bool = True,
         include_code_execution: bool = True,
         include_deferred: bool = False,
-    ) -> List[Dict[str, Any]]:
+    ) -> list[dict[str, Any]]:
         """Convert registry to Claude API tools array.
 
         Args:
@@ -300,7 +517,7 @@ class ToolRegistry:
         Returns:
             List of tool definitions for Claude API
         """
-        tools: List[Dict[str, Any]] = []
+        tools: list[dict[str, Any]] = []
 
         # Add Tool Search Tool for dynamic discovery
         if include_search_tool:
@@ -316,23 +533,40 @@ class ToolRegistry:
                 "name": "code_execution",
             })
 
-        # Add registered tools
-        for tool in self._tools.values():
+        # Add registered tools; factory-registered ones are deferred, so they
+        # only need building when deferred tools are included
+        registered = self.all_tools() if include_deferred else self._tools.values()
+        for tool in registered:
             tool_def = tool.to_api_format(include_deferred=include_deferred)
             if tool_def:
                 tools.append(tool_def)
 
         return tools
 
-    def get_context_stats(self) -> Dict[str, Any]:
+    def get_manifest(self) -> tuple[bytes, str]:
+        """Get the non-deferred tools' API definitions as JSON, with an ETag.
+
+        Assembled from the definitions serialized at registration and reused
+        until the next one.
+        """
+        if self._manifest is None:
+            body = b'{"tools":[%b]}' % b",".join(
+                self._api_json[name]
+                for name, tool in self._tools.items()
+                if not tool.config.defer_loading
+            )
+            self._manifest = (body, hashlib.blake2b(body, digest_size=16).hexdigest())
+        return self._manifest
+
+    def get_context_stats(self) -> dict[str, Any]:
         """Get statistics about context usage.
 
         Returns:
             Stats about loaded vs deferred tools and estimated token savings
         """
         loaded = len(self._loaded_tools)
-        deferred = len([t for t in self._tools.values() if t.config.defer_loading])
-        total = len(self._tools)
+        deferred = len(self._deferred) + len(self._factories)
+        total = len(self._tools) + len(self._factories)
 
         # Rough estimate: ~500 tokens per tool definition
         tokens_per_tool = 500
@@ -354,7 +588,7 @@ class ToolRegistry:
 
 
 # Global registry instance
-_registry: Optional[ToolRegistry] = None
+_registry: ToolRegistry | None = None
 
 
 def get_registry() -> ToolRegistry:
@@ -15,8 +15,11 @@ from __future__ import annotations
 
 import re
 import math
+import sys
 from dataclasses import dataclass
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, TYPE_CHECKING
+
+from .registry import ToolCategory
 
 if TYPE_CHECKING:
     from .registry import ToolRegistry, ToolDefinition
@@ -29,10 +32,10 @@ class SearchResult:
     tool_name: str
     description: str
     score: float
-    categories: List[str]
-    keywords: List[str]
+    categories: list[str]
+    keywords: list[str]
 
-    def to_dict(self) -> Dict[str, Any]:
+    def to_dict(self) -> dict[str, Any]:
         """Convert to dictionary format."""
         return {
             "name": self.tool_name,
@@ -76,15 +79,19 @@ class ToolSearcher:
         """
         self.registry = registry
         self.usage_weight = usage_weight
-        self._bm25_index: Optional[Dict[str, Dict[str, float]]] = None
+        self._bm25_index: dict[str, dict[str, float]] | None = None
+        # Inverted index over the same terms: term -> {tool name: term frequency}
+        self._bm25_postings: dict[str, dict[str, float]] = {}
+        self._bm25_doc_lens: dict[str, float] = {}
+        self._bm25_avg_doc_len = 0.0
 
     def search(
         self,
         query: str,
         limit: int = 5,
         strategy: str = "combined",
-        category: Optional[str] = None,
-    ) -> List[SearchResult]:
+        category: str | None = None,
+    ) -> list[SearchResult]:
         """Search for tools matching a query.
 
         Args:
@@ -109,17 +116,22 @@ class ToolSearcher:
         self,
         query: str,
         limit: int,
-        category: Optional[str] = None,
-    ) -> List[SearchResult]:
+        category: str | None = None,
+    ) -> list[SearchResult]:
         """Regex-based search for exact pattern matching."""
-        results: List[SearchResult] = []
+        wanted: ToolCategory | None = None
+        if category:
+            try:
+                wanted = ToolCategory(category)
+            except ValueError:
+                return []
+
+        results: list[SearchResult] = []
         pattern = re.compile(re.escape(query), re.IGNORECASE)
 
-        for tool in self.registry._tools.values():
+        for tool in self.registry.all_tools():
             # Apply category filter
-            if category and not any(
-                c.value == category for c in tool.categories
-            ):
+            if wanted is not None and not tool.in_category(wanted):
                 continue
 
             score = 0.0
@@ -155,7 +167,7 @@ class ToolSearcher:
                         description=tool.description[:200],
                         score=score,
                         categories=[c.value for c in tool.categories],
-                        keywords=tool.keywords[:5],
+                        keywords=list(tool.keywords[:5]),
                     )
                 )
 
@@ -166,8 +178,8 @@ class ToolSearcher:
         self,
         query: str,
         limit: int,
-        category: Optional[str] = None,
-    ) -> List[SearchResult]:
+        category: str | None = None,
+    ) -> list[SearchResult]:
         """BM25-based search for natural language queries."""
         if self._bm25_index is None:
             self._build_bm25_index()
@@ -176,22 +188,23 @@ class ToolSearcher:
         if not query_terms:
             return []
 
-        results: List[SearchResult] = []
-        tools = list(self.registry._tools.values())
-        avg_doc_len = sum(
-            len(self._get_tool_text(t)) for t in tools
-        ) / max(len(tools), 1)
+        wanted: ToolCategory | None = None
+        if category:
+            try:
+                wanted = ToolCategory(category)
+            except ValueError:
+                return []
+
+        results: list[SearchResult] = []
+        tools = self.registry.all_tools()
+        scores = self._compute_bm25_scores(query_terms, len(tools))
 
         for tool in tools:
             # Apply category filter
-            if category and not any(
-                c.value == category for c in tool.categories
-            ):
+            if wanted is not None and not tool.in_category(wanted):
                 continue
 
-            score = self._compute_bm25_score(
-                tool, query_terms, len(tools), avg_doc_len
-            )
+            score = scores.get(tool.name, 0.0)
 
             if score > 0:
                 # Apply usage boost
@@ -204,7 +217,7 @@ class ToolSearcher:
                         description=tool.description[:200],
                         score=score,
                         categories=[c.value for c in tool.categories],
-                        keywords=tool.keywords[:5],
+                        keywords=list(tool.keywords[:5]),
                     )
                 )
 
@@ -215,25 +228,29 @@ class ToolSearcher:
         self,
         category: str,
         limit: int,
-    ) -> List[SearchResult]:
+    ) -> list[SearchResult]:
         """Search by category."""
-        results: List[SearchResult] = []
+        results: list[SearchResult] = []
 
-        for tool in self.registry._tools.values():
-            if any(c.value == category.lower() for c in tool.categories):
-                # Use usage count for ranking within category
-                usage = self.registry._usage_count.get(tool.name, 0)
-                score = 1.0 + min(usage * 0.01, 0.5)
+        try:
+            tools = self.registry.search_by_category(ToolCategory(category.lower()))
+        except ValueError:
+            return results
 
-                results.append(
-                    SearchResult(
-                        tool_name=tool.name,
-                        description=tool.description[:200],
-                        score=score,
-                        categories=[c.value for c in tool.categories],
-                        keywords=tool.keywords[:5],
-                    )
+        for tool in tools:
+            # Use usage count for ranking within category
+            usage = self.registry._usage_count.get(tool.name, 0)
+            score = 1.0 + min(usage * 0.01, 0.5)
+
+            results.append(
+                SearchResult(
+                    tool_name=tool.name,
+                    description=tool.description[:200],
+                    score=score,
+                    categories=[c.value for c in tool.categories],
+                    keywords=list(tool.keywords[:5]),
                 )
+            )
 
         results.sort(key=lambda x: x.score, reverse=True)
         return results[:limit]
@@ -242,15 +259,15 @@ class ToolSearcher:
         self,
         query: str,
         limit: int,
-        category: Optional[str] = None,
-    ) -> List[SearchResult]:
+        category: str | None = None,
+    ) -> list[SearchResult]:
         """Combined search using all strategies."""
         # Get results from both strategies
         regex_results = self._search_regex(query, limit * 2, category)
         bm25_results = self._search_bm25(query, limit * 2, category)
 
         # Combine scores
-        combined: Dict[str, SearchResult] = {}
+        combined: dict[str, SearchResult] = {}
 
         for result in regex_results:
             combined[result.tool_name] = result
@@ -270,13 +287,21 @@ class ToolSearcher:
     def _build_bm25_index(self) -> None:
         """Build BM25 index for all tools."""
         self._bm25_index = {}
-        for tool in self.registry._tools.values():
+        self._bm25_postings = {}
+        self._bm25_doc_lens = {}
+        text_len = 0
+        for tool in self.registry.all_tools():
             text = self._get_tool_text(tool)
+            text_len += len(text)
             terms = self._tokenize(text)
-            term_freq: Dict[str, float] = {}
+            term_freq: dict[str, float] = {}
             for term in terms:
                 term_freq[term] = term_freq.get(term, 0) + 1
             self._bm25_index[tool.name] = term_freq
+            self._bm25_doc_lens[tool.name] = sum(term_freq.values())
+            for term, tf in term_freq.items():
+                self._bm25_postings.setdefault(sys.intern(term), {})[tool.name] = tf
+        self._bm25_avg_doc_len = text_len / max(len(self._bm25_index), 1)
 
     def _get_tool_text(self, tool: ToolDefinition) -> str:
         """Get searchable text for a tool."""
@@ -289,57 +314,42 @@ class ToolSearcher:
         ]
         return " ".join(parts)
 
-    def _tokenize(self, text: str) -> List[str]:
+    def _tokenize(self, text: str) -> list[str]:
         """Tokenize text for search."""
         # Simple tokenization - split on non-alphanumeric
         tokens = re.findall(r"\w+", text.lower())
         # Remove very short tokens
         return [t for t in tokens if len(t) > 2]
 
-    def _compute_bm25_score(
+    def _compute_bm25_scores(
         self,
-        tool: ToolDefinition,
-        query_terms: List[str],
+        query_terms: list[str],
         num_docs: int,
-        avg_doc_len: float,
-    ) -> float:
-        """Compute BM25 score for a tool given query terms."""
+    ) -> dict[str, float]:
+        """Compute BM25 scores for the tools containing any of the query terms."""
         k1 = 1.5
         b = 0.75
+        avg_doc_len = max(self._bm25_avg_doc_len, 1)
 
-        if tool.name not in self._bm25_index:
-            return 0.0
-
-        term_freq = self._bm25_index[tool.name]
-        doc_len = sum(term_freq.values())
-
-        score = 0.0
+        scores: dict[str, float] = {}
         for term in query_terms:
-            if term not in term_freq:
+            postings = self._bm25_postings.get(term)
+            if not postings:
                 continue
 
-            tf = term_freq[term]
-
-            # Count documents containing term
-            df = sum(
-                1
-                for tf_dict in self._bm25_index.values()
-                if term in tf_dict
-            )
-
-            # IDF
+            # IDF; df is the number of tools containing the term
+            df = len(postings)
             idf = math.log((num_docs - df + 0.5) / (df + 0.5) + 1)
 
-            # TF normalization
-            tf_norm = (tf * (k1 + 1)) / (
-                tf + k1 * (1 - b + b * doc_len / max(avg_doc_len, 1))
-            )
-
-            score += idf * tf_norm
+            for name, tf in postings.items():
+                # TF normalization
+                doc_len = self._bm25_doc_lens[name]
+                tf_norm = (tf * (k1 + 1)) / (tf + k1 * (1 - b + b * doc_len / avg_doc_len))
+                scores[name] = scores.get(name, 0.0) + idf * tf_norm
 
-        return score
+        return scores
 
-    def get_search_tool_definition(self) -> Dict[str, Any]:
+    def get_search_tool_definition(self) -> dict[str, Any]:
         """Get the Tool Search Tool definition for Claude API.
 
         This is the tool that Claude uses to discover other tools.
@@ -353,7 +363,7 @@ class ToolSearcher:
         self,
         query: str,
         limit: int = 5,
-    ) -> Dict[str, Any]:
+    ) -> dict[str, Any]:
         """Handle a tool search request from Claude.
 
         Args:
@@ -47,6 +47,11 @@ _SAFE_OPS: dict[type, Any] = {
 _model_selector = ModelSelector()
 
 
+async def aclose_model_clients() -> None:
+    """Close pooled HTTP clients held by the shared model selector."""
+    await _model_selector.aclose()
+
+
 async def handle_start(
     config: dict[str, Any],
     state: ExecutionState,
@@ -12,11 +12,17 @@ Tests Australian context validation:
 from datetime import datetime, time
 import pytest
 from fastapi.testclient import TestClient
+from pydantic import ValidationError
 
 from src.api.main import app
 from src.models.contractor import (
     AustralianState,
     AvailabilityStatus,
+    AvailabilitySlotCreate,
+    Contractor,
+    ContractorCreate,
+    ContractorUpdate,
+    Location,
     validate_australian_mobile,
     validate_australian_abn,
 )
@@ -56,10 +62,16 @@ class TestAustralianValidation:
     def test_validate_australian_abn_valid(self):
         """Valid ABN numbers are formatted correctly."""
         # Test with spaces
-        assert validate_australian_abn("12 345 678 901") == "12 345 678 901"
+        assert validate_australian_abn("51 824 753 556") == "51 824 753 556"
 
         # Test without spaces
-        assert validate_australian_abn("12345678901") == "12 345 678 901"
+        assert validate_australian_abn("51824753556") == "51 824 753 556"
+
+    def test_validate_unicode_separators(self):
+        """Non-ASCII spaces and hyphens are stripped like ASCII ones."""
+        assert validate_australian_mobile("0412\u2009345\u2011678") == "0412 345 678"
+        assert validate_australian_mobile("0412\u00a0345\u202f678") == "0412 345 678"
+        assert validate_australian_abn("51\u202f824\u00a0753\u2009556") == "51 824 753 556"
 
     def test_validate_australian_abn_invalid(self):
         """Invalid ABN numbers raise ValueError."""
@@ -75,6 +87,87 @@ class TestAustralianValidation:
         with pytest.raises(ValueError, match="ABN must be 11 digits"):
             validate_australian_abn("12X45678901")
 
+        # Fails the ATO checksum
+        with pytest.raises(ValueError, match="checksum"):
+            validate_australian_abn("12 345 678 901")
+
+    def test_contractor_email_validation(self):
+        """Email addresses are checked against the expected shape."""
+        contractor = ContractorCreate(
+            name="John Smith", mobile="0412 345 678", email="john@example.com.au"
+        )
+        assert contractor.email == "john@example.com.au"
+
+        with pytest.raises(ValueError, match="Invalid email address"):
+            ContractorCreate(name="John Smith", mobile="0412 345 678", email="john@")
+
+    def test_contractor_update_shares_field_validation(self):
+        """Partial updates format and validate the same Australian fields."""
+        updates = ContractorUpdate(mobile="0412345678", abn="51824753556")
+        assert updates.mobile == "0412 345 678"
+        assert updates.abn == "51 824 753 556"
+        assert ContractorUpdate(abn=None).abn is None
+
+        with pytest.raises(ValueError, match="Australian mobile"):
+            ContractorUpdate(mobile="0312 345 678")
+
+    def test_contractor_from_trusted_dict_skips_validation(self, recwarn):
+        """Trusted rows are built without validators and serialise cleanly."""
+        row = {
+            "id": "c-1",
+            "name": "John Smith",
+            "mobile": "0412 345 678",
+            "abn": "51 824 753 556",
+            "email": None,
+            "specialisation": None,
+            "created_at": "2026-01-06T09:00:00.123456+10:00",
+            "updated_at": "2026-01-06T09:00:00+10:00",
+            "availability_slots": [{
+                "id": "s-1",
+                "date": "2026-01-07T00:00:00+10:00",
+                "start_time": "09:00:00",
+                "end_time": "12:00:00",
+                "suburb": "Indooroopilly",
+                "state": "QLD",
+                "postcode": "4068",
+                "status": "available",
+                "notes": None,
+            }],
+        }
+        contractor = Contractor.from_trusted_dict(row)
+
+        assert contractor.created_at == datetime.fromisoformat(row["created_at"])
+        slot = contractor.availability_slots[0]
+        assert slot.start_time == time(9, 0)
+        assert slot.location.state is AustralianState.QLD
+        assert slot.status is AvailabilityStatus.AVAILABLE
+        assert contractor.model_dump(mode="json")["availability_slots"][0]["location"] == {
+            "suburb": "Indooroopilly", "state": "QLD", "postcode": "4068"
+        }
+        assert not recwarn.list
+
+    def test_read_models_are_frozen(self):
+        """Contractors, slots and locations read back are immutable."""
+        location = Location(suburb="Toowong", state="QLD")
+        assert hash(location) == hash(Location(suburb="Toowong", state="QLD"))
+
+        with pytest.raises(ValidationError):
+            location.suburb = "West End"
+
+    def test_availability_slot_end_after_start(self):
+        """Slots whose end time is not after the start time are rejected."""
+        slot = {
+            "contractor_id": "c-1",
+            "date": "2026-01-06T00:00:00+10:00",
+            "start_time": "09:00:00",
+            "end_time": "12:00:00",
+            "location": {"suburb": "Toowong", "state": "QLD"},
+        }
+        assert AvailabilitySlotCreate(**slot).end_time == time(12, 0)
+
+        with pytest.raises(ValueError, match="End time must be after start time"):
+            AvailabilitySlotCreate(**{**slot, "end_time": "09:00:00"})
+
 
 class TestContractorCRUD:
     """Test contractor CRUD operations with Australian data."""
@@ -92,7 +185,7 @@ class TestContractorCRUD:
             json={
                 "name": "John Smith",
                 "mobile": "0412 345 678",
-                "abn": "12 345 678 901",
+                "abn": "51 824 753 556",
                 "email": "john@example.com.au",
                 "specialisation": "Water Damage Restoration",
             },
@@ -104,7 +197,7 @@ class TestContractorCRUD:
         # Verify Australian formatting
         assert data["name"] == "John Smith"
         assert data["mobile"] == "0412 345 678"  # Formatted
-        assert data["abn"] == "12 345 678 901"  # Formatted
+        assert data["abn"] == "51 824 753 556"  # Formatted
         assert data["email"] == "john@example.com.au"
         assert data["specialisation"] == "Water Damage Restoration"
         assert "id" in data
@@ -119,7 +212,7 @@ class TestContractorCRUD:
             json={
                 "name": "Jane Doe",
                 "mobile": "1234567890",  # Invalid (doesn't start with 04)
-                "abn": "12 345 678 901",
+                "abn": "51 824 753 556",
             },
         )
 
@@ -163,7 +256,7 @@ class TestContractorCRUD:
             json={
                 "name": "Sarah Johnson",
                 "mobile": "0434 567 890",
-                "abn": "23 456 789 012",
+                "abn": "53 456 789 012",
             },
         )
         contractor_id = create_response.json()["id"]
@@ -280,7 +373,7 @@ class TestAvailabilitySlots:
             json={
                 "name": "Test Contractor",
                 "mobile": "0412 345 678",
-                "abn": "12 345 678 901",
+                "abn": "51 824 753 556",
             },
         )
         self.contractor_id = response.json()["id"]
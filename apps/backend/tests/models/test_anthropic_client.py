@@ -0,0 +1,297 @@
+"""Tests for the Anthropic client request-building helpers."""
+
+import json
+from dataclasses import FrozenInstanceError
+from types import SimpleNamespace
+from unittest.mock import AsyncMock
+
+import pytest
+from anthropic._models import FinalRequestOptions
+
+from src.models import anthropic as anthropic_module
+from src.models.anthropic import AnthropicClient, BetaFeatureConfig
+
+
+def test_request_body_encoded_with_orjson():
+    """Test JSON request bodies are pre-serialized to bytes."""
+    client = AnthropicClient()
+    payload = {
+        "model": client.model,
+        "max_tokens": 16,
+        "messages": [{"role": "user", "content": "héllo"}],
+    }
+    options = FinalRequestOptions.construct(
+        method="post", url="/v1/messages", json_data=payload
+    )
+
+    request = client.client._build_request(options)
+
+    assert request.headers["content-type"] == "application/json"
+    assert json.loads(request.content) == payload
+
+
+def test_cache_control_shared_per_ttl():
+    """Test cache_control markers are reused rather than rebuilt per call."""
+    client = AnthropicClient(features=BetaFeatureConfig(cache_ttl="1h"))
+
+    first = client._create_cached_system("You are helpful.")
+    second = client._create_cached_system("You are helpful.")
+
+    assert first[0]["cache_control"] == {"type": "ephemeral", "ttl": "1h"}
+    assert first[0]["cache_control"] is second[0]["cache_control"]
+
+
+def test_beta_feature_config_is_frozen():
+    """Test feature flags cannot be mutated on a shared client."""
+    features = BetaFeatureConfig()
+
+    with pytest.raises(FrozenInstanceError):
+        features.interleaved_thinking = True
+
+
+def test_beta_feature_config_rejects_invalid_thinking_budget():
+    """Test an out-of-range default budget fails at config time."""
+    with pytest.raises(ValueError, match="at least"):
+        BetaFeatureConfig(extended_thinking=True, thinking_budget_tokens=10)
+
+    # Budget is only validated when extended thinking is enabled
+    BetaFeatureConfig(thinking_budget_tokens=10)
+
+
+def test_cache_stats_accumulate_across_responses():
+    """Test cache telemetry sums usage and derives the hit rate."""
+    client = AnthropicClient()
+
+    client._record_cache_metrics(
+        SimpleNamespace(
+            input_tokens=100, cache_creation_input_tokens=900, cache_read_input_tokens=0
+        )
+    )
+    client._record_cache_metrics(
+        SimpleNamespace(
+            input_tokens=100, cache_creation_input_tokens=0, cache_read_input_tokens=900
+        )
+    )
+
+    stats = client.cache_stats
+    assert stats["reads"] == 900
+    assert stats["writes"] == 900
+    assert stats["misses"] == 200
+    assert stats["hit_rate"] == 0.45
+
+
+def test_cache_alert_waits_for_sample_and_is_rate_limited(monkeypatch):
+    """Test cold-start misses don't alert and repeated alerts are throttled."""
+    alerts = []
+    monkeypatch.setattr(
+        anthropic_module,
+        "logger",
+        SimpleNamespace(debug=lambda *a, **k: None, info=lambda msg, **k: alerts.append(msg)),
+    )
+    client = AnthropicClient()
+    miss = SimpleNamespace(
+        input_tokens=100, cache_creation_input_tokens=0, cache_read_input_tokens=0
+    )
+
+    for _ in range(anthropic_module.CACHE_ALERT_MIN_RESPONSES - 1):
+        client._record_cache_metrics(miss)
+    assert alerts == []
+
+    client._record_cache_metrics(miss)
+    client._record_cache_metrics(miss)
+    assert len(alerts) == 1
+
+
+def test_request_kwargs_use_canonical_order():
+    """Test kwargs keys are emitted in a stable, cache-friendly order."""
+    client = AnthropicClient(features=BetaFeatureConfig(output_128k=True))
+    tools = [
+        {"name": "search", "input_schema": {"type": "object"}},
+        {"name": "fetch", "input_schema": {"type": "object"}},
+    ]
+
+    kwargs = client._build_request_kwargs(
+        [{"role": "user", "content": "hi"}],
+        max_tokens=1024,
+        temperature=0.5,
+        system="You are helpful.",
+        tools=tools,
+        thinking={"type": "enabled", "budget_tokens": 2048},
+    )
+
+    assert list(kwargs) == [
+        "model", "max_tokens", "temperature", "system",
+        "tools", "thinking", "messages", "betas",
+    ]
+    assert "cache_control" not in kwargs["tools"][0]
+    assert kwargs["tools"][-1]["cache_control"] == {"type": "ephemeral"}
+
+
+def test_thinking_config_validated_and_cached():
+    """Test thinking configs are range-checked and reused per budget."""
+    client = AnthropicClient()
+
+    assert client._create_thinking_config(2048) is client._create_thinking_config(2048)
+
+    with pytest.raises(ValueError, match="at least"):
+        client._create_thinking_config(100)
+    with pytest.raises(ValueError, match="cannot exceed"):
+        client._create_thinking_config(200000)
+
+
+def test_thinking_budget_checked_against_current_max_tokens():
+    """Test lowering max_tokens after construction still rejects the default budget."""
+    client = AnthropicClient(features=BetaFeatureConfig(extended_thinking=True))
+    client.max_tokens = client.features.thinking_budget_tokens
+
+    with pytest.raises(ValueError, match="budget_tokens must be less than max_tokens"):
+        client._build_thinking_kwargs("hi", None, None, None)
+
+
+@pytest.mark.asyncio
+async def test_api_errors_are_reraised():
+    """Test API failures propagate through the error-logging wrapper."""
+    client = AnthropicClient()
+    client.client.messages.create = AsyncMock(side_effect=RuntimeError("boom"))
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await client.complete("hi")
+
+
+@pytest.mark.asyncio
+async def test_stream_errors_are_logged_and_reraised(monkeypatch):
+    """Test the logging wrapper also covers streaming methods."""
+    errors = []
+    monkeypatch.setattr(
+        anthropic_module, "logger", SimpleNamespace(error=lambda msg, **k: errors.append(msg))
+    )
+    client = AnthropicClient()
+
+    def fail(**kwargs):
+        raise RuntimeError("stream down")
+
+    client.client.messages.stream = fail
+
+    with pytest.raises(RuntimeError, match="stream down"):
+        async for _ in client.stream_complete("hi"):
+            pass
+    assert errors == ["Anthropic stream error"]
+
+
+class _FakeStream:
+    """Minimal stand-in for the SDK's async message stream manager."""
+
+    def __init__(self, events, usage):
+        self._events = events
+        self._usage = usage
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+    def __aiter__(self):
+        return self._iterate()
+
+    async def _iterate(self):
+        for event in self._events:
+            yield event
+
+    async def get_final_message(self):
+        return SimpleNamespace(usage=self._usage)
+
+
+@pytest.mark.asyncio
+async def test_stream_think_separates_thinking_from_text():
+    """Test streamed thinking and answer deltas are labelled by kind."""
+    client = AnthropicClient(features=BetaFeatureConfig(extended_thinking=True))
+    events = [
+        SimpleNamespace(type="message_start"),
+        SimpleNamespace(
+            type="content_block_delta",
+            delta=SimpleNamespace(type="thinking_delta", thinking="Let me see."),
+        ),
+        SimpleNamespace(
+            type="content_block_delta",
+            delta=SimpleNamespace(type="text_delta", text="42"),
+        ),
+    ]
+    usage = SimpleNamespace(
+        input_tokens=10, cache_read_input_tokens=0, cache_creation_input_tokens=0
+    )
+    client.client.messages.stream = lambda **kwargs: _FakeStream(events, usage)
+
+    chunks = [
+        chunk async for chunk in client.stream_think("What is the answer?", max_tokens=16000)
+    ]
+
+    assert chunks == [("thinking", "Let me see."), ("text", "42")]
+    assert client.cache_stats["misses"] == 10
+
+
+@pytest.mark.asyncio
+async def test_think_with_tools_does_not_touch_shared_features():
+    """Test interleaved thinking is enabled per request, not on the client."""
+    client = AnthropicClient(features=BetaFeatureConfig(extended_thinking=True))
+    response = SimpleNamespace(content=[], stop_reason="end_turn", usage=None)
+    client.client.messages.create = AsyncMock(return_value=response)
+
+    await client.think_with_tools("hi", tools=[{"name": "search", "input_schema": {}}])
+
+    sent = client.client.messages.create.call_args.kwargs
+    assert "interleaved-thinking-2025-05-14" in sent["betas"]
+    assert client.features.interleaved_thinking is False
+    assert client._build_beta_headers() == []
+
+
+def test_extractors_handle_typed_and_dict_blocks():
+    """Test content extraction works for SDK objects and plain dicts alike."""
+    content = [
+        SimpleNamespace(type="thinking", thinking="hmm"),
+        SimpleNamespace(type="text", text="Hello "),
+        {"type": "text", "text": "world"},
+        {"type": "tool_use", "id": "t1", "name": "search", "input": {"q": "x"}},
+    ]
+
+    assert AnthropicClient._extract_text(content) == "Hello world"
+    assert AnthropicClient._extract_thinking(content) == ["hmm"]
+    assert AnthropicClient._extract_tool_calls(content) == [
+        {"id": "t1", "name": "search", "input": {"q": "x"}}
+    ]
+
+
+class _FakeRedis:
+    """In-memory stand-in for redis.asyncio.Redis get/setex."""
+
+    def __init__(self):
+        self.store = {}
+
+    async def get(self, key):
+        return self.store.get(key)
+
+    async def setex(self, key, ttl, value):
+        self.store[key] = value
+
+
+@pytest.mark.asyncio
+async def test_redis_result_cache_reuses_completions():
+    """Test identical requests are served from the shared result cache."""
+    redis = _FakeRedis()
+    client = AnthropicClient(redis_cache=redis)
+    response = SimpleNamespace(
+        content=[SimpleNamespace(type="text", text="cached answer")], usage=None
+    )
+    client.client.messages.create = AsyncMock(return_value=response)
+
+    first = await client.complete("hi", system="Be brief.")
+    second = await client.complete("hi", system="Be brief.")
+
+    assert first == second == "cached answer"
+    assert client.client.messages.create.await_count == 1
+    assert all(key.startswith("llm:anthropic:") for key in redis.store)
+
+    other_model = AnthropicClient(model=AnthropicClient.HAIKU, redis_cache=redis)
+    other_model.client.messages.create = AsyncMock(return_value=response)
+    await other_model.complete("hi", system="Be brief.")
+    assert other_model.client.messages.create.await_count == 1
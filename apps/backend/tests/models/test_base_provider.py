@@ -0,0 +1,54 @@
+"""Tests for the LLM provider base class contract."""
+
+import pytest
+
+from src.models.base_provider import BaseLLMProvider
+
+
+def test_subclass_missing_required_members_rejected():
+    """Test incomplete providers fail when the class is defined."""
+    with pytest.raises(TypeError, match="generate_embeddings"):
+
+        class IncompleteProvider(BaseLLMProvider):
+            async def complete(self, prompt, system=None, max_tokens=None, temperature=None):
+                return ""
+
+            async def chat(self, messages, system=None):
+                return ""
+
+            @property
+            def provider_name(self):
+                return "incomplete"
+
+            @property
+            def model_name(self):
+                return "none"
+
+
+@pytest.mark.asyncio
+async def test_with_tools_defaults_to_not_implemented():
+    """Test providers without tool support keep the NotImplementedError contract."""
+
+    class TextOnlyProvider(BaseLLMProvider):
+        async def complete(self, prompt, system=None, max_tokens=None, temperature=None):
+            return ""
+
+        async def chat(self, messages, system=None):
+            return ""
+
+        async def generate_embeddings(self, text):
+            return []
+
+        @property
+        def provider_name(self):
+            return "text-only"
+
+        @property
+        def model_name(self):
+            return "none"
+
+    provider = TextOnlyProvider()
+
+    assert provider.supports_tools is False
+    with pytest.raises(NotImplementedError):
+        await provider.with_tools("hi", tools=[])
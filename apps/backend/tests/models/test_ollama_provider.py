@@ -0,0 +1,93 @@
+"""Tests for the Ollama provider HTTP handling."""
+
+import json
+
+import httpx
+import numpy as np
+import pytest
+
+from src.models.ollama_provider import OllamaProvider
+
+
+def _provider_with_transport(handler) -> OllamaProvider:
+    """Build a provider whose pooled client is backed by a mock transport."""
+    provider = OllamaProvider(base_url="http://ollama.test")
+    provider._client = httpx.AsyncClient(
+        base_url=provider.base_url, transport=httpx.MockTransport(handler)
+    )
+    return provider
+
+
+@pytest.mark.asyncio
+async def test_requests_share_pooled_client():
+    """Test completion calls go through the provider's single pooled client."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.url.path, json.loads(request.content)))
+        return httpx.Response(200, json={"response": "hello"})
+
+    provider = _provider_with_transport(handler)
+    client = provider._client
+
+    assert await provider.complete("hi", system="Be brief.") == "hello"
+    assert await provider.complete("again") == "hello"
+
+    assert provider._client is client
+    assert [path for path, _ in seen] == ["/api/generate", "/api/generate"]
+    assert seen[0][1]["system"] == "Be brief."
+
+    await provider.aclose()
+    assert client.is_closed
+
+
+@pytest.mark.asyncio
+async def test_embeddings_batched_in_one_request():
+    """Test many texts are embedded with a single /api/embed call."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        body = json.loads(request.content)
+        seen.append((request.url.path, body["input"]))
+        return httpx.Response(
+            200, json={"embeddings": [[float(i)] * 3 for i, _ in enumerate(body["input"])]}
+        )
+
+    provider = _provider_with_transport(handler)
+
+    vectors = await provider.generate_embeddings_batch(["a", "b", "c"])
+    single = await provider.generate_embeddings("d")
+
+    assert vectors.dtype == np.float32
+    assert vectors.shape == (3, 3)
+    assert vectors.tolist() == [[0.0] * 3, [1.0] * 3, [2.0] * 3]
+    assert single.shape == (3,)
+    assert seen == [("/api/embed", ["a", "b", "c"]), ("/api/embed", ["d"])]
+
+
+@pytest.mark.asyncio
+async def test_payloads_reuse_default_options_and_encode_json():
+    """Test default sampling options are shared and overrides are honoured."""
+    seen = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append((request.headers["content-type"], json.loads(request.content)))
+        if request.url.path == "/api/chat":
+            return httpx.Response(200, json={"message": {"content": "ok"}})
+        return httpx.Response(200, json={"response": "ok"})
+
+    provider = _provider_with_transport(handler)
+    defaults = dict(provider._default_options)
+
+    await provider.complete("hi")
+    await provider.complete("hi", temperature=0.0, max_tokens=10)
+    await provider.chat([{"role": "user", "content": "hi"}], system="Be brief.")
+
+    assert all(content_type == "application/json" for content_type, _ in seen)
+    assert seen[0][1]["options"] == defaults
+    assert seen[1][1]["options"] == {"temperature": 0.0, "num_predict": 10}
+    assert seen[2][1]["messages"] == [
+        {"role": "system", "content": "Be brief."},
+        {"role": "user", "content": "hi"},
+    ]
+    assert provider._default_options == defaults
@@ -0,0 +1,22 @@
+"""Tests for model client selection and caching."""
+
+import pytest
+
+from src.models.ollama_provider import OllamaProvider
+from src.models.selector import ModelSelector
+
+
+@pytest.mark.asyncio
+async def test_get_client_reuses_client_per_provider_and_tier():
+    """Test one client is created per (provider, tier) and closed on aclose."""
+    selector = ModelSelector()
+
+    client = selector.get_client("ollama")
+    assert isinstance(client, OllamaProvider)
+    assert selector.get_client("ollama") is client
+    assert selector.get_client("ollama", "haiku") is not client
+
+    await selector.aclose()
+    assert client._client.is_closed
+    assert selector.get_client("ollama") is not client
+    await selector.aclose()
@@ -1,17 +1,20 @@
 """Tests for document chunking strategies."""
 
+import hashlib
+
 import pytest
 
+from src.rag import chunkers
 from src.rag.chunkers import (
     ParentChildChunker,
     FixedSizeChunker,
+    count_tokens,
     get_chunker,
 )
 from src.rag.models import ChunkingStrategy
 
 
-@pytest.mark.asyncio
-async def test_parent_child_chunker():
+def test_parent_child_chunker():
     """Test parent-child chunking strategy."""
     chunker = ParentChildChunker()
 
@@ -20,7 +23,7 @@ async def test_parent_child_chunker():
 
     config = {"chunk_size": 512, "parent_chunk_size": 2048, "chunk_overlap": 50}
 
-    chunks = await chunker.chunk(text, config)
+    chunks = chunker.chunk(text, config)
 
     # Verify chunks created
     assert len(chunks) > 0
@@ -36,9 +39,12 @@ async def test_parent_child_chunker():
     # Verify child chunks have parent references
     assert any(c.get("parent_index") is not None for c in child_chunks)
 
+    # Chunk indexes match positions in the flat list
+    assert [c["chunk_index"] for c in chunks] == list(range(len(chunks)))
+    assert all(chunks[c["parent_index"]]["chunk_level"] == 1 for c in child_chunks)
 
-@pytest.mark.asyncio
-async def test_fixed_size_chunker():
+
+def test_fixed_size_chunker():
     """Test fixed-size chunking with overlap."""
     chunker = FixedSizeChunker()
 
@@ -46,7 +52,7 @@ async def test_fixed_size_chunker():
 
     config = {"chunk_size": 256, "chunk_overlap": 50}
 
-    chunks = await chunker.chunk(text, config)
+    chunks = chunker.chunk(text, config)
 
     # Verify chunks created
     assert len(chunks) > 0
@@ -60,6 +66,16 @@ async def test_fixed_size_chunker():
         assert chunk["token_count"] > 0
 
 
+@pytest.mark.asyncio
+async def test_chunk_async_matches_chunk():
+    """Test the awaitable wrapper returns the same chunks as chunk()."""
+    chunker = FixedSizeChunker()
+    text = "word " * 500
+    config = {"chunk_size": 100, "chunk_overlap": 10}
+
+    assert await chunker.chunk_async(text, config) == chunker.chunk(text, config)
+
+
 @pytest.mark.asyncio
 async def test_get_chunker():
     """Test chunker factory."""
@@ -104,6 +120,72 @@ async def test_content_hash():
     # Different content = different hash
     assert hash1 != hash3
 
+    # Stored hashes stay plain SHA256 so existing rows still deduplicate
+    assert hash1 == hashlib.sha256(b"Hello world").hexdigest()
+
     # Hash should be 64 hex characters (SHA256)
     assert len(hash1) == 64
     assert all(c in "0123456789abcdef" for c in hash1)
+
+
+class _FakeEncoding:
+    """Splits on whitespace, recording the encode_batch arguments."""
+
+    def __init__(self) -> None:
+        self.kwargs: dict = {}
+
+    def encode_batch(self, texts, **kwargs):
+        self.kwargs = kwargs
+        return [text.split() for text in texts]
+
+
+def test_count_tokens_uses_batched_encoder(monkeypatch):
+    """Test token counts come from one encode_batch call."""
+    encoding = _FakeEncoding()
+    monkeypatch.setattr(chunkers, "_get_encoding", lambda: encoding)
+
+    assert count_tokens(["one two three", "<|endoftext|> four"]) == [3, 2]
+    assert encoding.kwargs["disallowed_special"] == ()
+
+
+def test_count_tokens_falls_back_to_estimate(monkeypatch):
+    """Test the 4-chars-per-token estimate when no encoder is available."""
+    monkeypatch.setattr(chunkers, "_get_encoding", lambda: None)
+
+    assert count_tokens(["x" * 40, ""]) == [10, 0]
+
+
+def test_chunk_batch_matches_per_document_chunking():
+    """Test chunk_batch returns one chunk list per text, in order."""
+    chunker = FixedSizeChunker()
+    config = {"chunk_size": 8, "chunk_overlap": 0}
+    texts = ["a" * 100, "", "b" * 40]
+
+    batches = chunker.chunk_batch(texts, config)
+
+    assert batches == [chunker.chunk(text, config) for text in texts]
+
+
+def test_get_encoding_retries_after_failed_load(monkeypatch):
+    """Test a failed vocabulary download is retried after the backoff, then kept."""
+    now = [1000.0]
+    loads = []
+
+    def get_encoding(name):
+        loads.append(name)
+        if len(loads) == 1:
+            raise ConnectionError("offline")
+        return encoding
+
+    encoding = _FakeEncoding()
+    monkeypatch.setattr(chunkers, "_encoding", None)
+    monkeypatch.setattr(chunkers, "_encoding_retry_at", 0.0)
+    monkeypatch.setattr(chunkers.time, "monotonic", lambda: now[0])
+    monkeypatch.setattr(chunkers.tiktoken, "get_encoding", get_encoding)
+
+    assert chunkers._get_encoding() is None
+    assert chunkers._get_encoding() is None  # Still backing off
+    now[0] += chunkers.TOKENIZER_RETRY_SECONDS
+    assert chunkers._get_encoding() is encoding
+    assert chunkers._get_encoding() is encoding
+    assert len(loads) == 2
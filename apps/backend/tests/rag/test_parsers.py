@@ -0,0 +1,58 @@
+"""Tests for document parsers."""
+
+import re
+
+import pytest
+
+from src.rag.parsers import (
+    MarkdownParser,
+    PlainTextParser,
+    get_parser,
+    scan_headings,
+)
+
+
+@pytest.mark.asyncio
+async def test_markdown_headings_extracted():
+    """Test ATX headings are extracted with level and position."""
+    text = "# Title\n\nIntro\n\n### Details\nBody\n#\nNot a heading\n"
+
+    parsed = await MarkdownParser().parse(text.encode(), {})
+
+    assert parsed["text"] == text
+    assert parsed["structure"] == [
+        {"level": 1, "text": "Title", "position": 0},
+        {"level": 3, "text": "Details", "position": text.index("### Details")},
+    ]
+
+
+@pytest.mark.parametrize(
+    "text",
+    [
+        "",
+        "#",
+        "# ",
+        "#  ",
+        "####### Too deep",
+        "###### Deepest\n#\tTabbed\r\n",
+        "text\n#no space\n## Two  \n\n#   \n",
+    ],
+)
+def test_scan_headings_matches_regex(text):
+    """Test the line scanner agrees with the ATX heading regex."""
+    pattern = re.compile(r"^(#{1,6})[ \t]+(.+)$", re.MULTILINE)
+    expected = [
+        {"level": len(m.group(1)), "text": m.group(2), "position": m.start()}
+        for m in pattern.finditer(text)
+    ]
+
+    assert scan_headings(text) == expected
+
+
+def test_get_parser_dispatches_on_media_type():
+    """Test MIME parameters don't defeat dispatch and parsers are shared."""
+    markdown = get_parser("text/markdown; charset=utf-8")
+
+    assert isinstance(markdown, MarkdownParser)
+    assert get_parser("Text/Markdown") is markdown
+    assert isinstance(get_parser("application/octet-stream"), PlainTextParser)
@@ -0,0 +1,96 @@
+"""Tests for the RAG pipeline's CPU stage and batch ingestion."""
+
+import pickle
+from types import SimpleNamespace
+
+import pytest
+from pydantic import ValidationError
+
+from src.rag import pipeline
+from src.rag.chunkers import get_chunker
+from src.rag.models import ChunkingStrategy, PipelineConfig, ProcessingStatus
+from src.rag.pipeline import RAGPipeline, _parse_chunk_hash_batch
+
+
+class _FakeStore:
+    """Records source and chunk writes."""
+
+    def __init__(self) -> None:
+        self.sources: list[str] = []
+        self.statuses: list[tuple[str, ProcessingStatus]] = []
+        self.chunk_batches: list[list[dict]] = []
+        self.closed = False
+
+    async def create_source(self, **kwargs):
+        self.sources.append(kwargs["source_uri"])
+        return SimpleNamespace(id=f"src-{len(self.sources)}")
+
+    async def update_source_status(self, source_id, status, error_message=None):
+        self.statuses.append((source_id, status))
+
+    async def batch_create_chunks(self, chunks, raw=False):
+        self.chunk_batches.append(chunks)
+        return chunks
+
+    async def aclose(self):
+        self.closed = True
+
+
+def test_parse_chunk_hash_matches_inline_stages():
+    """Test the worker function reproduces parse + chunk + hash."""
+    content = ("# Title\n\n" + "Some body text. " * 400).encode()
+    config = PipelineConfig(chunking_strategy=ChunkingStrategy.FIXED_SIZE, chunk_size=128)
+
+    (chunks,) = _parse_chunk_hash_batch([(content, "text/markdown", {})], config)
+
+    chunker = get_chunker(config.chunking_strategy)
+    assert len(chunks) > 1
+    assert all(c["content_hash"] == chunker.calculate_hash(c["content"]) for c in chunks)
+    assert "".join(c["content"] for c in chunks).startswith("# Title")
+
+
+def test_parse_chunk_hash_arguments_are_picklable():
+    """Test the process-pool payload survives pickling."""
+    config = PipelineConfig()
+    payload = (_parse_chunk_hash_batch, [(b"text", "text/plain", {"k": "v"})], config)
+
+    assert pickle.loads(pickle.dumps(payload))[2] == config
+
+
+@pytest.mark.asyncio
+async def test_process_documents_stores_all_chunks_in_one_batch(monkeypatch):
+    """Test a multi-document upload chunks per source and stores once."""
+    monkeypatch.setattr(pipeline, "RAGStore", _FakeStore)
+    rag_pipeline = RAGPipeline()
+    config = PipelineConfig(
+        chunking_strategy=ChunkingStrategy.FIXED_SIZE, chunk_size=16, chunk_overlap=0
+    )
+
+    source_ids = await rag_pipeline.process_documents(
+        [
+            {"content": b"alpha " * 20, "mime_type": "text/plain", "source_uri": "a.txt"},
+            {"content": b"# Beta\n", "mime_type": "text/markdown", "source_uri": "b.md"},
+        ],
+        project_id="proj-1",
+        config=config,
+    )
+    await rag_pipeline.close()
+
+    assert source_ids == ["src-1", "src-2"]
+    assert rag_pipeline.store.closed
+    (rows,) = rag_pipeline.store.chunk_batches
+    by_source = {
+        sid: [r["chunk_index"] for r in rows if r["source_id"] == sid] for sid in source_ids
+    }
+    assert by_source["src-1"] == list(range(len(by_source["src-1"])))
+    assert by_source["src-2"] == [0]
+    assert rag_pipeline.store.statuses[-2:] == [
+        ("src-1", ProcessingStatus.COMPLETED),
+        ("src-2", ProcessingStatus.COMPLETED),
+    ]
+
+
+def test_pipeline_config_rejects_overlap_not_below_size():
+    """Test an overlap that would stop chunking from advancing is rejected."""
+    with pytest.raises(ValidationError, match="chunk_overlap"):
+        PipelineConfig(chunk_size=16, chunk_overlap=16)
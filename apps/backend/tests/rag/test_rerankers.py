@@ -0,0 +1,53 @@
+"""Tests for RAG rerankers."""
+
+import json
+
+import httpx
+import pytest
+
+from src.rag.rerankers import CohereReranker, get_reranker
+
+
+@pytest.mark.asyncio
+async def test_cohere_scores_returned_in_input_order():
+    """Test rerank scores are mapped back to the order documents were sent."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(json.loads(request.content))
+        return httpx.Response(
+            200,
+            json={"results": [
+                {"index": 1, "relevance_score": 0.9},
+                {"index": 0, "relevance_score": 0.2},
+            ]},
+        )
+
+    reranker = CohereReranker("test-key")
+    reranker.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+
+    scores = await reranker.rerank("query", ["first", "second"])
+
+    assert scores == [0.2, 0.9]
+    assert sent[0]["documents"] == ["first", "second"]
+    assert await reranker.rerank("query", []) == []
+    assert len(sent) == 1
+
+
+def test_get_reranker_from_environment(monkeypatch):
+    """Test a reranker is only configured when an API key is present."""
+    monkeypatch.delenv("COHERE_API_KEY", raising=False)
+    assert get_reranker() is None
+
+    monkeypatch.setenv("COHERE_API_KEY", "test-key")
+    assert isinstance(get_reranker(), CohereReranker)
+
+
+@pytest.mark.asyncio
+async def test_cohere_aclose_closes_http_client():
+    """Test aclose releases the pooled HTTP client."""
+    reranker = CohereReranker("key")
+
+    await reranker.aclose()
+
+    assert reranker.client.is_closed
@@ -1,7 +1,7 @@
 """Tests for RAG search functionality."""
 
 import pytest
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock, MagicMock, patch
 
 from src.rag.storage import RAGStore
 from src.rag.models import SearchType
@@ -57,18 +57,10 @@ async def test_vector_search_call():
     # Mock embedding provider
     store.embedding_provider.get_embedding = AsyncMock(return_value=[0.1] * 1536)
 
-    # Mock Supabase client table query
-    mock_execute = MagicMock()
-    mock_execute.data = []
-
-    mock_builder = MagicMock()
-    mock_builder.execute.return_value = mock_execute
-    mock_builder.select.return_value = mock_builder
-    mock_builder.match.return_value = mock_builder
-    mock_builder.order.return_value = mock_builder
-    mock_builder.limit.return_value = mock_builder
-
-    store.client.table = MagicMock(return_value=mock_builder)
+    # Mock Supabase RPC
+    store.client.rpc = MagicMock(
+        return_value=MagicMock(execute=MagicMock(return_value=MagicMock(data=[])))
+    )
 
     # Call vector search
     results = await store.vector_search(
@@ -80,6 +72,11 @@ async def test_vector_search_call():
     # Verify results structure
     assert isinstance(results, list)
 
+    # Verify ranking is delegated to the match_chunks RPC
+    call_args = store.client.rpc.call_args
+    assert call_args[0][0] == "match_chunks"
+    assert call_args[0][1]["match_count"] == 5
+
 
 # Integration tests (require database)
 @pytest.mark.integration
@@ -0,0 +1,282 @@
+"""Tests for RAG chunk storage batching."""
+
+import pytest
+
+from src.memory.embeddings import EmbeddingProvider
+from src.rag import chunkers, storage
+from src.rag.models import DocumentChunk, FusionMethod
+from src.rag.rerankers import Reranker
+from src.rag.storage import RAGStore
+
+
+class _FakeEmbeddingProvider(EmbeddingProvider):
+    """Records batch calls and returns one-dimension vectors."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[str]] = []
+
+    async def get_embedding(self, text: str) -> list[float]:
+        return [float(len(text))]
+
+    async def get_embedding_batch(self, texts: list[str]) -> list[list[float]]:
+        self.batches.append(list(texts))
+        return [[float(len(text))] for text in texts]
+
+
+class _FakeTable:
+    """Minimal stand-in for the Supabase table query builder."""
+
+    def __init__(self, client: "_FakeClient") -> None:
+        self._client = client
+        self._rows: list[dict] = []
+        self._delete_ids: list[str] | None = None
+
+    def insert(self, rows):
+        if len(self._client.inserts) == self._client.fail_on_insert:
+            raise RuntimeError("insert rejected")
+        self._rows = [dict(row) for row in rows]
+        self._client.inserts.append(self._rows)
+        return self
+
+    def delete(self):
+        return self
+
+    def in_(self, column: str, values: list[str]):
+        assert column == "id"
+        self._delete_ids = list(values)
+        return self
+
+    def execute(self):
+        if self._delete_ids is not None:
+            self._client.deletes.append(self._delete_ids)
+            return type("Result", (), {"data": []})()
+        data = [
+            {**row, "id": f"chunk-{row['chunk_index']}", "created_at": "t", "updated_at": "t"}
+            for row in self._rows
+        ]
+        return type("Result", (), {"data": data})()
+
+
+class _FakeClient:
+    def __init__(self) -> None:
+        self.inserts: list[list[dict]] = []
+        self.deletes: list[list[str]] = []
+        self.fail_on_insert: int | None = None
+        self.rpc_calls: list[tuple[str, dict]] = []
+        self.rpc_rows: list[dict] = []
+
+    def table(self, name: str) -> _FakeTable:
+        assert name == "document_chunks"
+        return _FakeTable(self)
+
+    def rpc(self, name: str, params: dict):
+        self.rpc_calls.append((name, params))
+        rows = [dict(row) for row in self.rpc_rows]
+        return type("Query", (), {"execute": lambda _: type("Result", (), {"data": rows})()})()
+
+
+class _FakeReranker(Reranker):
+    """Scores documents by length, so longer content ranks first."""
+
+    async def rerank(self, query: str, documents: list[str]) -> list[float]:
+        return [float(len(document)) for document in documents]
+
+
+@pytest.fixture
+def store(monkeypatch) -> RAGStore:
+    """Build a store backed by fakes instead of Supabase."""
+    client = _FakeClient()
+    monkeypatch.setattr(
+        storage, "SupabaseStateStore", lambda: type("State", (), {"client": client})()
+    )
+    monkeypatch.setattr(chunkers, "_get_encoding", lambda: None)
+    rag_store = RAGStore()
+    rag_store.embedding_provider = _FakeEmbeddingProvider()
+    return rag_store
+
+
+def _chunk(index: int, embed: bool = True) -> dict:
+    return {
+        "source_id": "src-1",
+        "project_id": "proj-1",
+        "chunk_index": index,
+        "chunk_level": 0,
+        "content": "x" * (index + 1),
+        "content_hash": f"h{index}",
+        "generate_embedding": embed,
+    }
+
+
+@pytest.mark.asyncio
+async def test_batch_create_chunks_embeds_once_and_splits_inserts(store, monkeypatch):
+    """Test one embedding call per batch and inserts capped per request."""
+    monkeypatch.setattr(storage, "CHUNK_INSERT_BATCH_SIZE", 2)
+
+    created = await store.batch_create_chunks(
+        [_chunk(0), _chunk(1, embed=False), _chunk(2), _chunk(3), _chunk(4)]
+    )
+
+    assert store.embedding_provider.batches == [["x", "xxx", "xxxx", "xxxxx"]]
+    assert [len(rows) for rows in store.client.inserts] == [2, 2, 1]
+    assert all("generate_embedding" not in row for rows in store.client.inserts for row in rows)
+    assert [c.chunk_index for c in created] == [0, 1, 2, 3, 4]
+    assert [c.embedding for c in created] == [[1.0], None, [3.0], [4.0], [5.0]]
+
+
+@pytest.mark.asyncio
+async def test_create_chunk_uses_batch_path(store):
+    """Test single chunk creation goes through the batch insert."""
+
+    chunk = await store.create_chunk(
+        source_id="src-1",
+        project_id="proj-1",
+        chunk_index=7,
+        content="hello",
+        content_hash="h7",
+    )
+
+    assert chunk.id == "chunk-7"
+    assert chunk.embedding == [5.0]
+    assert store.embedding_provider.batches == [["hello"]]
+    assert len(store.client.inserts) == 1
+
+
+@pytest.mark.asyncio
+async def test_duplicate_content_embedded_once(store, monkeypatch):
+    """Test repeated content hashes reuse cached embeddings with LRU eviction."""
+    monkeypatch.setattr(storage, "EMBEDDING_CACHE_SIZE", 2)
+    boilerplate = {**_chunk(0), "content": "footer", "content_hash": "footer"}
+
+    await store.batch_create_chunks([dict(boilerplate), _chunk(1), dict(boilerplate)])
+    await store.batch_create_chunks([dict(boilerplate), _chunk(2)])
+
+    assert store.embedding_provider.batches == [["footer", "xx"], ["xxx"]]
+    assert [content_hash for _, content_hash in store._embed_cache] == ["footer", "h2"]
+
+
+@pytest.mark.asyncio
+async def test_embedding_cache_not_shared_across_providers(store):
+    """Test a new embedding provider never gets the previous model's vectors."""
+    await store.batch_create_chunks([_chunk(0)])
+
+    class _OtherProvider(_FakeEmbeddingProvider):
+        model = "other-model"
+
+    store.embedding_provider = _OtherProvider()
+    await store.batch_create_chunks([_chunk(0)])
+
+    assert store.embedding_provider.batches == [["x"]]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_reranks_wider_candidate_set(store):
+    """Test reranking fetches 5x candidates and returns the top by rerank score."""
+    store.reranker = _FakeReranker()
+    store.client.rpc_rows = [
+        {"chunk_id": str(i), "content": "x" * i, "combined_score": 0.9 - i / 10}
+        for i in range(1, 5)
+    ]
+
+    results = await store.hybrid_search("query", "proj-1", limit=2)
+
+    assert store.client.rpc_calls[0][1]["match_count"] == 10
+    assert [r["chunk_id"] for r in results] == ["4", "3"]
+    assert [r["rerank_score"] for r in results] == [4.0, 3.0]
+    assert results[0]["combined_score"] == 4.0
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_without_reranker_keeps_retrieval_order(store):
+    """Test search fetches only limit rows when reranking is off."""
+    store.reranker = _FakeReranker()
+    store.client.rpc_rows = [{"chunk_id": "1", "content": "a"}, {"chunk_id": "2", "content": "bb"}]
+
+    results = await store.hybrid_search("query", "proj-1", limit=2, rerank=False)
+
+    assert store.client.rpc_calls[0][1]["match_count"] == 2
+    assert [r["chunk_id"] for r in results] == ["1", "2"]
+    assert "rerank_score" not in results[0]
+
+
+@pytest.mark.asyncio
+async def test_hybrid_search_rrf_uses_fusion_rpc(store):
+    """Test RRF fusion calls the three-signal RPC without weights or threshold."""
+    store.client.rpc_rows = [{"chunk_id": "1", "content": "a", "combined_score": 0.03}]
+
+    results = await store.hybrid_search("query", "proj-1", limit=3, fusion=FusionMethod.RRF)
+
+    name, params = store.client.rpc_calls[0]
+    assert name == "hybrid_search_rrf"
+    assert params["match_count"] == 3
+    assert "vector_weight" not in params and "match_threshold" not in params
+    assert results == store.client.rpc_rows
+
+
+@pytest.mark.asyncio
+async def test_batch_create_chunks_sets_token_counts(store):
+    """Test every stored chunk gets a token count from the tokenizer."""
+    created = await store.batch_create_chunks([_chunk(7), _chunk(11)])
+
+    assert [row["token_count"] for row in store.client.inserts[0]] == [2, 3]
+    assert [c.token_count for c in created] == [2, 3]
+
+
+@pytest.mark.asyncio
+async def test_batch_create_chunks_streams_windows_to_inserts(store, monkeypatch):
+    """Test embedding windows feed inserts in order, across window boundaries."""
+    monkeypatch.setattr(storage, "EMBEDDING_WINDOW_SIZE", 2)
+    monkeypatch.setattr(storage, "CHUNK_INSERT_BATCH_SIZE", 3)
+
+    created = await store.batch_create_chunks([_chunk(i) for i in range(5)])
+
+    assert store.embedding_provider.batches == [["x", "xx"], ["xxx", "xxxx"], ["xxxxx"]]
+    assert [len(rows) for rows in store.client.inserts] == [3, 2]
+    assert [c.chunk_index for c in created] == [0, 1, 2, 3, 4]
+
+
+@pytest.mark.asyncio
+async def test_batch_create_chunks_propagates_embedding_failure(store, monkeypatch):
+    """Test an embedding error surfaces instead of leaving the inserter waiting."""
+
+    async def fail(texts):
+        raise RuntimeError("embedding backend down")
+
+    monkeypatch.setattr(store.embedding_provider, "get_embedding_batch", fail)
+
+    with pytest.raises(RuntimeError, match="embedding backend down"):
+        await store.batch_create_chunks([_chunk(0), _chunk(1)])
+    assert store.client.inserts == []
+
+
+@pytest.mark.asyncio
+async def test_insert_sends_embeddings_as_vector_literals(store):
+    """Test embeddings go over the wire as compact pgvector text and parse back."""
+    created = await store.batch_create_chunks([_chunk(0), _chunk(1, embed=False)])
+
+    rows = store.client.inserts[0]
+    assert rows[0]["embedding"] == "[1.0]"
+    assert "embedding" not in rows[1]
+    assert [c.embedding for c in created] == [[1.0], None]
+
+
+@pytest.mark.asyncio
+async def test_batch_create_chunks_rolls_back_on_failed_insert(store, monkeypatch):
+    """Test rows from earlier insert requests are deleted when a later one fails."""
+    monkeypatch.setattr(storage, "CHUNK_INSERT_BATCH_SIZE", 2)
+    store.client.fail_on_insert = 1
+
+    with pytest.raises(RuntimeError, match="insert rejected"):
+        await store.batch_create_chunks([_chunk(i) for i in range(4)])
+
+    assert store.client.deletes == [["chunk-0", "chunk-1"]]
+
+
+@pytest.mark.asyncio
+async def test_batch_create_chunks_trusted_and_raw_results(store):
+    """Test read models skip validation but match it, and raw=True returns rows."""
+    created = await store.batch_create_chunks([_chunk(0)])
+    rows = await store.batch_create_chunks([_chunk(0)], raw=True)
+
+    validated = DocumentChunk(**rows[0])
+    assert created[0] == validated
+    assert isinstance(rows[0], dict) and rows[0]["embedding"] == "[1.0]"
@@ -112,6 +112,29 @@ class TestOpenAIEmbeddingProvider:
             assert len(embedding) == provider.dimensions
             assert len(embedding) == 1536
 
+    @pytest.mark.asyncio
+    async def test_get_embedding_batch_single_request(self):
+        """Test batch embedding sends all inputs in one request, in order."""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {
+            "data": [
+                {"index": 1, "embedding": [1.0] * 1536},
+                {"index": 0, "embedding": [0.0] * 1536},
+            ]
+        }
+
+        mock_client = AsyncMock()
+        mock_client.post.return_value = mock_response
+
+        provider = OpenAIEmbeddingProvider("test-api-key")
+        provider.client = mock_client
+
+        embeddings = await provider.get_embedding_batch(["first", "second"])
+
+        mock_client.post.assert_called_once()
+        assert mock_client.post.call_args[1]["json"]["input"] == ["first", "second"]
+        assert [e[0] for e in embeddings] == [0.0, 1.0]
+
 
 class TestAnthropicEmbeddingProvider:
     """Test Anthropic embedding provider."""
@@ -231,6 +254,18 @@ class TestEmbeddingProviderInterface:
             assert all(isinstance(x, float) for x in embedding)
             assert len(embedding) == 1536
 
+    @pytest.mark.asyncio
+    async def test_default_batch_matches_single(self):
+        """Test the default batch implementation embeds each text in order."""
+        provider = SimpleEmbeddingProvider()
+
+        batch = await provider.get_embedding_batch(["alpha", "beta"])
+
+        assert batch == [
+            await provider.get_embedding("alpha"),
+            await provider.get_embedding("beta"),
+        ]
+
 
 class TestEmbeddingEdgeCases:
     """Test edge cases for embedding generation."""
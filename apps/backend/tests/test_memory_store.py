@@ -326,6 +326,20 @@ class TestMemoryStoreQuery:
 
         assert result.total_count == 0
 
+    @pytest.mark.asyncio
+    async def test_query_with_tags_uses_one_contains(self, memory_store, mock_supabase_client):
+        """Test all tags are matched by a single containment filter."""
+        query_mock = mock_supabase_client.table.return_value.select.return_value
+        contains_mock = query_mock.contains
+        contains_mock.return_value.order.return_value.range.return_value.execute.return_value = (
+            MagicMock(data=[])
+        )
+        query_mock.execute.return_value = MagicMock(count=0)
+
+        await memory_store.query(MemoryQuery(tags=["auth", "oauth"]))
+
+        contains_mock.assert_called_once_with("tags", ["auth", "oauth"])
+
 
 class TestMemoryStoreVectorSearch:
     """Test vector similarity search."""
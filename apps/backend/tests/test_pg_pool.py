@@ -0,0 +1,32 @@
+"""Tests for the asyncpg pool's type codecs."""
+
+import struct
+
+from src.state.pg_pool import _VECTOR_DTYPES, _decode_jsonb, _encode_jsonb, _vector_codec
+
+
+def test_vector_codec_round_trips_pgvector_binary():
+    """Test embeddings encode to pgvector's binary layout and decode back."""
+    encode, decode = _vector_codec(_VECTOR_DTYPES["vector"])
+    data = encode([0.5, -1.0, 2.25])
+
+    assert data[:4] == struct.pack(">HH", 3, 0)
+    assert struct.unpack(">3f", data[4:]) == (0.5, -1.0, 2.25)
+    assert decode(data) == [0.5, -1.0, 2.25]
+
+
+def test_halfvec_codec_rounds_to_fp16():
+    """Test halfvec values are sent as two-byte floats."""
+    encode, decode = _vector_codec(_VECTOR_DTYPES["halfvec"])
+    data = encode([0.1, 1.0])
+
+    assert len(data) == 4 + 2 * 2
+    assert decode(data) == [0.0999755859375, 1.0]
+
+
+def test_jsonb_codec_uses_binary_version_prefix():
+    """Test jsonb values carry the version byte and round-trip through orjson."""
+    data = _encode_jsonb({"messages": [{"role": "user", "content": "héllo"}]})
+
+    assert data[:1] == b"\x01"
+    assert _decode_jsonb(data) == {"messages": [{"role": "user", "content": "héllo"}]}
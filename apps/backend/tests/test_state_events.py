@@ -0,0 +1,72 @@
+"""Tests for the agent event publisher's local run cache."""
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from src.state import events
+from src.state.events import AgentEventPublisher, _RunCache
+
+
+class _Clock:
+    """Controllable stand-in for time.monotonic."""
+
+    def __init__(self) -> None:
+        self.now = 1000.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_run_cache_evicts_least_recently_used():
+    """Test the cache stays within maxsize, dropping the oldest use first."""
+    cache = _RunCache(maxsize=2)
+    cache.set("a", {"id": "a"})
+    cache.set("b", {"id": "b"})
+    assert cache.get("a") == {"id": "a"}
+
+    cache.set("c", {"id": "c"})
+
+    assert len(cache) == 2
+    assert cache.get("b") is None
+    assert cache.get("a") == {"id": "a"}
+    assert cache.get("c") == {"id": "c"}
+
+
+def test_run_cache_expires_entries(monkeypatch):
+    """Test entries are dropped once their TTL has passed."""
+    clock = _Clock()
+    monkeypatch.setattr(events.time, "monotonic", clock)
+    cache = _RunCache()
+    cache.set("run", {"id": "run"}, ttl=10)
+
+    clock.now += 9
+    assert cache.get("run") == {"id": "run"}
+
+    clock.now += 2
+    assert cache.get("run") is None
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+async def test_completed_runs_use_short_ttl(monkeypatch):
+    """Test terminal runs expire sooner than in-progress ones."""
+    clock = _Clock()
+    monkeypatch.setattr(events.time, "monotonic", clock)
+
+    with patch("src.state.events.SupabaseStateStore") as store_class:
+        store = store_class.return_value
+        store.update_agent_run = AsyncMock(
+            side_effect=lambda run_id, status, **_: {"id": run_id, "status": status}
+        )
+        store.get_agent_run = AsyncMock(return_value=None)
+        publisher = AgentEventPublisher()
+
+        await publisher.update_progress("running", step="work", progress=50.0)
+        await publisher.complete_run("done", result={"ok": True})
+
+        clock.now += events.RUN_CACHE_TERMINAL_TTL_SECONDS + 1
+
+        assert (await publisher.get_run_status("running"))["status"] == "in_progress"
+        assert await publisher.get_run_status("done") is None
+        store.get_agent_run.assert_awaited_once_with("done")
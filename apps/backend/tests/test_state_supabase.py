@@ -0,0 +1,412 @@
+"""Tests for the pooled Supabase state store."""
+
+import asyncio
+
+import httpx
+import pytest
+
+from src.state import supabase as state_supabase
+from src.state.supabase import SupabaseStateStore
+
+
+class _FakePool:
+    """Records queries and returns canned rows."""
+
+    def __init__(self, row: dict | None = None) -> None:
+        self.row = row
+        self.calls: list[tuple[str, tuple]] = []
+
+    async def fetchrow(self, query: str, *args):
+        self.calls.append((query, args))
+        return self.row
+
+    async def fetch(self, query: str, *args):
+        self.calls.append((query, args))
+        return [self.row] if self.row else []
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    fake = _FakePool({"id": "run-1", "status": "in_progress"})
+
+    async def get_pool():
+        return fake
+
+    monkeypatch.setattr(state_supabase, "get_pool", get_pool)
+    for cache in (
+        state_supabase._conversation_cache,
+        state_supabase._agent_run_cache,
+        state_supabase._memory_cache,
+    ):
+        cache.clear()
+    state_supabase._pending_run_updates.clear()
+    state_supabase._run_flush_tasks.clear()
+    state_supabase._run_flush_errors.clear()
+    return fake
+
+
+@pytest.mark.asyncio
+async def test_update_agent_run_merges_metadata_in_one_statement(pool):
+    """Test the update sends progress as-is and merges metadata without a read."""
+    state_supabase._agent_run_cache.set("run-1", pool.row)
+    await SupabaseStateStore().update_agent_run(
+        "run-1", status="in_progress", progress_percent=150.0, metadata={"k": 1}
+    )
+    await state_supabase.flush_agent_run_updates()
+
+    [(query, args)] = pool.calls
+    assert query.startswith("UPDATE agent_runs SET status = $2, progress_percent = $3")
+    assert "metadata = COALESCE(metadata, '{}'::jsonb) || $4" in query
+    assert args == ("run-1", "in_progress", 150.0, {"k": 1})
+
+
+@pytest.mark.asyncio
+async def test_update_agent_run_without_changes_skips_query(pool):
+    """Test an empty update does not touch the database."""
+    assert await SupabaseStateStore().update_agent_run("run-1") is None
+    assert pool.calls == []
+
+
+@pytest.mark.asyncio
+async def test_query_memories_numbers_filter_parameters(pool):
+    """Test optional filters and pagination get consecutive placeholders."""
+    await SupabaseStateStore().query_memories(
+        domain="knowledge", tags=["a", "b"], limit=5, offset=10
+    )
+
+    [(query, args)] = pool.calls
+    assert "WHERE domain = $1 AND tags @> $2::jsonb" in query
+    assert "LIMIT $3 OFFSET $4" in query
+    assert args == ("knowledge", ["a", "b"], 5, 10)
+
+
+def test_store_instances_share_one_client(monkeypatch):
+    """Test one client, on the pooled HTTP session, serves every store instance."""
+    created = []
+    monkeypatch.setattr(state_supabase.settings, "supabase_url", "https://example.supabase.co")
+    monkeypatch.setattr(state_supabase.settings, "supabase_service_role_key", "key")
+    monkeypatch.setattr(
+        state_supabase,
+        "create_client",
+        lambda url, key, options: created.append(options) or object(),
+    )
+    state_supabase.close_client()
+
+    try:
+        assert SupabaseStateStore().client is SupabaseStateStore().client
+        [options] = created
+        session = state_supabase._get_http_client()
+        assert options.httpx_client is session
+    finally:
+        state_supabase.close_client()
+
+    assert session.is_closed
+
+
+@pytest.mark.asyncio
+async def test_update_agent_run_metadata_only(pool):
+    """Test a metadata-only update is a single merging UPDATE."""
+    state_supabase._agent_run_cache.set("run-1", pool.row)
+    await SupabaseStateStore().update_agent_run("run-1", metadata={"iterations": 3})
+    await state_supabase.flush_agent_run_updates()
+
+    [(query, args)] = pool.calls
+    assert query == (
+        "UPDATE agent_runs SET metadata = COALESCE(metadata, '{}'::jsonb) || $2 "
+        "WHERE id = $1 RETURNING *"
+    )
+    assert args == ("run-1", {"iterations": 3})
+
+
+@pytest.mark.asyncio
+async def test_get_agent_run_is_cached_until_expiry(pool, monkeypatch):
+    """Test repeated reads within the TTL hit the cache, then refetch."""
+    now = [1000.0]
+    monkeypatch.setattr(state_supabase.time, "monotonic", lambda: now[0])
+    store = SupabaseStateStore()
+
+    first = await store.get_agent_run("run-1")
+    first["status"] = "mutated"
+    assert await store.get_agent_run("run-1") == {"id": "run-1", "status": "in_progress"}
+    assert len(pool.calls) == 1
+
+    now[0] += state_supabase.ROW_CACHE_TTL_SECONDS
+    await store.get_agent_run("run-1")
+    assert len(pool.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_update_agent_run_refreshes_cache(pool):
+    """Test a read after an update is served from the returned row."""
+    store = SupabaseStateStore()
+    await store.get_agent_run("run-1")
+    pool.row = {"id": "run-1", "status": "completed"}
+
+    await store.update_agent_run("run-1", status="completed")
+
+    assert await store.get_agent_run("run-1") == {"id": "run-1", "status": "completed"}
+    assert len(pool.calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_get_agent_runs_by_ids_fetches_only_misses(pool):
+    """Test the bulk loader serves cached runs and fetches the rest in one query."""
+    store = SupabaseStateStore()
+    state_supabase._agent_run_cache.set("run-0", {"id": "run-0", "status": "pending"})
+
+    runs = await store.get_agent_runs_by_ids(["run-0", "run-1", "run-1", "run-2"])
+
+    assert runs == {
+        "run-0": {"id": "run-0", "status": "pending"},
+        "run-1": {"id": "run-1", "status": "in_progress"},
+    }
+    [(query, args)] = pool.calls
+    assert query == "SELECT * FROM agent_runs WHERE id = ANY($1::uuid[])"
+    assert args == (["run-1", "run-2"],)
+
+
+def test_http_client_encodes_json_bodies_with_orjson():
+    """Test json= payloads are sent as compact orjson bytes."""
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return httpx.Response(201)
+
+    with state_supabase._OrjsonClient(transport=httpx.MockTransport(handler)) as client:
+        client.post("https://example.supabase.co/rest/v1/tasks", json={"id": "t", "n": [1]})
+
+    [request] = sent
+    assert request.content == b'{"id":"t","n":[1]}'
+    assert request.headers["content-type"] == "application/json"
+
+
+@pytest.mark.asyncio
+async def test_list_getters_select_requested_columns(pool):
+    """Test getters narrow the SELECT list to the requested columns."""
+    store = SupabaseStateStore()
+
+    await store.get_task_agent_runs("task-1", columns=("status", "metadata"))
+    await store.get_active_agent_runs("user-1")
+
+    assert pool.calls[0][0].split("FROM")[0].split() == ["SELECT", '"status",', '"metadata"']
+    assert '"metadata"' not in pool.calls[1][0]
+    assert '"progress_percent"' in pool.calls[1][0]
+
+
+@pytest.mark.asyncio
+async def test_update_agent_run_coalesces_progress_updates(pool, monkeypatch):
+    """Test updates within the window become one UPDATE with the latest values."""
+    monkeypatch.setattr(state_supabase, "AGENT_RUN_FLUSH_DELAY_SECONDS", 0.01)
+    state_supabase._agent_run_cache.set("run-1", pool.row)
+    store = SupabaseStateStore()
+
+    await store.update_agent_run("run-1", progress_percent=10.0, metadata={"a": 1})
+    run = await store.update_agent_run("run-1", progress_percent=20.0, metadata={"b": 2})
+    assert pool.calls == []
+    assert run == {
+        "id": "run-1",
+        "status": "in_progress",
+        "progress_percent": 20.0,
+        "metadata": {"a": 1, "b": 2},
+    }
+
+    await asyncio.sleep(0.05)
+
+    [(query, args)] = pool.calls
+    assert query.startswith("UPDATE agent_runs SET progress_percent = $2, metadata = ")
+    assert args == ("run-1", 20.0, {"a": 1, "b": 2})
+
+
+@pytest.mark.asyncio
+async def test_update_agent_run_terminal_status_flushes_immediately(pool):
+    """Test a terminal status writes the buffered fields with it at once."""
+    state_supabase._agent_run_cache.set("run-1", pool.row)
+    pool.row = {"id": "run-1", "status": "completed"}
+    store = SupabaseStateStore()
+
+    await store.update_agent_run("run-1", current_step="Writing report")
+    run = await store.update_agent_run("run-1", status="completed", progress_percent=100.0)
+
+    assert run == {"id": "run-1", "status": "completed"}
+    [(query, args)] = pool.calls
+    assert args == ("run-1", "Writing report", "completed", 100.0)
+    assert state_supabase._run_flush_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_buffered_update_is_visible_to_reads_before_the_flush(pool, monkeypatch):
+    """Test a run read during the window includes the caller's pending update."""
+    monkeypatch.setattr(state_supabase, "AGENT_RUN_FLUSH_DELAY_SECONDS", 60)
+    store = SupabaseStateStore()
+
+    run = await store.update_agent_run("run-1", current_step="Planning")
+
+    assert run == {"id": "run-1", "status": "in_progress", "current_step": "Planning"}
+    assert await store.get_agent_run("run-1") == run
+    [(query, _)] = pool.calls
+    assert query == "SELECT * FROM agent_runs WHERE id = $1"
+
+
+@pytest.mark.asyncio
+async def test_update_agent_run_flush_writes_immediately(pool):
+    """Test flush=True writes the buffered updates with this one before returning."""
+    state_supabase._agent_run_cache.set("run-1", pool.row)
+    store = SupabaseStateStore()
+
+    await store.update_agent_run("run-1", current_step="Reviewing")
+    await store.update_agent_run("run-1", metadata={"iterations": 2}, flush=True)
+
+    [(query, args)] = pool.calls
+    assert query.startswith("UPDATE agent_runs SET current_step = $2, metadata = ")
+    assert args == ("run-1", "Reviewing", {"iterations": 2})
+    assert state_supabase._run_flush_tasks == {}
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_updates_and_raises_on_the_next_update(pool, monkeypatch):
+    """Test a background flush error keeps the buffered updates and is reported."""
+    monkeypatch.setattr(state_supabase, "AGENT_RUN_FLUSH_DELAY_SECONDS", 0.01)
+    state_supabase._agent_run_cache.set("run-1", pool.row)
+    store = SupabaseStateStore()
+    failing = True
+
+    async def fetchrow(query: str, *args):
+        pool.calls.append((query, args))
+        if failing:
+            raise ConnectionError("database unavailable")
+        return pool.row
+
+    monkeypatch.setattr(pool, "fetchrow", fetchrow)
+
+    await store.update_agent_run("run-1", progress_percent=10.0, metadata={"a": 1})
+    await asyncio.sleep(0.05)
+
+    with pytest.raises(ConnectionError):
+        await store.update_agent_run("run-1", current_step="Retrying")
+
+    failing = False
+    await state_supabase.flush_agent_run_updates()
+    query, args = pool.calls[-1]
+    assert query.startswith("UPDATE agent_runs SET progress_percent = $2, current_step = $3")
+    assert args == ("run-1", 10.0, "Retrying", {"a": 1})
+
+
+class _FakeRealtimeChannel:
+    """Pushes canned payloads, then reports the given final state."""
+
+    def __init__(self, payloads: list[dict], final_state) -> None:
+        self.payloads = payloads
+        self.final_state = final_state
+        self.filter: str | None = None
+
+    def on_postgres_changes(self, event, callback, table, schema, filter):
+        self.filter = filter
+        self.callback = callback
+        return self
+
+    async def subscribe(self, on_status):
+        on_status(state_supabase.RealtimeSubscribeStates.SUBSCRIBED, None)
+        for payload in self.payloads:
+            self.callback(payload)
+        on_status(self.final_state, None)
+        return self
+
+
+class _FakeRealtimeClient:
+    def __init__(self, channel: _FakeRealtimeChannel) -> None:
+        self._channel = channel
+        self.closed = False
+
+    def channel(self, topic: str) -> _FakeRealtimeChannel:
+        return self._channel
+
+    async def close(self) -> None:
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_subscribe_task_agent_runs_resubscribes_with_backoff(monkeypatch):
+    """Test a dropped subscription is re-established after a backoff delay."""
+    closed = state_supabase.RealtimeSubscribeStates.CLOSED
+    clients = [
+        _FakeRealtimeClient(_FakeRealtimeChannel([{"id": 1}], closed)),
+        _FakeRealtimeClient(_FakeRealtimeChannel([{"id": 2}], closed)),
+    ]
+    delays: list[float] = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    async def get_task_agent_runs(self, task_id):
+        return [{"id": "run-1", "status": "completed"}]
+
+    monkeypatch.setattr(state_supabase, "_realtime_client", lambda: clients[len(delays)])
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+    monkeypatch.setattr(SupabaseStateStore, "get_task_agent_runs", get_task_agent_runs)
+
+    stream = SupabaseStateStore().subscribe_task_agent_runs("task-1")
+    assert [await anext(stream) for _ in range(3)] == [
+        {"id": 1},
+        {"type": "snapshot", "records": [{"id": "run-1", "status": "completed"}]},
+        {"id": 2},
+    ]
+    await stream.aclose()
+
+    assert delays == [1.0]
+    assert clients[0]._channel.filter == "task_id=eq.task-1"
+    assert all(client.closed for client in clients)
+
+
+@pytest.mark.asyncio
+async def test_subscribe_task_agent_runs_gives_up_after_max_attempts(monkeypatch):
+    """Test consecutive failures back off up to the cap, then raise."""
+    delays: list[float] = []
+
+    async def sleep(delay):
+        delays.append(delay)
+
+    class _UnreachableChannel(_FakeRealtimeChannel):
+        async def subscribe(self, on_status):
+            raise OSError("connection refused")
+
+    monkeypatch.setattr(
+        state_supabase,
+        "_realtime_client",
+        lambda: _FakeRealtimeClient(_UnreachableChannel([], None)),
+    )
+    monkeypatch.setattr(asyncio, "sleep", sleep)
+
+    with pytest.raises(ConnectionError):
+        async for _ in SupabaseStateStore().subscribe_task_agent_runs("task-1"):
+            pass
+
+    assert delays == [1.0, 2.0, 4.0, 8.0, 16.0, 30.0, 30.0, 30.0, 30.0]
+
+
+@pytest.mark.asyncio
+async def test_subscribe_task_agent_runs_resubscribes_when_idle(monkeypatch):
+    """Test a silent subscription is replaced without backoff and followed by a snapshot."""
+    clients: list[_FakeRealtimeClient] = []
+
+    class _SilentChannel(_FakeRealtimeChannel):
+        async def subscribe(self, on_status):
+            on_status(state_supabase.RealtimeSubscribeStates.SUBSCRIBED, None)
+            return self
+
+    def realtime_client():
+        clients.append(_FakeRealtimeClient(_SilentChannel([], None)))
+        return clients[-1]
+
+    async def get_task_agent_runs(self, task_id):
+        return []
+
+    monkeypatch.setattr(state_supabase, "REALTIME_IDLE_TIMEOUT_SECONDS", 0.01)
+    monkeypatch.setattr(state_supabase, "_realtime_client", realtime_client)
+    monkeypatch.setattr(SupabaseStateStore, "get_task_agent_runs", get_task_agent_runs)
+
+    stream = SupabaseStateStore().subscribe_task_agent_runs("task-1")
+    assert await anext(stream) == {"type": "snapshot", "records": []}
+    await stream.aclose()
+
+    assert len(clients) == 2 and clients[0].closed
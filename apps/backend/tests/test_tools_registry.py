@@ -0,0 +1,249 @@
+"""Tests for the tool registry."""
+
+import sys
+from dataclasses import FrozenInstanceError
+
+import orjson
+import pytest
+
+from src.tools import definitions
+from src.tools import registry as tool_registry
+from src.tools.generate_validators import generate_validators
+from src.tools.programmatic import ProgrammaticToolCaller
+from src.tools.registry import ToolCategory, ToolConfig, ToolDefinition, ToolRegistry
+
+_PATH_SCHEMA = {
+    "type": "object",
+    "properties": {"path": {"type": "string"}},
+    "required": ["path"],
+}
+
+
+def _tool(name: str, **kwargs) -> ToolDefinition:
+    return ToolDefinition(
+        name=name, description=name, input_schema=dict(_PATH_SCHEMA), **kwargs
+    )
+
+
+def test_identical_schemas_share_a_compiled_validator():
+    """Test tools with equal input schemas reuse one compiled validator."""
+    registry = ToolRegistry()
+    registry.register(_tool("file.read"))
+    registry.register(_tool("file.stat"))
+
+    assert registry._validators["file.read"] is registry._validators["file.stat"]
+
+
+def test_factory_tools_are_built_on_first_use():
+    """Test a factory-registered tool is counted as deferred but built only when asked for."""
+    registry = ToolRegistry()
+    built = []
+
+    def build() -> ToolDefinition:
+        built.append("file.read")
+        return _tool("file.read", categories=[ToolCategory.FILE_SYSTEM])
+
+    registry.register_factory("file.read", build, categories=[ToolCategory.FILE_SYSTEM])
+
+    assert registry.get_context_stats()["deferred_tools"] == 1
+    assert registry.to_api_format(include_search_tool=False, include_code_execution=False) == []
+    assert built == []
+
+    assert registry.search_by_category(ToolCategory.FILE_SYSTEM) == [registry.get("file.read")]
+    assert built == ["file.read"]
+
+
+@pytest.mark.asyncio
+async def test_invalid_input_is_rejected_before_the_handler_runs():
+    """Test programmatic calls are validated against the tool's schema."""
+    registry = ToolRegistry()
+    registry.register(_tool("file.read"))
+    caller = ProgrammaticToolCaller(registry)
+    calls = []
+    caller.register_handler("file.read", lambda path: calls.append(path) or path)
+    context = caller.create_context()
+    context.add_tool_call("file.read", {"path": 3})
+    context.add_tool_call("file.read", {"path": "a.txt"})
+
+    results = await caller.execute_pending_calls(context)
+
+    assert "must be string" in results[0]["error"]
+    assert results[1] == {"id": results[1]["id"], "result": "a.txt"}
+    assert calls == ["a.txt"]
+
+
+def test_factory_tool_input_is_validated_before_it_is_built():
+    """Test validating input for a tool registered only as a factory builds and checks it."""
+    registry = ToolRegistry()
+    registry.register_factory("file.read", lambda: _tool("file.read"))
+
+    with pytest.raises(ValueError, match="must be string"):
+        registry.validate_input("file.read", {"path": 3})
+    registry.validate_input("file.read", {"path": "a.txt"})
+
+
+def test_generated_validators_are_used_instead_of_runtime_compiles(tmp_path, monkeypatch):
+    """Test ahead-of-time validator modules are written once and then imported."""
+    monkeypatch.setattr(tool_registry, "GENERATED_VALIDATORS_DIR", tmp_path)
+    monkeypatch.setattr(tool_registry, "_compiled_validators", {})
+
+    written = generate_validators(tmp_path)
+    assert written and generate_validators(tmp_path) == []
+
+    def fail_compile(*args, **kwargs):
+        raise AssertionError("compiled at runtime")
+
+    monkeypatch.setattr(tool_registry.fastjsonschema, "compile", fail_compile)
+    validator = tool_registry.compile_validator(
+        tool_registry.get_registry().get("file.read").input_schema
+    )
+    with pytest.raises(ValueError):
+        validator({})
+
+
+def test_indexes_follow_registration_and_replacement():
+    """Test category, keyword and programmatic lookups come from the register-time indexes."""
+    registry = ToolRegistry()
+    registry.register(
+        _tool(
+            "file.read",
+            categories=[ToolCategory.FILE_SYSTEM],
+            keywords=["Read"],
+            config=ToolConfig(allowed_callers=["code_execution_20250825"]),
+        )
+    )
+    registry.register_factory(
+        "database.query",
+        lambda: _tool("database.query", keywords=["SQL"]),
+        categories=[ToolCategory.DATABASE],
+    )
+
+    assert registry.get_category_counts() == {"file_system": 1, "database": 1}
+    assert [t.name for t in registry.search_by_keyword("read")] == ["file.read"]
+    assert [t.name for t in registry.search_by_keyword("sql")] == ["database.query"]
+    assert [t.name for t in registry.get_programmatic_tools()] == ["file.read"]
+
+    registry.register(_tool("file.read", categories=[ToolCategory.AUDIT]))
+
+    assert registry.search_by_keyword("read") == []
+    assert registry.get_programmatic_tools() == []
+    assert registry.get_category_counts() == {"audit": 1}
+
+
+def test_tool_definitions_are_frozen_and_slotted():
+    """Test registered definitions can't be mutated and carry no instance dict."""
+    tool = _tool("file.read")
+
+    with pytest.raises(FrozenInstanceError):
+        tool.name = "file.write"
+    assert not hasattr(tool, "__dict__")
+    assert not hasattr(tool.config, "__dict__")
+
+
+def test_names_and_keywords_are_interned():
+    """Test definitions intern their name, keywords and aliases."""
+    name = "".join(["file", ".", "read"])
+    tool = _tool(name, keywords=["".join(["fi", "le"])], aliases=["".join(["r", "d"])])
+
+    assert tool.name is sys.intern("file.read")
+    assert tool.keywords == ("file",) and tool.keywords[0] is sys.intern("file")
+    assert tool.aliases[0] is sys.intern("rd")
+
+
+def test_keyword_set_holds_lowercased_keywords_aliases_and_name():
+    """Test definitions keep a frozenset of their search terms for membership checks."""
+    tool = _tool("File.Read", keywords=["Read", "file"], aliases=["Cat"])
+
+    assert tool.keyword_set == frozenset({"read", "file", "cat", "file.read"})
+    assert tool.matches_query("cat") > 0
+
+
+def test_specs_register_core_tools_eagerly_and_the_rest_lazily():
+    """Test each tool spec is registered, with only the non-deferred ones built."""
+    registry = ToolRegistry()
+    definitions._register_specs(registry, definitions._TOOL_SPECS)
+
+    assert set(registry._tools) == {"health_check", "get_task_status"}
+    assert {t.name for t in registry.all_tools()} == {
+        spec["name"] for spec in definitions._TOOL_SPECS
+    }
+
+
+def test_specs_share_repeated_schema_fragments():
+    """Test repeated fragments are one shared object and still serialize as plain JSON."""
+    callers = {
+        id(spec["config"].allowed_callers)
+        for spec in definitions._TOOL_SPECS
+        if spec["config"].allowed_callers
+    }
+    registry = ToolRegistry()
+    registry.register(
+        _tool("file.read", config=ToolConfig(allowed_callers=definitions._CODE_EXECUTION_CALLERS))
+    )
+
+    assert callers == {id(definitions._CODE_EXECUTION_CALLERS)}
+    assert b'"allowed_callers":["code_execution_20250825"]' in registry.get_manifest()[0]
+
+
+def test_register_all_tools_runs_once():
+    """Test repeat calls return the same registry without rebuilding its tools."""
+    first = definitions.register_all_tools()
+    health_check = first.get("health_check")
+
+    assert definitions.register_all_tools() is first
+    assert first.get("health_check") is health_check
+
+
+def test_keyword_prefix_search():
+    """Test prefix lookups match keywords and aliases, case-insensitively."""
+    registry = ToolRegistry()
+    registry.register(_tool("file.read", keywords=["read", "file"]))
+    registry.register(_tool("file.write", keywords=["write", "file"], aliases=["Record"]))
+    registry.register_factory(
+        "database.query", lambda: _tool("database.query", keywords=["query", "rows"])
+    )
+
+    assert [t.name for t in registry.search_keyword_prefix("re")] == ["file.read", "file.write"]
+    assert [t.name for t in registry.search_keyword_prefix("FI")] == ["file.read", "file.write"]
+    assert [t.name for t in registry.search_keyword_prefix("row")] == ["database.query"]
+    assert registry.search_keyword_prefix("zz") == []
+
+
+def test_category_membership_uses_the_packed_mask():
+    """Test in_category() agrees with the categories a tool was declared with."""
+    tool = _tool("file.read", categories=[ToolCategory.FILE_SYSTEM, ToolCategory.CORE])
+
+    assert tool.in_category(ToolCategory.CORE) and tool.in_category(ToolCategory.FILE_SYSTEM)
+    assert not tool.in_category(ToolCategory.DATABASE)
+    assert not _tool("file.stat").category_mask
+
+
+def test_manifest_is_cached_until_the_next_registration():
+    """Test the serialized manifest is reused, lists only loaded tools, and is rebuilt on change."""
+    registry = ToolRegistry()
+    registry.register(_tool("file.read"))
+    registry.register(_tool("file.write", config=ToolConfig(defer_loading=True)))
+
+    body, etag = registry.get_manifest()
+    assert registry.get_manifest()[0] is body
+    assert [t["name"] for t in orjson.loads(body)["tools"]] == ["file.read"]
+
+    assert body == orjson.dumps(
+        {"tools": registry.to_api_format(include_search_tool=False, include_code_execution=False)}
+    )
+
+    registry.register(_tool("file.list"))
+    assert registry.get_manifest()[1] != etag
+
+
+def test_tool_stats_are_read_without_building_factories():
+    """Test stats count factory-registered tools from what was declared at registration."""
+    registry = ToolRegistry()
+    definitions._register_specs(registry, definitions._TOOL_SPECS)
+    factories = dict(registry._factories)
+
+    counts = (registry.get_category_counts(), registry.get_programmatic_count())
+
+    assert registry._factories == factories
+    registry.all_tools()
+    assert counts == (registry.get_category_counts(), len(registry.get_programmatic_tools()))
@@ -0,0 +1,32 @@
+"""Tests for tool search."""
+
+from src.tools.registry import ToolCategory, ToolDefinition, ToolRegistry
+from src.tools.search import ToolSearcher
+
+
+def _tool(name: str, description: str, **kwargs) -> ToolDefinition:
+    return ToolDefinition(name=name, description=description, input_schema={}, **kwargs)
+
+
+def test_bm25_scores_only_tools_sharing_a_query_term():
+    """Test BM25 ranks tools from the inverted index and honours the category filter."""
+    registry = ToolRegistry()
+    registry.register(
+        _tool("file.read", "Read a file from disk", categories=[ToolCategory.FILE_SYSTEM])
+    )
+    registry.register(
+        _tool(
+            "database.query",
+            "Run a query",
+            keywords=["rows"],
+            categories=[ToolCategory.DATABASE],
+        )
+    )
+    registry.register(_tool("health_check", "Check service health"))
+    searcher = ToolSearcher(registry)
+
+    results = searcher.search("read file rows", strategy="bm25")
+
+    assert [r.tool_name for r in results] == ["file.read", "database.query"]
+    assert searcher._bm25_postings["file"] == {"file.read": 2}
+    assert searcher.search("rows", strategy="bm25", category="file_system") == []
@@ -0,0 +1,61 @@
+"""Tests for batched API usage tracking."""
+
+import pytest
+
+from src.telemetry import usage_tracker
+from src.telemetry.usage_tracker import UsageTracker
+
+
+class _FakePool:
+    """Records executemany batches."""
+
+    def __init__(self) -> None:
+        self.batches: list[list[tuple]] = []
+
+    async def executemany(self, query: str, rows):
+        self.batches.append(list(rows))
+
+
+@pytest.fixture
+def pool(monkeypatch):
+    fake = _FakePool()
+
+    async def get_pool():
+        return fake
+
+    monkeypatch.setattr(usage_tracker, "get_pool", get_pool)
+    return fake
+
+
+async def _track(tracker: UsageTracker, count: int) -> None:
+    for i in range(count):
+        await tracker.track_api_call(
+            "run-1", "anthropic", "claude-3-5-haiku-20241022", 10 * i, 5, {"i": i}
+        )
+
+
+@pytest.mark.asyncio
+async def test_calls_are_written_in_one_batch_on_close(pool):
+    """Test queued rows are flushed together when the tracker closes."""
+    tracker = UsageTracker()
+    await _track(tracker, 3)
+
+    await tracker.aclose()
+
+    [batch] = pool.batches
+    assert [row[3] for row in batch] == [0, 10, 20]
+    assert batch[0] == (
+        "run-1", "anthropic", "claude-3-5-haiku-20241022", 0, 5, 0.0000008, 0.000004, {"i": 0}
+    )
+
+
+@pytest.mark.asyncio
+async def test_batches_are_capped(pool, monkeypatch):
+    """Test a full batch is written without waiting for the interval."""
+    monkeypatch.setattr(usage_tracker, "USAGE_FLUSH_MAX_ROWS", 2)
+    tracker = UsageTracker()
+    await _track(tracker, 5)
+
+    await tracker.aclose()
+
+    assert [len(batch) for batch in pool.batches] == [2, 2, 1]
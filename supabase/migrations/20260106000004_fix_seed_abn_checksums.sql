@@ -0,0 +1,8 @@
+-- Replace sample ABNs that fail the ATO modulus 89 checksum
+-- The API now validates ABN checksums, so seed rows must carry valid numbers
+
+UPDATE contractors SET abn = '51 824 753 556'
+WHERE id = '550e8400-e29b-41d4-a716-446655440001' AND abn = '12 345 678 901';
+
+UPDATE contractors SET abn = '53 456 789 012'
+WHERE id = '550e8400-e29b-41d4-a716-446655440002' AND abn = '23 456 789 012';
@@ -0,0 +1,63 @@
+-- =============================================================================
+-- Vector-only chunk search
+-- =============================================================================
+-- RAGStore.vector_search used to order rows by the raw embedding column
+-- and return placeholder scores. match_chunks ranks by cosine distance in
+-- Postgres so the ANN index is used and real similarity scores come back.
+
+-- HNSW gives better recall/latency than IVFFlat and needs no training data
+DROP INDEX IF EXISTS public.idx_document_chunks_embedding;
+CREATE INDEX IF NOT EXISTS idx_document_chunks_embedding
+    ON public.document_chunks
+    USING hnsw (embedding vector_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+CREATE OR REPLACE FUNCTION match_chunks(
+    query_embedding vector(1536),
+    project_id_filter UUID,
+    match_threshold FLOAT DEFAULT 0.7,
+    match_count INT DEFAULT 10
+)
+RETURNS TABLE (
+    chunk_id UUID,
+    source_id UUID,
+    content TEXT,
+    vector_score FLOAT,
+    keyword_score FLOAT,
+    combined_score FLOAT,
+    metadata JSONB,
+    heading_hierarchy TEXT[],
+    summary TEXT
+) AS $$
+    -- Nearest neighbours first (index scan), then apply the score threshold
+    SELECT
+        nearest.id,
+        nearest.source_id,
+        nearest.content,
+        nearest.score,
+        0::FLOAT,
+        nearest.score,
+        nearest.metadata,
+        nearest.heading_hierarchy,
+        nearest.summary
+    FROM (
+        SELECT
+            id,
+            source_id,
+            content,
+            metadata,
+            heading_hierarchy,
+            summary,
+            1 - (embedding <=> query_embedding) AS score
+        FROM public.document_chunks
+        WHERE
+            project_id = project_id_filter
+            AND embedding IS NOT NULL
+        ORDER BY embedding <=> query_embedding
+        LIMIT match_count
+    ) AS nearest
+    WHERE nearest.score >= match_threshold
+    ORDER BY nearest.score DESC;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION match_chunks IS 'Vector-only chunk search ranked by cosine similarity';
@@ -0,0 +1,110 @@
+-- =============================================================================
+-- Three-signal hybrid search with Reciprocal Rank Fusion
+-- =============================================================================
+-- Adds character-trigram similarity (pg_trgm) as a third retrieval signal
+-- alongside vector cosine and full-text rank. The three ranked lists are
+-- fused with RRF: sum over signals of 1 / (rrf_k + rank). Fusion is
+-- parameter-free apart from rrf_k, so no vector/keyword weights to tune,
+-- and trigram overlap catches typos and code identifiers that stemmed
+-- full-text search misses.
+--
+-- The trigram signal uses word_similarity(query_text, content): the best
+-- match of the query against any run of words in the chunk. Whole-string
+-- similarity() divides by every trigram of a ~2,000-character chunk, so
+-- a short query scores around 0.01 and never clears the 0.3 threshold.
+-- For example, the typo query 'hybird search' shares 10 of its 14
+-- trigrams with the words "hybrid search" in a chunk, giving a word
+-- similarity of 0.71. That is above the 0.6 word_similarity_threshold
+-- used by <%, so the chunk matches. <% is supported by the gin_trgm_ops
+-- index below.
+
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+CREATE INDEX IF NOT EXISTS idx_document_chunks_content_trgm
+    ON public.document_chunks
+    USING GIN (content gin_trgm_ops);
+
+CREATE OR REPLACE FUNCTION hybrid_search_rrf(
+    query_text TEXT,
+    query_embedding vector(1536),
+    project_id_filter UUID,
+    match_count INT DEFAULT 10,
+    rrf_k INT DEFAULT 60
+)
+RETURNS TABLE (
+    chunk_id UUID,
+    source_id UUID,
+    content TEXT,
+    vector_score FLOAT,
+    keyword_score FLOAT,
+    combined_score FLOAT,
+    metadata JSONB,
+    heading_hierarchy TEXT[],
+    summary TEXT
+) AS $$
+    WITH vector_ranked AS (
+        SELECT
+            id,
+            1 - (embedding <=> query_embedding) AS score,
+            row_number() OVER (ORDER BY embedding <=> query_embedding) AS rank
+        FROM public.document_chunks
+        WHERE
+            project_id = project_id_filter
+            AND embedding IS NOT NULL
+        ORDER BY embedding <=> query_embedding
+        LIMIT match_count * 2
+    ),
+    keyword_ranked AS (
+        SELECT
+            id,
+            ts_rank(content_tsvector, websearch_to_tsquery('english', query_text)) AS score,
+            row_number() OVER (
+                ORDER BY ts_rank(content_tsvector, websearch_to_tsquery('english', query_text)) DESC
+            ) AS rank
+        FROM public.document_chunks
+        WHERE
+            project_id = project_id_filter
+            AND content_tsvector @@ websearch_to_tsquery('english', query_text)
+        ORDER BY rank
+        LIMIT match_count * 2
+    ),
+    ngram_ranked AS (
+        SELECT
+            id,
+            row_number() OVER (ORDER BY word_similarity(query_text, content) DESC) AS rank
+        FROM public.document_chunks
+        WHERE
+            project_id = project_id_filter
+            AND query_text <% content
+        ORDER BY rank
+        LIMIT match_count * 2
+    ),
+    fused AS (
+        SELECT
+            COALESCE(v.id, k.id, n.id) AS id,
+            COALESCE(v.score, 0) AS v_score,
+            COALESCE(k.score, 0) AS k_score,
+            COALESCE(1.0 / (rrf_k + v.rank), 0)
+                + COALESCE(1.0 / (rrf_k + k.rank), 0)
+                + COALESCE(1.0 / (rrf_k + n.rank), 0) AS rrf_score
+        FROM vector_ranked v
+        FULL OUTER JOIN keyword_ranked k ON v.id = k.id
+        FULL OUTER JOIN ngram_ranked n ON COALESCE(v.id, k.id) = n.id
+    )
+    SELECT
+        c.id,
+        c.source_id,
+        c.content,
+        f.v_score,
+        f.k_score,
+        f.rrf_score::FLOAT,
+        c.metadata,
+        c.heading_hierarchy,
+        c.summary
+    FROM fused f
+    JOIN public.document_chunks c ON c.id = f.id
+    ORDER BY f.rrf_score DESC
+    LIMIT match_count;
+$$ LANGUAGE sql STABLE;
+
+COMMENT ON FUNCTION hybrid_search_rrf IS 'Vector + keyword + trigram search fused with Reciprocal Rank Fusion';
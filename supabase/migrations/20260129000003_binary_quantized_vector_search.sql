@@ -0,0 +1,249 @@
+-- =============================================================================
+-- Binary-quantized first stage for chunk vector search
+-- =============================================================================
+-- The FP32 HNSW index holds 6 KB per 1536-dim embedding, and every ANN
+-- probe pulls those pages through memory. The index is rebuilt over
+-- binary_quantize(embedding), one bit per dimension (192 bytes, 32x
+-- smaller), and searched by Hamming distance. Candidates from that scan
+-- are re-ordered by exact cosine distance on the full-precision column,
+-- so returned scores are unchanged and recall loss stays small.
+--
+-- nearest_chunks() holds the two-stage search; match_chunks, hybrid_search
+-- and hybrid_search_rrf all take their vector candidates from it.
+
+DROP INDEX IF EXISTS public.idx_document_chunks_embedding;
+CREATE INDEX IF NOT EXISTS idx_document_chunks_embedding_bq
+    ON public.document_chunks
+    USING hnsw ((binary_quantize(embedding)::bit(1536)) bit_hamming_ops)
+    WITH (m = 16, ef_construction = 64);
+
+-- An HNSW scan yields at most hnsw.ef_search rows (default 40), and the
+-- project filter is applied to those rows afterwards. ef_search is raised
+-- to the candidate count (pgvector caps it at 1000) for the duration of
+-- the call, so stage 1 actually returns candidate_count rows to rerank.
+-- The SET clause restores the caller's value when the function exits.
+CREATE OR REPLACE FUNCTION nearest_chunks(
+    query_embedding vector(1536),
+    project_id_filter UUID,
+    match_count INT DEFAULT 10,
+    candidate_count INT DEFAULT 200
+)
+RETURNS TABLE (
+    id UUID,
+    score FLOAT,
+    rank BIGINT
+) AS $$
+#variable_conflict use_column
+BEGIN
+    PERFORM set_config(
+        'hnsw.ef_search',
+        LEAST(GREATEST(candidate_count, match_count), 1000)::TEXT,
+        true
+    );
+
+    RETURN QUERY
+    WITH candidates AS (
+        -- Stage 1: Hamming scan over the quantized index
+        SELECT dc.id, dc.embedding
+        FROM public.document_chunks dc
+        WHERE
+            dc.project_id = project_id_filter
+            AND dc.embedding IS NOT NULL
+        ORDER BY binary_quantize(dc.embedding)::bit(1536) <~> binary_quantize(query_embedding)
+        LIMIT GREATEST(candidate_count, match_count)
+    )
+    -- Stage 2: exact cosine over the candidates only
+    SELECT
+        c.id,
+        1 - (c.embedding <=> query_embedding) AS score,
+        row_number() OVER (ORDER BY c.embedding <=> query_embedding) AS rank
+    FROM candidates c
+    ORDER BY c.embedding <=> query_embedding
+    LIMIT match_count;
+END;
+$$ LANGUAGE plpgsql
+SET hnsw.ef_search = 200;
+
+COMMENT ON FUNCTION nearest_chunks IS 'Two-stage ANN: binary-quantized Hamming scan, then exact cosine rerank';
+
+CREATE OR REPLACE FUNCTION match_chunks(
+    query_embedding vector(1536),
+    project_id_filter UUID,
+    match_threshold FLOAT DEFAULT 0.7,
+    match_count INT DEFAULT 10
+)
+RETURNS TABLE (
+    chunk_id UUID,
+    source_id UUID,
+    content TEXT,
+    vector_score FLOAT,
+    keyword_score FLOAT,
+    combined_score FLOAT,
+    metadata JSONB,
+    heading_hierarchy TEXT[],
+    summary TEXT
+) AS $$
+    SELECT
+        c.id,
+        c.source_id,
+        c.content,
+        n.score,
+        0::FLOAT,
+        n.score,
+        c.metadata,
+        c.heading_hierarchy,
+        c.summary
+    FROM nearest_chunks(query_embedding, project_id_filter, match_count) AS n
+    JOIN public.document_chunks c ON c.id = n.id
+    WHERE n.score >= match_threshold
+    ORDER BY n.score DESC;
+$$ LANGUAGE sql STABLE;
+
+CREATE OR REPLACE FUNCTION hybrid_search(
+    query_text TEXT,
+    query_embedding vector(1536),
+    project_id_filter UUID,
+    vector_weight FLOAT DEFAULT 0.6,
+    keyword_weight FLOAT DEFAULT 0.4,
+    match_threshold FLOAT DEFAULT 0.5,
+    match_count INT DEFAULT 10
+)
+RETURNS TABLE (
+    chunk_id UUID,
+    source_id UUID,
+    content TEXT,
+    vector_score FLOAT,
+    keyword_score FLOAT,
+    combined_score FLOAT,
+    metadata JSONB,
+    heading_hierarchy TEXT[],
+    summary TEXT
+) AS $$
+BEGIN
+    RETURN QUERY
+    WITH vector_results AS (
+        SELECT
+            c.id,
+            c.source_id,
+            c.content,
+            c.metadata,
+            c.heading_hierarchy,
+            c.summary,
+            n.score
+        FROM nearest_chunks(query_embedding, project_id_filter, match_count * 2) AS n
+        JOIN public.document_chunks c ON c.id = n.id
+    ),
+    keyword_results AS (
+        SELECT
+            dc.id,
+            dc.source_id,
+            dc.content,
+            dc.metadata,
+            dc.heading_hierarchy,
+            dc.summary,
+            ts_rank(dc.content_tsvector, to_tsquery('english', query_text)) AS score
+        FROM public.document_chunks dc
+        WHERE
+            dc.project_id = project_id_filter
+            AND dc.content_tsvector @@ to_tsquery('english', query_text)
+        ORDER BY score DESC
+        LIMIT match_count * 2
+    ),
+    combined AS (
+        SELECT
+            COALESCE(v.id, k.id) AS id,
+            COALESCE(v.source_id, k.source_id) AS source_id,
+            COALESCE(v.content, k.content) AS content,
+            COALESCE(v.metadata, k.metadata) AS metadata,
+            COALESCE(v.heading_hierarchy, k.heading_hierarchy) AS heading_hierarchy,
+            COALESCE(v.summary, k.summary) AS summary,
+            COALESCE(v.score, 0) AS v_score,
+            COALESCE(k.score, 0) AS k_score,
+            (COALESCE(v.score, 0) * vector_weight + COALESCE(k.score, 0) * keyword_weight) AS combined
+        FROM vector_results v
+        FULL OUTER JOIN keyword_results k ON v.id = k.id
+    )
+    SELECT
+        cb.id, cb.source_id, cb.content, cb.v_score, cb.k_score, cb.combined,
+        cb.metadata, cb.heading_hierarchy, cb.summary
+    FROM combined cb
+    WHERE cb.combined > match_threshold
+    ORDER BY cb.combined DESC
+    LIMIT match_count;
+END;
+$$ LANGUAGE plpgsql;
+
+CREATE OR REPLACE FUNCTION hybrid_search_rrf(
+    query_text TEXT,
+    query_embedding vector(1536),
+    project_id_filter UUID,
+    match_count INT DEFAULT 10,
+    rrf_k INT DEFAULT 60
+)
+RETURNS TABLE (
+    chunk_id UUID,
+    source_id UUID,
+    content TEXT,
+    vector_score FLOAT,
+    keyword_score FLOAT,
+    combined_score FLOAT,
+    metadata JSONB,
+    heading_hierarchy TEXT[],
+    summary TEXT
+) AS $$
+    WITH vector_ranked AS (
+        SELECT id, score, rank
+        FROM nearest_chunks(query_embedding, project_id_filter, match_count * 2)
+    ),
+    keyword_ranked AS (
+        SELECT
+            id,
+            ts_rank(content_tsvector, websearch_to_tsquery('english', query_text)) AS score,
+            row_number() OVER (
+                ORDER BY ts_rank(content_tsvector, websearch_to_tsquery('english', query_text)) DESC
+            ) AS rank
+        FROM public.document_chunks
+        WHERE
+            project_id = project_id_filter
+            AND content_tsvector @@ websearch_to_tsquery('english', query_text)
+        ORDER BY rank
+        LIMIT match_count * 2
+    ),
+    ngram_ranked AS (
+        SELECT
+            id,
+            row_number() OVER (ORDER BY word_similarity(query_text, content) DESC) AS rank
+        FROM public.document_chunks
+        WHERE
+            project_id = project_id_filter
+            AND query_text <% content
+        ORDER BY rank
+        LIMIT match_count * 2
+    ),
+    fused AS (
+        SELECT
+            COALESCE(v.id, k.id, n.id) AS id,
+            COALESCE(v.score, 0) AS v_score,
+            COALESCE(k.score, 0) AS k_score,
+            COALESCE(1.0 / (rrf_k + v.rank), 0)
+                + COALESCE(1.0 / (rrf_k + k.rank), 0)
+                + COALESCE(1.0 / (rrf_k + n.rank), 0) AS rrf_score
+        FROM vector_ranked v
+        FULL OUTER JOIN keyword_ranked k ON v.id = k.id
+        FULL OUTER JOIN ngram_ranked n ON COALESCE(v.id, k.id) = n.id
+    )
+    SELECT
+        c.id,
+        c.source_id,
+        c.content,
+        f.v_score,
+        f.k_score,
+        f.rrf_score::FLOAT,
+        c.metadata,
+        c.heading_hierarchy,
+        c.summary
+    FROM fused f
+    JOIN public.document_chunks c ON c.id = f.id
+    ORDER BY f.rrf_score DESC
+    LIMIT match_count;
+$$ LANGUAGE sql STABLE;
@@ -0,0 +1,41 @@
+-- =============================================================================
+-- Server-side status timestamps
+-- =============================================================================
+-- Status updates from the backend used to carry Python-formatted
+-- updated_at / processed_at / completed_at strings on every call. The
+-- updated_at columns already have BEFORE UPDATE triggers and DEFAULT NOW(),
+-- so the client values were redundant; the completion timestamps move into
+-- triggers here, stamped when the status transitions.
+
+CREATE OR REPLACE FUNCTION set_document_source_processed_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.status = 'completed' AND NEW.status IS DISTINCT FROM OLD.status THEN
+        NEW.processed_at := NOW();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS set_document_sources_processed_at ON public.document_sources;
+CREATE TRIGGER set_document_sources_processed_at
+    BEFORE UPDATE ON public.document_sources
+    FOR EACH ROW
+    EXECUTE FUNCTION set_document_source_processed_at();
+
+CREATE OR REPLACE FUNCTION set_agent_run_completed_at()
+RETURNS TRIGGER AS $$
+BEGIN
+    IF NEW.status IN ('completed', 'failed', 'escalated_to_human')
+        AND NEW.status IS DISTINCT FROM OLD.status THEN
+        NEW.completed_at := NOW();
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS set_agent_runs_completed_at ON public.agent_runs;
+CREATE TRIGGER set_agent_runs_completed_at
+    BEFORE UPDATE ON public.agent_runs
+    FOR EACH ROW
+    EXECUTE FUNCTION set_agent_run_completed_at();
@@ -0,0 +1,59 @@
+-- =============================================================================
+-- Half-precision storage for domain memory embeddings
+-- =============================================================================
+-- domain_memories.embedding was vector(1536): 6 KB of float4 per row, all
+-- of which an index probe or a similarity scan pulls through memory.
+-- halfvec(1536) stores float2 (3 KB), which halves table, index and
+-- bandwidth cost. Cosine similarity between embeddings survives fp16
+-- rounding to about three decimal places, well inside match thresholds.
+--
+-- The IVFFlat index is replaced by HNSW over halfvec_cosine_ops.
+-- find_similar_memories keeps its vector(1536) parameter so callers don't
+-- change, and casts the query once to compare in halfvec.
+
+DROP INDEX IF EXISTS public.idx_domain_memories_embedding;
+
+ALTER TABLE public.domain_memories
+    ALTER COLUMN embedding TYPE halfvec(1536) USING embedding::halfvec(1536);
+
+CREATE INDEX IF NOT EXISTS idx_domain_memories_embedding_hnsw
+    ON public.domain_memories
+    USING hnsw (embedding halfvec_cosine_ops)
+    WITH (m = 16, ef_construction = 64);
+
+CREATE OR REPLACE FUNCTION find_similar_memories(
+    query_embedding vector(1536),
+    match_threshold FLOAT DEFAULT 0.7,
+    match_count INT DEFAULT 10,
+    filter_domain TEXT DEFAULT NULL,
+    filter_user_id UUID DEFAULT NULL
+)
+RETURNS TABLE (
+    id UUID,
+    domain TEXT,
+    category TEXT,
+    key TEXT,
+    value JSONB,
+    similarity FLOAT
+) AS $$
+DECLARE
+    query_half halfvec(1536) := query_embedding::halfvec(1536);
+BEGIN
+    RETURN QUERY
+    SELECT
+        dm.id,
+        dm.domain,
+        dm.category,
+        dm.key,
+        dm.value,
+        1 - (dm.embedding <=> query_half) AS similarity
+    FROM public.domain_memories dm
+    WHERE
+        (filter_domain IS NULL OR dm.domain = filter_domain)
+        AND (filter_user_id IS NULL OR dm.user_id = filter_user_id)
+        AND dm.embedding IS NOT NULL
+        AND 1 - (dm.embedding <=> query_half) > match_threshold
+    ORDER BY dm.embedding <=> query_half
+    LIMIT match_count;
+END;
+$$ LANGUAGE plpgsql;
@@ -0,0 +1,23 @@
+-- =============================================================================
+-- Indexes for the agent run list queries
+-- =============================================================================
+-- get_active_agent_runs filters on user_id and the four non-terminal
+-- statuses, newest first. Completed and failed runs dominate the table, so
+-- the partial index below only holds the rows that query can return; it
+-- stays small and cache-resident, and its order serves the ORDER BY
+-- without a sort. The store binds the status list as a parameter on an
+-- unnamed statement, so each call is planned with the actual values and
+-- the planner can match them against the index predicate.
+
+CREATE INDEX IF NOT EXISTS idx_agent_runs_active
+    ON public.agent_runs (user_id, started_at DESC)
+    WHERE status IN (
+        'pending', 'in_progress', 'awaiting_verification', 'verification_in_progress'
+    );
+
+-- get_task_agent_runs: per-task history, newest first. Supersedes the
+-- single-column task_id index (still usable for the tasks FK cascade).
+CREATE INDEX IF NOT EXISTS idx_agent_runs_task_started
+    ON public.agent_runs (task_id, started_at DESC);
+
+DROP INDEX IF EXISTS public.idx_agent_runs_task_id;
@@ -0,0 +1,24 @@
+-- =============================================================================
+-- Clamp agent run progress server-side
+-- =============================================================================
+-- update_agent_run clamped progress_percent into 0-100 in Python before every
+-- write. The column already has a CHECK for that range; this BEFORE trigger
+-- coerces out-of-range values into it instead, so callers can send the raw
+-- number and the row still satisfies the constraint.
+
+CREATE OR REPLACE FUNCTION clamp_agent_run_progress()
+RETURNS TRIGGER AS $$
+BEGIN
+    -- LEAST/GREATEST skip NULLs, so leave a NULL progress alone
+    IF NEW.progress_percent IS NOT NULL THEN
+        NEW.progress_percent := GREATEST(0, LEAST(100, NEW.progress_percent));
+    END IF;
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql;
+
+DROP TRIGGER IF EXISTS clamp_agent_runs_progress ON public.agent_runs;
+CREATE TRIGGER clamp_agent_runs_progress
+    BEFORE INSERT OR UPDATE OF progress_percent ON public.agent_runs
+    FOR EACH ROW
+    EXECUTE FUNCTION clamp_agent_run_progress();